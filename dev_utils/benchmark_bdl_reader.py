@@ -0,0 +1,32 @@
+import time
+from pathlib import Path
+
+from rpd_generator.doe2_file_readers.model_input_reader import ModelInputReader
+
+
+def benchmark_bdl_reader(repeat: int = 20):
+    """
+    Print the number of BDL lines read per second by ModelInputReader for each full RPD test case.
+    :param repeat: (int) number of times each file is read; the fastest time is reported
+    """
+    test_directory = Path(__file__).parents[1] / "test" / "full_rpd_test"
+    bdl_input_reader = ModelInputReader()
+
+    for bdl_file in sorted(test_directory.rglob("*.BDL")):
+        with open(bdl_file, "r") as f:
+            num_lines = sum(1 for _ in f)
+
+        best_time = float("inf")
+        for _ in range(repeat):
+            start_time = time.perf_counter()
+            bdl_input_reader.read_input_bdl_file(str(bdl_file))
+            best_time = min(best_time, time.perf_counter() - start_time)
+
+        print(
+            f"{bdl_file.parent.name}: {num_lines} lines in {best_time * 1000:.1f} ms "
+            f"({num_lines / best_time:,.0f} lines/s)"
+        )
+
+
+if __name__ == "__main__":
+    benchmark_bdl_reader()
@@ -0,0 +1,58 @@
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+from rpd_generator.config import Config
+from rpd_generator.schema import schema_enums
+
+MODULES = ["rpd_generator.config", "rpd_generator.main"]
+
+
+def get_import_time(module: str, repeat: int = 5) -> float:
+    """
+    Get the cumulative import time of a module reported by python -X importtime in a new interpreter.
+    :param module: (str) name of the module to import
+    :param repeat: (int) number of interpreters started; the fastest time is reported
+    :return: (float) import time in seconds
+    """
+    best_time = float("inf")
+    for _ in range(repeat):
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+            cwd=Path(__file__).parents[1],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        for line in result.stderr.splitlines():
+            fields = line.split("|")
+            if len(fields) == 3 and fields[2].strip() == module:
+                best_time = min(best_time, int(fields[1]) / 1e6)
+    return best_time
+
+
+def benchmark_import_time(repeat: int = 5):
+    """
+    Print the import time of the modules a run of the RPD generator starts with and the time taken to load the
+    schema enumerations from the prebuilt cache and by scanning the schema files.
+    :param repeat: (int) number of times each measurement is taken; the fastest time is reported
+    """
+    for module in MODULES:
+        print(f"import {module}: {get_import_time(module, repeat) * 1000:.1f} ms")
+
+    ruleset = Config.ACTIVE_RULESET
+    for name, load in [
+        ("cached", schema_enums.load_schema_enum_lists),
+        ("scanned", schema_enums.scan_schema_enum_lists),
+    ]:
+        best_time = float("inf")
+        for _ in range(repeat):
+            start_time = time.perf_counter()
+            load(ruleset)
+            best_time = min(best_time, time.perf_counter() - start_time)
+        print(f"Schema enumerations {name}: {best_time * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    benchmark_import_time()
@@ -0,0 +1,84 @@
+import json
+import time
+from pathlib import Path
+
+from jsonpath2 import match
+
+from rpd_generator.utilities import jsonpath_utils
+
+RMD_PATH = "$.ruleset_model_descriptions[*]"
+ZONES_PATH = f"{RMD_PATH}.buildings[*].building_segments[*].zones[*]"
+HVAC_PATH = f"{RMD_PATH}.buildings[*].building_segments[*].heating_ventilating_air_conditioning_systems[*]"
+
+# Lookups of the kind made by the id reference checks and the full RPD test comparisons
+SIMPLE_JSONPATHS = [
+    f"{RMD_PATH}.fluid_loops[*].id",
+    f"{RMD_PATH}.fluid_loops[*].child_loops[*].id",
+    f"{RMD_PATH}.chillers[*].cooling_loop",
+    f"{RMD_PATH}.boilers[*].loop",
+    f"{RMD_PATH}.pumps[*].loop_or_piping",
+    f"{RMD_PATH}.schedules[*].id",
+    f"{ZONES_PATH}.id",
+    f"{ZONES_PATH}.surfaces[*].id",
+    f"{ZONES_PATH}.surfaces[*].construction.u_factor",
+    f"{ZONES_PATH}.spaces[*].interior_lighting[*].lighting_multiplier_schedule",
+    f"{ZONES_PATH}.terminals[*].served_by_heating_ventilating_air_conditioning_system",
+    f"{HVAC_PATH}.fan_system.supply_fans[*].design_airflow",
+    "$.ruleset_model_descriptions[0].buildings[0].building_segments[0].zones[*].infiltration.algorithm_name",
+]
+FILTER_JSONPATHS = [
+    f'{ZONES_PATH}.surfaces[*][?(@.adjacent_to="EXTERIOR")].id',
+    f'{RMD_PATH}.fluid_loops[*][?(@.type="HEATING")].id',
+]
+
+
+def find_all_without_cache(jpath, obj):
+    # find_all() as it was before compiled paths were cached: jsonpath2 parses the path on every call
+    return [m.current_value for m in match(jsonpath_utils.ensure_root(jpath), obj) if m]
+
+
+def benchmark_jsonpath(repeat: int = 20):
+    """
+    Print the time taken to look up a set of JSONPaths in the E-1 correct answer RPD with jsonpath2 parsing every
+    path on every call and with find_all(), which reuses compiled paths and follows simple paths without jsonpath2.
+    :param repeat: (int) number of times each set of lookups is timed; the fastest time is reported
+    """
+    rpd_file = (
+        Path(__file__).parents[1]
+        / "test"
+        / "full_rpd_test"
+        / "Correct Answer RPDs"
+        / "E-1.json"
+    )
+    with open(rpd_file, "r") as f:
+        rpd = json.load(f)
+
+    for name, jsonpaths in [
+        ("Simple paths", SIMPLE_JSONPATHS),
+        ("Filter paths", FILTER_JSONPATHS),
+    ]:
+        for jsonpath in jsonpaths:
+            assert jsonpath_utils.find_all(jsonpath, rpd) == find_all_without_cache(
+                jsonpath, rpd
+            )
+
+        baseline_time = time_lookups(find_all_without_cache, jsonpaths, rpd, repeat)
+        cached_time = time_lookups(jsonpath_utils.find_all, jsonpaths, rpd, repeat)
+        print(
+            f"{name} ({len(jsonpaths)}): jsonpath2 {baseline_time * 1000:.2f} ms, "
+            f"find_all {cached_time * 1000:.2f} ms ({baseline_time / cached_time:.0f}x)"
+        )
+
+
+def time_lookups(find_all, jsonpaths: list, rpd: dict, repeat: int) -> float:
+    best_time = float("inf")
+    for _ in range(repeat):
+        start_time = time.perf_counter()
+        for jsonpath in jsonpaths:
+            find_all(jsonpath, rpd)
+        best_time = min(best_time, time.perf_counter() - start_time)
+    return best_time
+
+
+if __name__ == "__main__":
+    benchmark_jsonpath()
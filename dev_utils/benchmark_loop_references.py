@@ -0,0 +1,234 @@
+import tempfile
+import time
+from pathlib import Path
+
+from rpd_generator import main as rpd_generator
+from rpd_generator.artifacts.ruleset_project_description import (
+    RulesetProjectDescription,
+)
+from rpd_generator.bdl_structure.bdl_commands.boiler import Boiler
+from rpd_generator.bdl_structure.bdl_commands.circulation_loop import CirculationLoop
+from rpd_generator.doe2_file_readers.model_input_reader import ModelInputReader
+
+NUM_ZONES = 2000
+ZONES_PER_SYSTEM = 10
+NUM_LOOPS_PER_TYPE = 10
+NUM_BOILERS = 10
+NUM_CHILLERS = 10
+
+# Name lists of the RMD that hold the objects of each command that can reference a loop
+COMMAND_NAME_LISTS = {
+    "CIRCULATION-LOOP": "circulation_loop_names",
+    "SYSTEM": "system_names",
+    "ZONE": "zone_names",
+    "CHILLER": "chiller_names",
+    "BOILER": "boiler_names",
+    "HEAT-REJECTION": "heat_rejection_names",
+    "GROUND-LOOP-HX": "ground_loop_hx_names",
+    "EQUIP-CTRL": "equip_ctrl_names",
+}
+
+
+def command_line(unique_name, command):
+    return f'     *   1 * "{unique_name}" = {command}\n'
+
+
+def data_for_line(unique_name):
+    return f"-NOTE- - -         DATA FOR     {unique_name}\n"
+
+
+def definition_line(keyword, value):
+    return f"-INPUT - -{' ' * 46}{keyword:<17}= {value:>28}\n"
+
+
+def write_synthetic_bdl(bdl_file: str):
+    """
+    Write a BDL file with NUM_ZONES zones served by hot water, chilled water and condenser water loops. Only the
+    keywords that attach objects to loops are defined.
+    :param bdl_file: (str) path of the BDL file to write
+    """
+    commands = []
+
+    def add_command(unique_name, command, keyword_values):
+        commands.append((unique_name, command, keyword_values))
+
+    for i in range(NUM_LOOPS_PER_TYPE):
+        add_command(f"HW Loop {i}", "CIRCULATION-LOOP", {"TYPE": "HW"})
+        add_command(f"CHW Loop {i}", "CIRCULATION-LOOP", {"TYPE": "CHW"})
+        add_command(f"CW Loop {i}", "CIRCULATION-LOOP", {"TYPE": "CW"})
+        add_command(
+            f"CHW Secondary Loop {i}",
+            "CIRCULATION-LOOP",
+            {
+                "TYPE": "CHW",
+                "SUBTYPE": "SECONDARY",
+                "PRIMARY-LOOP": f"CHW Loop {i}",
+                "VALVE-TYPE-2ND": "TWO-WAY" if i % 2 else "THREE-WAY",
+            },
+        )
+    for i in range(NUM_BOILERS):
+        add_command(
+            f"Boiler {i}",
+            "BOILER",
+            {
+                "HW-LOOP": f"HW Loop {i % NUM_LOOPS_PER_TYPE}",
+                "HW-FLOW-CTRL": "CONSTANT-FLOW",
+            },
+        )
+    for i in range(NUM_CHILLERS):
+        add_command(
+            f"Chiller {i}",
+            "CHILLER",
+            {
+                "CHW-LOOP": f"CHW Loop {i % NUM_LOOPS_PER_TYPE}",
+                "CW-LOOP": f"CW Loop {i % NUM_LOOPS_PER_TYPE}",
+                "CHW-FLOW-CTRL": "CONSTANT-FLOW",
+                "CW-FLOW-CTRL": "CONSTANT-FLOW",
+            },
+        )
+    add_command("Floor 1", "FLOOR", {})
+    for i in range(NUM_ZONES):
+        add_command(f"Space {i}", "SPACE", {})
+    for i in range(NUM_ZONES):
+        if i % ZONES_PER_SYSTEM == 0:
+            system = i // ZONES_PER_SYSTEM
+            add_command(
+                f"System {system}",
+                "SYSTEM",
+                {
+                    "HW-LOOP": f"HW Loop {system % NUM_LOOPS_PER_TYPE}",
+                    "CHW-LOOP": f"CHW Loop {system % NUM_LOOPS_PER_TYPE}",
+                    "HW-VALVE-TYPE": "THREE-WAY",
+                    "CHW-VALVE-TYPE": "THREE-WAY",
+                },
+            )
+        loop = i % NUM_LOOPS_PER_TYPE
+        add_command(
+            f"Zone {i}",
+            "ZONE",
+            {
+                "SPACE": f"Space {i}",
+                "HW-LOOP": f"HW Loop {loop}",
+                "CW-LOOP": f"CW Loop {loop}",
+                # Only the last zone of each hot water loop has a variable flow valve
+                "HW-VALVE-TYPE": (
+                    "VARIABLE-FLOW"
+                    if i >= NUM_ZONES - NUM_LOOPS_PER_TYPE
+                    else "CONSTANT-FLOW"
+                ),
+                "CW-VALVE": "NO",
+            },
+        )
+    for i in range(NUM_LOOPS_PER_TYPE):
+        add_command(
+            f"Equip Ctrl {i}", "EQUIP-CTRL", {"CIRCULATION-LOOP": f"HW Loop {i}"}
+        )
+
+    lines = [command_line(unique_name, command) for unique_name, command, _ in commands]
+    for unique_name, _, keyword_values in commands:
+        lines.append(data_for_line(unique_name))
+        lines.extend(
+            definition_line(keyword, value) for keyword, value in keyword_values.items()
+        )
+    with open(bdl_file, "w") as f:
+        f.writelines(lines)
+
+
+def determine_loop_flow_control_by_scan(loop: CirculationLoop):
+    # determine_loop_flow_control() as it was before loop references were indexed: every object that can reference a
+    # loop is scanned for every loop
+    valve_checks = [
+        (
+            "CIRCULATION-LOOP",
+            "PRIMARY-LOOP",
+            "VALVE-TYPE-2ND",
+            "TWO-WAY",
+        )
+    ]
+    valve_checks.extend(
+        loop.loop_valve_checks.get(loop.keyword_value_pairs.get("TYPE"), [])
+    )
+    for bdl_command, loop_keyword, valve_keyword, variable_valve in valve_checks:
+        for obj_name in getattr(loop.rmd, COMMAND_NAME_LISTS[bdl_command]):
+            obj = loop.rmd.bdl_obj_instances.get(obj_name)
+            if (
+                obj.keyword_value_pairs.get(loop_keyword) == loop.u_name
+                and obj.keyword_value_pairs.get(valve_keyword) == variable_valve
+            ):
+                return "VARIABLE_FLOW"
+    return "FIXED_FLOW"
+
+
+def get_loop_equip_ctrls_by_scan(boiler: Boiler):
+    # The equipment controls of a boiler's loop, found as populate_operation_limits() did before loop references
+    # were indexed
+    return [
+        equip_ctrl_name
+        for equip_ctrl_name in boiler.rmd.equip_ctrl_names
+        if boiler.rmd.bdl_obj_instances.get(equip_ctrl_name).keyword_value_pairs.get(
+            "CIRCULATION-LOOP"
+        )
+        == boiler.keyword_value_pairs.get("HW-LOOP")
+    ]
+
+
+def benchmark_loop_references(repeat: int = 5):
+    """
+    Print the time taken to find the flow control of every circulation loop, and the equipment controls of every
+    boiler's loop, in a synthetic model with NUM_ZONES zones, by scanning every object and by querying the loop
+    references of the RMD. The time to index the loop references is included.
+    :param repeat: (int) number of times the lookups are timed; the fastest time is reported
+    """
+    with tempfile.TemporaryDirectory() as temp_dir:
+        bdl_file = str(Path(temp_dir) / "Synthetic.BDL")
+        write_synthetic_bdl(bdl_file)
+        bdl_input_reader = ModelInputReader()
+        RulesetProjectDescription.bdl_command_dict = bdl_input_reader.bdl_command_dict
+        rmd = rpd_generator.generate_rmds(bdl_input_reader, [bdl_file])[0]
+
+    loops = [
+        rmd.bdl_obj_instances[loop_name] for loop_name in rmd.circulation_loop_names
+    ]
+    boilers = [rmd.bdl_obj_instances[boiler_name] for boiler_name in rmd.boiler_names]
+    print(
+        f"{len(rmd.zone_names)} zones, {len(rmd.system_names)} systems, {len(loops)} loops, "
+        f"{len(boilers)} boilers"
+    )
+
+    def scan():
+        return [determine_loop_flow_control_by_scan(loop) for loop in loops], [
+            get_loop_equip_ctrls_by_scan(boiler) for boiler in boilers
+        ]
+
+    def query():
+        rmd.loop_references = None
+        return [loop.determine_loop_flow_control() for loop in loops], [
+            rmd.get_loop_references(
+                boiler.keyword_value_pairs.get("HW-LOOP"),
+                "EQUIP-CTRL",
+                "CIRCULATION-LOOP",
+            )
+            for boiler in boilers
+        ]
+
+    assert scan() == query()
+
+    scan_time = time_lookups(scan, repeat)
+    query_time = time_lookups(query, repeat)
+    print(
+        f"Scan {scan_time * 1000:.1f} ms, loop references {query_time * 1000:.1f} ms "
+        f"({scan_time / query_time:.0f}x)"
+    )
+
+
+def time_lookups(lookups, repeat: int) -> float:
+    best_time = float("inf")
+    for _ in range(repeat):
+        start_time = time.perf_counter()
+        lookups()
+        best_time = min(best_time, time.perf_counter() - start_time)
+    return best_time
+
+
+if __name__ == "__main__":
+    benchmark_loop_references()
@@ -0,0 +1,115 @@
+import os
+import sys
+import time
+from pathlib import Path
+
+from rpd_generator import main as rpd_generator
+from rpd_generator.artifacts.ruleset_project_description import (
+    RulesetProjectDescription,
+)
+from rpd_generator.config import Config
+from rpd_generator.doe2_file_readers import model_output_reader, result_recording
+from rpd_generator.doe2_file_readers.model_input_reader import ModelInputReader
+from rpd_generator.utilities import validate_configuration
+
+# Run from the repository root with python -m, so that test is this repository's test package
+from test.result_reader_helpers import CONSTANT_RESULT_READER
+
+TEST_CASES = ["E-1", "E-2"]
+THREAD_COUNTS = [1, 2, 4, 8]
+# Time added to each replayed result request, standing in for the D2Result.dll reading the simulation output files
+REPLAY_LATENCY_SECONDS = 0.002
+TEST_DIRECTORY = Path(__file__).parents[1] / "test" / "full_rpd_test"
+
+
+class LatencyResultReader:
+    """Result reader that waits before passing each request through, as a blocking D2Result.dll call would"""
+
+    def __init__(self, result_reader):
+        self.result_reader = result_reader
+        self.nhr_dict = result_reader.nhr_dict
+
+    def get_multiple_results(self, project_fname, request_array):
+        time.sleep(REPLAY_LATENCY_SECONDS)
+        return self.result_reader.get_multiple_results(project_fname, request_array)
+
+    def get_string_result(self, project_fname, entry_id, report_key="", row_key=""):
+        time.sleep(REPLAY_LATENCY_SECONDS)
+        return self.result_reader.get_string_result(
+            project_fname, entry_id, report_key, row_key
+        )
+
+
+def set_benchmark_result_reader(recording_paths: list):
+    """
+    Use the D2Result.dll on Windows with eQUEST installed. Elsewhere, replay the recordings, or return constant
+    results when there are none, with REPLAY_LATENCY_SECONDS added to every request.
+    :param recording_paths: (list) paths of recording files of the full RPD test cases, recorded with
+    generate_test_rpds_from_bdls.py --record
+    :return: (str) description of the result reader
+    """
+    if os.name == "nt":
+        validate_configuration.find_equest_installation()
+        if Config.EQUEST_INSTALL_PATH:
+            model_output_reader.set_result_reader_factory(None)
+            return "D2Result.dll"
+
+    if recording_paths:
+        result_recording.start_replay(recording_paths, TEST_DIRECTORY)
+        factory = model_output_reader.get_result_reader_factory()
+        description = "replayed recordings"
+    else:
+        factory = CONSTANT_RESULT_READER
+        description = "constant results"
+    model_output_reader.set_result_reader_factory(
+        lambda d2_result_dll, doe2_data_dir: LatencyResultReader(
+            factory(d2_result_dll, doe2_data_dir)
+        )
+    )
+    return f"{description} with {REPLAY_LATENCY_SECONDS * 1000:.0f} ms per request"
+
+
+def time_populate(bdl_file: str) -> tuple:
+    """
+    Time populate_rmd() for a BDL file, which includes fetching its simulation output.
+    :param bdl_file: (str) path to the BDL file
+    :return: (tuple) populate time in seconds (float) and output fetch times of the RMD (dict)
+    """
+    bdl_input_reader = ModelInputReader()
+    RulesetProjectDescription.bdl_command_dict = bdl_input_reader.bdl_command_dict
+    rmd = rpd_generator.generate_rmds(bdl_input_reader, [bdl_file])[0]
+    start_time = time.perf_counter()
+    rpd_generator.populate_rmd(rmd, RulesetProjectDescription())
+    return time.perf_counter() - start_time, rmd.output_fetch_times
+
+
+def benchmark_output_fetch(recording_paths: list = None, repeat: int = 3):
+    """
+    Print the time taken to populate each full RPD test case with each number of output fetch threads, with the
+    number of result requests made, the time spent in them, and the time objects spent waiting for their results.
+    :param recording_paths: (list) paths of recording files to replay when the D2Result.dll is not available
+    :param repeat: (int) number of times each test case is populated; the fastest time is reported
+    """
+    print(f"Results from {set_benchmark_result_reader(recording_paths)}")
+    default_threads = Config.OUTPUT_FETCH_THREADS
+    try:
+        for test_case in TEST_CASES:
+            bdl_file = str(next((TEST_DIRECTORY / test_case).glob("*.BDL")))
+            for threads in THREAD_COUNTS:
+                Config.OUTPUT_FETCH_THREADS = threads
+                best_time, fetch_times = min(
+                    (time_populate(bdl_file) for _ in range(repeat)),
+                    key=lambda timing: timing[0],
+                )
+                print(
+                    f"{test_case}, {threads} threads: populated in {best_time * 1000:.1f} ms, "
+                    f"{fetch_times['calls']} requests taking {fetch_times['call_seconds'] * 1000:.1f} ms, "
+                    f"{fetch_times['wait_seconds'] * 1000:.1f} ms waiting for results"
+                )
+    finally:
+        Config.OUTPUT_FETCH_THREADS = default_threads
+        model_output_reader.set_result_reader_factory(None)
+
+
+if __name__ == "__main__":
+    benchmark_output_fetch(sys.argv[1:])
@@ -0,0 +1,54 @@
+import time
+import tracemalloc
+from pathlib import Path
+
+from rpd_generator import main as rpd_generator
+from rpd_generator.artifacts.ruleset_project_description import (
+    RulesetProjectDescription,
+)
+from rpd_generator.bdl_structure.bdl_commands.project import Holidays, RunPeriod
+from rpd_generator.bdl_structure.bdl_commands.schedule import (
+    DaySchedulePD,
+    Schedule,
+    WeekSchedulePD,
+)
+from rpd_generator.doe2_file_readers.model_input_reader import ModelInputReader
+
+SCHEDULE_CLASSES = (RunPeriod, Holidays, DaySchedulePD, WeekSchedulePD, Schedule)
+
+
+def benchmark_schedule_memory():
+    """
+    Print the memory allocated while populating the schedules of each full RPD test case. Only the calendar and
+    schedule objects are populated, so no simulation output is needed.
+    """
+    test_directory = Path(__file__).parents[1] / "test" / "full_rpd_test"
+    bdl_input_reader = ModelInputReader()
+    RulesetProjectDescription.bdl_command_dict = bdl_input_reader.bdl_command_dict
+
+    for bdl_file in sorted(test_directory.rglob("*.BDL")):
+        rmd = rpd_generator.generate_rmds(bdl_input_reader, [str(bdl_file)])[0]
+        rmd.bdl_obj_instances["ASHRAE 229"] = RulesetProjectDescription()
+        schedule_objects = [
+            obj
+            for obj in rmd.bdl_obj_instances.values()
+            if isinstance(obj, SCHEDULE_CLASSES)
+        ]
+
+        tracemalloc.start()
+        start_time = time.perf_counter()
+        for obj in schedule_objects:
+            obj.populate_data_elements()
+        elapsed_time = time.perf_counter() - start_time
+        allocated, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        num_schedules = sum(isinstance(obj, Schedule) for obj in schedule_objects)
+        print(
+            f"{bdl_file.parent.name}: {num_schedules} schedules, {allocated / 1024:,.0f} KiB retained, "
+            f"{peak / 1024:,.0f} KiB peak, {elapsed_time * 1000:.1f} ms"
+        )
+
+
+if __name__ == "__main__":
+    benchmark_schedule_memory()
@@ -0,0 +1,68 @@
+import copy
+import time
+from pathlib import Path
+
+from rpd_generator import main as rpd_generator
+from rpd_generator.artifacts.ruleset_project_description import (
+    RulesetProjectDescription,
+)
+from rpd_generator.doe2_file_readers import model_output_reader
+from rpd_generator.doe2_file_readers.model_input_reader import ModelInputReader
+from rpd_generator.utilities import ensure_valid_rpd, unit_converter
+
+# Run from the repository root with python -m, so that test is this repository's test package
+from test.result_reader_helpers import CONSTANT_RESULT_READER
+
+TEST_CASES = ["E-1", "E-2"]
+
+
+def generate_unconverted_rpd(bdl_file: str) -> dict:
+    """
+    Generate the RPD of a BDL file as write_rpd_json_from_bdl() does, up to the unit conversion.
+    :param bdl_file: (str) path to the BDL file
+    :return: (dict) RPD data structure with values in eQUEST units
+    """
+    rpd = RulesetProjectDescription()
+    bdl_input_reader = ModelInputReader()
+    RulesetProjectDescription.bdl_command_dict = bdl_input_reader.bdl_command_dict
+    for rmd in rpd_generator.generate_rmds(bdl_input_reader, [bdl_file]):
+        rpd_generator.populate_rmd(rmd, rpd)
+    rpd.populate_data_group()
+    ensure_valid_rpd.make_ids_unique(rpd.rpd_data_structure)
+    return rpd.rpd_data_structure
+
+
+def benchmark_unit_conversion(repeat: int = 10):
+    """
+    Print the time taken by convert_to_schema_units() for the RPDs generated from the full RPD test cases. Simulation
+    output is replaced by a constant value, which does not change the work done to convert it.
+    :param repeat: (int) number of times each RPD is converted; the fastest time is reported
+    """
+    model_output_reader.set_result_reader_factory(CONSTANT_RESULT_READER)
+    test_directory = Path(__file__).parents[1] / "test" / "full_rpd_test"
+    rpds = {
+        test_case: generate_unconverted_rpd(
+            str(next((test_directory / test_case).glob("*.BDL")))
+        )
+        for test_case in TEST_CASES
+    }
+    model_output_reader.set_result_reader_factory(None)
+
+    start_time = time.perf_counter()
+    unit_converter.get_conversion_plan()
+    print(
+        f"Conversion plan compiled in {(time.perf_counter() - start_time) * 1000:.1f} ms"
+    )
+
+    for test_case, rpd in rpds.items():
+        best_time = float("inf")
+        for _ in range(repeat):
+            rpd_copy = copy.deepcopy(rpd)
+            start_time = time.perf_counter()
+            unit_converter.convert_to_schema_units(rpd_copy)
+            best_time = min(best_time, time.perf_counter() - start_time)
+        print(f"{test_case}: {best_time * 1000:.2f} ms")
+
+
+if __name__ == "__main__":
+    benchmark_unit_conversion()
@@ -0,0 +1,27 @@
+from rpd_generator.config import Config
+from rpd_generator.schema import schema_enums
+from rpd_generator.schema.ruleset import Ruleset
+
+
+def build_schema_enums_cache():
+    """
+    Rebuild the prebuilt enumeration cache of every ruleset in Config.RULESETS from the schema files. Run this after
+    changing a schema file and commit the cache files with the schema change.
+    """
+    for ruleset_name, ruleset_files in Config.RULESETS.items():
+        ruleset = Ruleset(
+            name=ruleset_name,
+            enum_filename=ruleset_files["enum_filename"],
+            output_filename=ruleset_files["output_filename"],
+        )
+        cache_path = schema_enums.get_schema_enums_cache_path(ruleset)
+        schema_enums.write_schema_enums_cache(
+            cache_path,
+            schema_enums.get_schema_hashes(ruleset),
+            schema_enums.scan_schema_enum_lists(ruleset),
+        )
+        print(f"{ruleset_name}: wrote {cache_path}")
+
+
+if __name__ == "__main__":
+    build_schema_enums_cache()
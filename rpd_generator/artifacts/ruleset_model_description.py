@@ -1,4 +1,5 @@
 import copy
+import threading
 
 from rpd_generator.bdl_structure.bdl_enumerations.bdl_enums import BDLEnums
 from rpd_generator.schema.schema_enums import SchemaEnums
@@ -10,6 +11,15 @@ BDL_ElecGeneratorKeywords = BDLEnums.bdl_enums["ElecGeneratorKeywords"]
 BDL_ElecGeneratorTypes = BDLEnums.bdl_enums["ElecGeneratorTypes"]
 BDL_UtilityRateKeywords = BDLEnums.bdl_enums["UtilityRateKeywords"]
 BDL_UtilityRateTypes = BDLEnums.bdl_enums["UtilityRateTypes"]
+BDL_Commands = BDLEnums.bdl_enums["Commands"]
+BDL_CirculationLoopKeywords = BDLEnums.bdl_enums["CirculationLoopKeywords"]
+BDL_SystemKeywords = BDLEnums.bdl_enums["SystemKeywords"]
+BDL_ZoneKeywords = BDLEnums.bdl_enums["ZoneKeywords"]
+BDL_ChillerKeywords = BDLEnums.bdl_enums["ChillerKeywords"]
+BDL_BoilerKeywords = BDLEnums.bdl_enums["BoilerKeywords"]
+BDL_HeatRejectionKeywords = BDLEnums.bdl_enums["HeatRejectionKeywords"]
+BDL_GroundLoopHXKeywords = BDLEnums.bdl_enums["GroundLoopHXKeywords"]
+BDL_EquipCtrlKeywords = BDLEnums.bdl_enums["EquipCtrlKeywords"]
 EnergySourceOptions = SchemaEnums.schema_enums["EnergySourceOptions"]
 EndUseOptions = SchemaEnums.schema_enums["EndUseOptions"]
 
@@ -33,6 +43,47 @@ class RulesetModelDescription(Base):
     This class is used to represent the RulesetModelDescription object in the 229 schema. It also stores additional model-level data.
     """
 
+    # Name lists of the BDL commands that reference circulation loops, with the keywords that hold the loop names
+    loop_reference_keywords = {
+        "circulation_loop_names": (
+            BDL_Commands.CIRCULATION_LOOP,
+            [BDL_CirculationLoopKeywords.PRIMARY_LOOP],
+        ),
+        "system_names": (
+            BDL_Commands.SYSTEM,
+            [BDL_SystemKeywords.CHW_LOOP, BDL_SystemKeywords.HW_LOOP],
+        ),
+        "zone_names": (
+            BDL_Commands.ZONE,
+            [
+                BDL_ZoneKeywords.CHW_LOOP,
+                BDL_ZoneKeywords.HW_LOOP,
+                BDL_ZoneKeywords.CW_LOOP,
+            ],
+        ),
+        "chiller_names": (
+            BDL_Commands.CHILLER,
+            [
+                BDL_ChillerKeywords.CHW_LOOP,
+                BDL_ChillerKeywords.HTREC_LOOP,
+                BDL_ChillerKeywords.CW_LOOP,
+            ],
+        ),
+        "boiler_names": (BDL_Commands.BOILER, [BDL_BoilerKeywords.HW_LOOP]),
+        "heat_rejection_names": (
+            BDL_Commands.HEAT_REJECTION,
+            [BDL_HeatRejectionKeywords.CW_LOOP],
+        ),
+        "ground_loop_hx_names": (
+            BDL_Commands.GROUND_LOOP_HX,
+            [BDL_GroundLoopHXKeywords.CIRCULATION_LOOP],
+        ),
+        "equip_ctrl_names": (
+            BDL_Commands.EQUIP_CTRL,
+            [BDL_EquipCtrlKeywords.CIRCULATION_LOOP],
+        ),
+    }
+
     def __init__(self, obj_id):
         self.file_path = None
         self.doe2_version = None
@@ -42,6 +93,20 @@ class RulesetModelDescription(Base):
         self.bdl_obj_instances = {}
         # store space names mapped to their zone objects for quick access
         self.space_map = {}
+        # store simulation output values mapped to their (entry_id, report_key, row_key) request tuples
+        self.output_results = {}
+        # store the futures of output batches still being fetched on other threads, mapped to the requests they hold
+        self.pending_output_results = {}
+        # store the number of result reader calls, the time spent in them, and the time spent waiting for their results
+        self.output_fetch_times = {"calls": 0, "call_seconds": 0.0, "wait_seconds": 0.0}
+        # store circulation loop names mapped to the BDL objects that reference them, built on first use
+        self.loop_references = None
+        # store the distinct fan schedule names of the systems, built on first use
+        self.system_fan_schedule_names = None
+        # store the hourly values shared by equivalent day, week and annual schedules, keyed by their structure
+        self.interned_schedule_values = {}
+        # held while shared schedule values are looked up and created, as schedules can populate on several threads
+        self.interned_schedule_values_lock = threading.Lock()
 
         self.rmd_data_structure = {}
 
@@ -135,7 +200,9 @@ class RulesetModelDescription(Base):
         self.output_instance_unmet_load_hours_cooling = output_data.get(
             "Unmet Cooling Load Hours"
         )
-        energy_source_types = set()
+        # Dictionary keys are used as an insertion-ordered set, so energy sources are listed in the same order in
+        # every process, whatever its string hash seed
+        energy_source_types = {}
         energy_source_results = {
             "Consumption": {
                 "site_energy_use": 0,
@@ -195,17 +262,17 @@ class RulesetModelDescription(Base):
 
         # Populate the set of unique energy sources in the model
         if output_data.get("Elec (all meters) - Elec Use"):
-            energy_source_types.add(EnergySourceOptions.ELECTRICITY)
+            energy_source_types.setdefault(EnergySourceOptions.ELECTRICITY)
         for fuel_meter_name in self.fuel_meter_names:
             fuel_meter = self.bdl_obj_instances.get(fuel_meter_name)
             if fuel_meter:
-                energy_source_types.add(
+                energy_source_types.setdefault(
                     fuel_meter.keyword_value_pairs.get(BDL_FuelMeterKeywords.TYPE)
                 )
         if self.steam_meter_names:
-            energy_source_types.add(EnergySourceOptions.PURCHASED_HOT_WATER)
+            energy_source_types.setdefault(EnergySourceOptions.PURCHASED_HOT_WATER)
         if self.chilled_water_meter_names:
-            energy_source_types.add(EnergySourceOptions.PURCHASED_CHILLED_WATER)
+            energy_source_types.setdefault(EnergySourceOptions.PURCHASED_CHILLED_WATER)
         if self.elec_generator_names:
             generators = [
                 self.bdl_obj_instances.get(generator_name)
@@ -216,7 +283,7 @@ class RulesetModelDescription(Base):
                 == BDL_ElecGeneratorTypes.PV_ARRAY
                 for generator in generators
             ):
-                energy_source_types.add(EnergySourceOptions.ON_SITE_RENEWABLES)
+                energy_source_types.setdefault(EnergySourceOptions.ON_SITE_RENEWABLES)
 
         # Populate the energy source results for each energy source
         for energy_source in energy_source_types:
@@ -1890,6 +1957,55 @@ class RulesetModelDescription(Base):
         """Insert RMD object into the RPD data structure."""
         rpd.ruleset_model_descriptions.append(self.rmd_data_structure)
 
+    def get_loop_references(self, loop_name: str, bdl_command: str, keyword: str):
+        """
+        Get the names of the BDL objects of one command that reference a circulation loop by a keyword. The references
+        of every loop are indexed the first time this is called, so it must be called after the model inputs are read.
+        :param loop_name: (str) u_name of the circulation loop
+        :param bdl_command: (str) BDL command of the referencing objects, such as "SYSTEM"
+        :param keyword: (str) keyword of the referencing objects that holds the loop name, such as "CHW-LOOP"
+        :return: (list) u_names of the referencing objects, in the order they were read
+        """
+        if self.loop_references is None:
+            self.loop_references = self.index_loop_references()
+        return self.loop_references.get(loop_name, {}).get((bdl_command, keyword), [])
+
+    def index_loop_references(self) -> dict:
+        """
+        Index the BDL objects that reference each circulation loop in a single pass over the model.
+        :return: (dict) loop u_name: {(bdl_command, keyword): [u_names of the referencing objects]}
+        """
+        loop_references = {}
+        for names_attr, (bdl_command, keywords) in self.loop_reference_keywords.items():
+            for obj_name in getattr(self, names_attr):
+                obj = self.bdl_obj_instances.get(obj_name)
+                if obj is None:
+                    continue
+                for keyword in keywords:
+                    loop_name = obj.keyword_value_pairs.get(keyword)
+                    if loop_name is not None:
+                        loop_references.setdefault(loop_name, {}).setdefault(
+                            (bdl_command, keyword), []
+                        ).append(obj_name)
+        return loop_references
+
+    def get_system_fan_schedule_names(self) -> list:
+        """
+        Get the distinct fan schedule names of the systems in the model.
+        :return: (list) schedule u_names, in the order the systems were read
+        """
+        if self.system_fan_schedule_names is None:
+            fan_schedule_names = (
+                self.bdl_obj_instances[system_name].keyword_value_pairs.get(
+                    BDL_SystemKeywords.FAN_SCHEDULE
+                )
+                for system_name in self.system_names
+            )
+            self.system_fan_schedule_names = list(
+                dict.fromkeys(name for name in fan_schedule_names if name)
+            )
+        return self.system_fan_schedule_names
+
     def populate_energy_source_end_use_results(
         self, source_results, energy_source_type
     ):
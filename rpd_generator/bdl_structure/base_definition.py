@@ -1,8 +1,6 @@
 from itertools import islice
-from pathlib import Path
 
-from rpd_generator.doe2_file_readers.model_output_reader import get_string_result
-from rpd_generator.config import Config
+from rpd_generator.bdl_structure.base_node import Base
 
 
 class BaseDefinition:
@@ -11,6 +9,10 @@ class BaseDefinition:
     """
 
     bdl_command = None
+    # BDL commands whose objects must be created and populated before the objects of this command
+    command_dependencies = []
+    # Objects of this command read or update one another while populating, so each one waits for the one before it
+    populate_in_file_order = False
     boolean_map = {
         "YES": True,
         "NO": False,
@@ -28,6 +30,10 @@ class BaseDefinition:
         """Insert a keyword-value pair for the BDL command."""
         self.keyword_value_pairs = key_val_dict
 
+    def get_populate_dependencies(self):
+        """Return the u_names of specific objects that must populate before this object."""
+        return []
+
     def populate_data_elements(self):
         """This method will be overridden by each child class"""
         return None
@@ -41,12 +47,7 @@ class BaseDefinition:
         :param entry_id: (int) id from NHRList.txt corresponding to the value to retrieve
         :return: value from binary simulation output files
         """
-        return get_string_result(
-            str(Path(Config.EQUEST_INSTALL_PATH) / "D2Result.dll"),
-            self.rmd.doe2_data_path,
-            str(Path(self.rmd.file_path).with_suffix("")),
-            entry_id,
-        )
+        return Base.get_single_string_output(self.rmd, entry_id)
 
     @staticmethod
     def try_float(value):
@@ -1,23 +1,60 @@
-import os
-import pint
-from itertools import islice
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
 from pathlib import Path
 
 
-from rpd_generator.doe2_file_readers.model_output_reader import (
-    get_string_result,
-    get_multiple_results,
+from rpd_generator.doe2_file_readers.model_output_reader import get_result_reader
+from rpd_generator.doe2_file_readers.result_cache import get_result_cache
+from rpd_generator.doe2_file_readers.output_request_planner import (
+    OutputRequestPlanner,
 )
+from rpd_generator.utilities.unit_converter import convert_value
 from rpd_generator.config import Config
 
 
-path_to_ureg = os.path.join(
-    os.path.dirname(os.path.dirname(__file__)),
-    "utilities",
-    "resources",
-    "unit_registry.txt",
-)
-ureg = pint.UnitRegistry(path_to_ureg, autoconvert_offset_to_baseunit=True)
+# Held around every call to the result reader when Config.SERIALIZE_RESULT_CALLS is set
+_result_call_lock = threading.Lock()
+# Held while the output fetch thread pool is created and while output fetch times are added up
+_output_fetch_lock = threading.Lock()
+# (number of threads, ThreadPoolExecutor) output is fetched on, created on first use
+_output_fetch_executor = (0, None)
+
+
+def get_output_fetch_executor() -> ThreadPoolExecutor:
+    """
+    Get the thread pool simulation output is fetched on, with Config.OUTPUT_FETCH_THREADS threads. The pool is created
+    on first use, replaced when the number of threads changes, and shut down by shutdown_output_fetch_executor().
+    :return: ThreadPoolExecutor
+    """
+    global _output_fetch_executor
+    with _output_fetch_lock:
+        threads, executor = _output_fetch_executor
+        if executor is None or threads != Config.OUTPUT_FETCH_THREADS:
+            if executor is not None:
+                executor.shutdown(wait=False)
+            executor = ThreadPoolExecutor(
+                max_workers=Config.OUTPUT_FETCH_THREADS,
+                thread_name_prefix="output-fetch",
+            )
+            _output_fetch_executor = (Config.OUTPUT_FETCH_THREADS, executor)
+        return executor
+
+
+def shutdown_output_fetch_executor(wait: bool = True):
+    """
+    Shut down the thread pool simulation output is fetched on, if there is one, cancelling batches not yet started.
+    The next call to get_output_fetch_executor() creates a new pool.
+    :param wait: (bool) wait for the batches being fetched to finish
+    :return: None
+    """
+    global _output_fetch_executor
+    with _output_fetch_lock:
+        executor = _output_fetch_executor[1]
+        _output_fetch_executor = (0, None)
+    if executor is not None:
+        executor.shutdown(wait=wait, cancel_futures=True)
 
 
 class Base:
@@ -57,46 +94,221 @@ class Base:
         :param row_key: (str) to use when KT > 0 and when a report has multiple row where each row provides results for a separate building component or month of the year
         :return: value from binary simulation output files
         """
-        return get_string_result(
-            str(Path(Config.EQUEST_INSTALL_PATH) / "D2Result.dll"),
-            rmd.doe2_data_path,
-            str(Path(rmd.file_path).with_suffix("")),
-            entry_id,
-            report_key,
-            row_key,
-        )
+        request = (entry_id, report_key, row_key)
+        result_cache = Base.get_result_cache(rmd)
+        if result_cache is not None:
+            value = result_cache.get_string_result(request)
+            if value is not None:
+                return value
+
+        result_reader = Base.get_result_reader(rmd)
+        with Base.result_call_context():
+            start_time = time.perf_counter()
+            value = result_reader.get_string_result(
+                str(Path(rmd.file_path).with_suffix("")),
+                entry_id,
+                report_key,
+                row_key,
+            )
+            call_seconds = time.perf_counter() - start_time
+        Base.add_output_fetch_time(rmd, "call_seconds", call_seconds)
+        if result_cache is not None:
+            result_cache.add_string_result(request, value)
+        return value
+
+    @staticmethod
+    def get_result_reader(rmd):
+        """
+        Get the result reader session for the simulation output of a model. The session is created once per
+        D2Result.dll path and DOE-2 data directory and reused for every request.
+        :param rmd: (RulesetModelDescription) object containing the path to the DOE-2 data directory
+        :return: result reader with get_multiple_results and get_string_result methods
+        """
+        d2_result_dll = str(Path(Config.EQUEST_INSTALL_PATH or "") / "D2Result.dll")
+        return get_result_reader(d2_result_dll, rmd.doe2_data_path)
+
+    @staticmethod
+    def get_result_cache(rmd):
+        """
+        Get the on-disk cache of simulation results for a model, if result caching is enabled in the Config.
+        :param rmd: (RulesetModelDescription) object containing the path to the simulation output files
+        :return: ResultCache or None
+        """
+        if not Config.USE_RESULT_CACHE:
+            return None
+        return get_result_cache(str(Path(rmd.file_path).with_suffix("")))
+
+    @staticmethod
+    def result_call_context():
+        """
+        Get the context every call to the result reader is made in: the lock that serializes calls when
+        Config.SERIALIZE_RESULT_CALLS is set, in case the D2Result.dll proves not to be thread-safe.
+        :return: context manager
+        """
+        return _result_call_lock if Config.SERIALIZE_RESULT_CALLS else nullcontext()
+
+    @staticmethod
+    def add_output_fetch_time(rmd, timing: str, seconds: float):
+        """
+        Add to the time spent fetching simulation output for a model, and count the call for result reader calls.
+        :param rmd: (RulesetModelDescription) object whose output_fetch_times are added to
+        :param timing: (str) "call_seconds" for time spent in result reader calls, "wait_seconds" for time spent
+        waiting for results fetched on other threads
+        :param seconds: (float) time spent
+        :return: None
+        """
+        with _output_fetch_lock:
+            rmd.output_fetch_times[timing] += seconds
+            if timing == "call_seconds":
+                rmd.output_fetch_times["calls"] += 1
 
     @staticmethod
     def get_output_data(rmd, requests):
         """
-        Get data from the simulation output.
+        Get data from the simulation output. Requests already fetched for the model (e.g. by a model-wide prefetch)
+        are read from the model's results store, waiting for the ones still being fetched on other threads; the
+        remaining requests are fetched in full batches.
         :param rmd: (RulesetModelDescription) object containing the path to the simulation output files
         :param requests: (dict) dictionary of description (str): (tuple) of entry_id: (int), report_key: (str), and row_key: (str)
         :return: (dict) dictionary of description (str): value (float)
         """
+        if rmd.pending_output_results:
+            Base.wait_for_output_results(rmd, requests.values())
+
+        missing_requests = [
+            request
+            for request in requests.values()
+            if request not in rmd.output_results
+        ]
+        if missing_requests:
+            Base.fetch_output_results(rmd, missing_requests)
+
+        results = {}
+        for key, request in requests.items():
+            value = rmd.output_results.get(request)
+            if value is not None and value != -99999:
+                results[key] = value
+        return results
 
-        chunk_size = 12  # Max number of requests to process at a time
-        results = {}  # To store the reassociated keys and values
-
-        # Split requests into chunks of at most 12
-        for chunk in _chunked_dict(requests, chunk_size):
-            # Extract and combine values into a list of tuples for get_multiple_results
-            values_list = list(chunk.values())
+    @staticmethod
+    def fetch_output_results(rmd, requests, wait=True):
+        """
+        Fetch simulation output for a collection of requests, packed into as few D2Result calls as possible, and add
+        the returned values to the model's results store. Requests without a value are stored as None so they are not
+        requested again. When result caching is enabled, cached values are used instead of calling the D2Result.dll.
 
-            # Call the function with the current chunk of values
-            chunk_results = get_multiple_results(
-                str(Path(Config.EQUEST_INSTALL_PATH) / "D2Result.dll"),
-                rmd.doe2_data_path,
-                str(Path(rmd.file_path).with_suffix("")),
-                values_list,
+        With Config.OUTPUT_FETCH_THREADS above 1, the batches are fetched on a thread pool. Until its batch is done, a
+        request is held in the model's pending results with the future of the batch, which get_output_data() waits for.
+        :param rmd: (RulesetModelDescription) object containing the path to the simulation output files
+        :param requests: (iterable) of (tuple) entry_id: (int), report_key: (str), and row_key: (str)
+        :param wait: (bool) wait for the batches fetched on the thread pool before returning
+        :return: None
+        """
+        requests = list(dict.fromkeys(requests))
+        result_cache = Base.get_result_cache(rmd)
+        if result_cache is not None:
+            cached_results = result_cache.get_results(requests)
+            rmd.output_results.update(cached_results)
+            requests = [
+                request for request in requests if request not in cached_results
+            ]
+            if not requests:
+                return
+
+        result_reader = Base.get_result_reader(rmd)
+        project_fname = str(Path(rmd.file_path).with_suffix(""))
+        planner = OutputRequestPlanner(result_reader.nhr_dict)
+        planner.add_requests(requests)
+        batches = planner.plan()
+
+        # Requests that are not planned have no value
+        fetched_results = dict.fromkeys(requests)
+        if Config.OUTPUT_FETCH_THREADS <= 1:
+            for batch in batches:
+                fetched_results.update(
+                    Base.fetch_output_batch(rmd, result_reader, project_fname, batch)
+                )
+            rmd.output_results.update(fetched_results)
+            if result_cache is not None:
+                result_cache.add_results(fetched_results)
+            return
+
+        for batch in batches:
+            for request in batch:
+                del fetched_results[request]
+        rmd.output_results.update(fetched_results)
+        if result_cache is not None:
+            result_cache.add_results(fetched_results)
+
+        executor = get_output_fetch_executor()
+        for batch in batches:
+            future = executor.submit(
+                Base.fetch_output_batch,
+                rmd,
+                result_reader,
+                project_fname,
+                batch,
+                result_cache,
             )
+            rmd.pending_output_results.update(dict.fromkeys(batch, future))
+        if wait:
+            Base.wait_for_output_results(rmd, requests)
 
-            # Reassociate returned values with their corresponding keys
-            if len(chunk_results) == len(chunk):
-                results.update(zip(chunk.keys(), chunk_results))
+    @staticmethod
+    def fetch_output_batch(rmd, result_reader, project_fname, batch, result_cache=None):
+        """
+        Fetch one batch of simulation output with a single D2Result call.
+        :param rmd: (RulesetModelDescription) object whose output fetch times are added to
+        :param result_reader: result reader with a get_multiple_results method
+        :param project_fname: (str) path to the project, without a file extension
+        :param batch: (list) of (tuple) entry_id: (int), report_key: (str), and row_key: (str), from the planner
+        :param result_cache: ResultCache the results are added to; None leaves adding them to the caller
+        :return: (dict) request (tuple): value (float), or None for requests without a value
+        """
+        with Base.result_call_context():
+            start_time = time.perf_counter()
+            batch_results = result_reader.get_multiple_results(project_fname, batch)
+            call_seconds = time.perf_counter() - start_time
+        Base.add_output_fetch_time(rmd, "call_seconds", call_seconds)
+
+        # Reassociate returned values with their corresponding requests
+        fetched_results = dict.fromkeys(batch)
+        if len(batch_results) == len(batch):
+            fetched_results.update(zip(batch, batch_results))
+        if result_cache is not None:
+            result_cache.add_results(fetched_results)
+        return fetched_results
 
-        results = {key: value for key, value in results.items() if value != -99999}
-        return results
+    @staticmethod
+    def wait_for_output_results(rmd, requests=None):
+        """
+        Wait for requests being fetched on the output fetch thread pool and add their values to the model's results
+        store. Errors raised while fetching a batch are raised here.
+        :param rmd: (RulesetModelDescription) object containing the pending results
+        :param requests: (iterable) of (tuple) entry_id: (int), report_key: (str), and row_key: (str); None waits for
+        every pending request
+        :return: None
+        """
+        pending_results = rmd.pending_output_results
+        if requests is None:
+            requests = list(pending_results)
+        futures = {
+            future
+            for future in map(pending_results.get, requests)
+            if future is not None
+        }
+        if not futures:
+            return
+
+        start_time = time.perf_counter()
+        for future in futures:
+            fetched_results = future.result()
+            rmd.output_results.update(fetched_results)
+            for request in fetched_results:
+                pending_results.pop(request, None)
+        Base.add_output_fetch_time(
+            rmd, "wait_seconds", time.perf_counter() - start_time
+        )
 
 
 class BaseNode(Base):
@@ -106,6 +318,10 @@ class BaseNode(Base):
     """
 
     bdl_command = None
+    # BDL commands whose objects must be created and populated before the objects of this command
+    command_dependencies = []
+    # Objects of this command read or update one another while populating, so each one waits for the one before it
+    populate_in_file_order = False
     boolean_map = {
         "YES": True,
         "NO": False,
@@ -125,6 +341,10 @@ class BaseNode(Base):
         """Insert a keyword-value pair for the BDL command."""
         self.keyword_value_pairs = key_val_dict
 
+    def get_populate_dependencies(self):
+        """Return the u_names of specific objects that must populate before this object."""
+        return []
+
     def populate_data_group(self):
         """This method will be overridden by each child class"""
         return None
@@ -144,6 +364,10 @@ class BaseNode(Base):
         """
         return self.rmd.bdl_obj_instances.get(u_name, None)
 
+    def get_output_requests(self):
+        """This method will be overridden by each child class that retrieves simulation output data"""
+        return {}
+
     def get_output_data(self, requests):
         """
         Get data from the simulation output.
@@ -219,8 +443,9 @@ class BaseNode(Base):
         """
         if isinstance(value, (int, float)):
             try:
-                return value * ureg(from_units).to(to_units).magnitude
-            except pint.errors.DimensionalityError:
+                return convert_value(value, from_units, to_units)
+            # pint.errors.DimensionalityError is a TypeError
+            except TypeError:
                 return None
         else:
             return None
@@ -247,10 +472,3 @@ class BaseNode(Base):
             data[key] = new_list_of_values
 
         return data
-
-
-def _chunked_dict(d, n):
-    """Yield successive n-sized chunks from dictionary d."""
-    it = iter(d)
-    for i in range(0, len(d), n):
-        yield {k: d[k] for k in islice(it, n)}
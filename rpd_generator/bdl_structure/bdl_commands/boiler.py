@@ -20,6 +20,14 @@ class Boiler(BaseNode):
     """Boiler object in the tree."""
 
     bdl_command = BDL_Commands.BOILER
+    # Boilers read the fuel type of their meter and attach pumps to their loop after the loop does
+    command_dependencies = [
+        BDL_Commands.FUEL_METER,
+        BDL_Commands.PUMP,
+        BDL_Commands.CIRCULATION_LOOP,
+    ]
+    # Boilers update each other's rated capacity and the energy source map they share
+    populate_in_file_order = True
 
     draft_type_map = {
         BDL_BoilerTypes.HW_BOILER: BoilerCombustionOptions.NATURAL,
@@ -173,7 +181,9 @@ class Boiler(BaseNode):
                 pump.loop_or_piping = [self.loop] * pump.qty
 
     def get_output_requests(self):
-        """Get the output requests for the boiler object."""
+        """Get the output requests for the boiler object. The rated capacity request is only made while rated_capacity
+        is unset, so the model-wide prefetch, made before population, always includes it.
+        """
 
         requests = {
             "Boilers - Design Parameters - Capacity": (
@@ -268,16 +278,14 @@ class Boiler(BaseNode):
             boiler = self.rmd.bdl_obj_instances.get(boiler_name)
             boiler.rated_capacity = boiler_capacities[boiler_name]
 
-        hw_loop_equip_ctrls = []
-        for equip_ctrl_name in self.rmd.equip_ctrl_names:
-            equip_ctrl = self.rmd.bdl_obj_instances.get(equip_ctrl_name)
-            if (
-                equip_ctrl.keyword_value_pairs.get(
-                    BDL_EquipCtrlKeywords.CIRCULATION_LOOP
-                )
-                == self.loop
-            ):
-                hw_loop_equip_ctrls.append(equip_ctrl)
+        hw_loop_equip_ctrls = [
+            self.rmd.bdl_obj_instances.get(equip_ctrl_name)
+            for equip_ctrl_name in self.rmd.get_loop_references(
+                self.loop,
+                BDL_Commands.EQUIP_CTRL,
+                BDL_EquipCtrlKeywords.CIRCULATION_LOOP,
+            )
+        ]
 
         if len(hw_loop_equip_ctrls) > 1:
             return
@@ -15,6 +15,15 @@ class Chiller(BaseNode):
     """Chiller object in the tree."""
 
     bdl_command = BDL_Commands.CHILLER
+    # Chillers read the pumps of their loops and the energy sources of the boilers and steam meters on them
+    command_dependencies = [
+        BDL_Commands.STEAM_METER,
+        BDL_Commands.PUMP,
+        BDL_Commands.CIRCULATION_LOOP,
+        BDL_Commands.BOILER,
+    ]
+    # Absorption chillers read the heat recovery loops of the other chillers
+    populate_in_file_order = True
 
     compressor_type_map = {
         BDL_ChillerTypes.ELEC_OPEN_CENT: ChillerCompressorOptions.CENTRIFUGAL,
@@ -32,6 +41,12 @@ class Chiller(BaseNode):
         BDL_ChillerTypes.WATER_ECONOMIZER: OMIT,
         BDL_ChillerTypes.STRAINER_CYCLE: OMIT,
     }
+    absorp_or_engine_types = [
+        BDL_ChillerTypes.ABSOR_1,
+        BDL_ChillerTypes.ABSOR_2,
+        BDL_ChillerTypes.GAS_ABSOR,
+        BDL_ChillerTypes.ENGINE,
+    ]
 
     def __init__(self, u_name, rmd):
         super().__init__(u_name, rmd)
@@ -81,12 +96,10 @@ class Chiller(BaseNode):
             self.omit = True
             return
 
-        elif self.keyword_value_pairs.get(BDL_ChillerKeywords.TYPE) in [
-            BDL_ChillerTypes.ABSOR_1,
-            BDL_ChillerTypes.ABSOR_2,
-            BDL_ChillerTypes.GAS_ABSOR,
-            BDL_ChillerTypes.ENGINE,
-        ]:
+        elif (
+            self.keyword_value_pairs.get(BDL_ChillerKeywords.TYPE)
+            in self.absorp_or_engine_types
+        ):
             absorp_or_engine = True
 
         requests = self.get_output_requests(absorp_or_engine)
@@ -187,8 +200,13 @@ class Chiller(BaseNode):
             if pump is not None:
                 pump.loop_or_piping = [self.condensing_loop] * pump.qty
 
-    def get_output_requests(self, absorp_or_engine):
+    def get_output_requests(self, absorp_or_engine=None):
         """Get output data requests for chiller object."""
+        if absorp_or_engine is None:
+            absorp_or_engine = (
+                self.keyword_value_pairs.get(BDL_ChillerKeywords.TYPE)
+                in self.absorp_or_engine_types
+            )
 
         if not absorp_or_engine:
             requests = {
@@ -35,6 +35,8 @@ class CirculationLoop(BaseNode):
     """CirculationLoop object in the tree."""
 
     bdl_command = BDL_Commands.CIRCULATION_LOOP
+    # Loops read the operation schedules of the systems they serve and attach pumps to themselves
+    command_dependencies = [BDL_Commands.PUMP, BDL_Commands.SCHEDULE_PD]
 
     loop_type_map = {
         BDL_CirculationLoopTypes.CHW: FluidLoopOptions.COOLING,
@@ -67,6 +69,109 @@ class CirculationLoop(BaseNode):
         BDL_CirculationLoopTemperatureResetOptions.WETBULB_RESET: TemperatureResetOptions.OTHER,
     }
 
+    # Objects attached to each type of loop that can vary its flow: (BDL command, keyword holding the loop name,
+    # keyword holding the valve or flow control type, value of that keyword for variable flow)
+    system_chw_valve_check = (
+        BDL_Commands.SYSTEM,
+        BDL_SystemKeywords.CHW_LOOP,
+        BDL_SystemKeywords.CHW_VALVE_TYPE,
+        BDL_SystemCoolingValveTypes.TWO_WAY,
+    )
+    system_hw_valve_check = (
+        BDL_Commands.SYSTEM,
+        BDL_SystemKeywords.HW_LOOP,
+        BDL_SystemKeywords.HW_VALVE_TYPE,
+        BDL_SystemHeatingValveTypes.TWO_WAY,
+    )
+    zone_chw_valve_check = (
+        BDL_Commands.ZONE,
+        BDL_ZoneKeywords.CHW_LOOP,
+        BDL_ZoneKeywords.CHW_VALVE_TYPE,
+        BDL_FlowControlOptions.VARIABLE_FLOW,
+    )
+    zone_hw_valve_check = (
+        BDL_Commands.ZONE,
+        BDL_ZoneKeywords.HW_LOOP,
+        BDL_ZoneKeywords.HW_VALVE_TYPE,
+        BDL_FlowControlOptions.VARIABLE_FLOW,
+    )
+    zone_cw_valve_check = (
+        BDL_Commands.ZONE,
+        BDL_ZoneKeywords.CW_LOOP,
+        BDL_ZoneKeywords.CW_VALVE,
+        BDL_ZoneCondenserValveOptions.YES,
+    )
+    chiller_chw_valve_check = (
+        BDL_Commands.CHILLER,
+        BDL_ChillerKeywords.CHW_LOOP,
+        BDL_ChillerKeywords.CHW_FLOW_CTRL,
+        BDL_FlowControlOptions.VARIABLE_FLOW,
+    )
+    chiller_htrec_valve_check = (
+        BDL_Commands.CHILLER,
+        BDL_ChillerKeywords.HTREC_LOOP,
+        BDL_ChillerKeywords.HTREC_FLOW_CTRL,
+        BDL_FlowControlOptions.VARIABLE_FLOW,
+    )
+    chiller_cw_valve_check = (
+        BDL_Commands.CHILLER,
+        BDL_ChillerKeywords.CW_LOOP,
+        BDL_ChillerKeywords.CW_FLOW_CTRL,
+        BDL_FlowControlOptions.VARIABLE_FLOW,
+    )
+    boiler_hw_valve_check = (
+        BDL_Commands.BOILER,
+        BDL_BoilerKeywords.HW_LOOP,
+        BDL_BoilerKeywords.HW_FLOW_CTRL,
+        BDL_FlowControlOptions.VARIABLE_FLOW,
+    )
+    heat_rejection_cw_valve_check = (
+        BDL_Commands.HEAT_REJECTION,
+        BDL_HeatRejectionKeywords.CW_LOOP,
+        BDL_HeatRejectionKeywords.CW_FLOW_CTRL,
+        BDL_FlowControlOptions.VARIABLE_FLOW,
+    )
+    ground_loop_hx_valve_check = (
+        BDL_Commands.GROUND_LOOP_HX,
+        BDL_GroundLoopHXKeywords.CIRCULATION_LOOP,
+        BDL_GroundLoopHXKeywords.HX_FLOW_CTRL,
+        BDL_FlowControlOptions.VARIABLE_FLOW,
+    )
+    loop_valve_checks = {
+        BDL_CirculationLoopTypes.CHW: [
+            system_chw_valve_check,
+            zone_chw_valve_check,
+            chiller_chw_valve_check,
+        ],
+        BDL_CirculationLoopTypes.HW: [
+            system_hw_valve_check,
+            zone_hw_valve_check,
+            chiller_htrec_valve_check,
+            boiler_hw_valve_check,
+        ],
+        BDL_CirculationLoopTypes.CW: [
+            zone_cw_valve_check,
+            chiller_cw_valve_check,
+            heat_rejection_cw_valve_check,
+            ground_loop_hx_valve_check,
+        ],
+        BDL_CirculationLoopTypes.PIPE2: [
+            system_chw_valve_check,
+            system_hw_valve_check,
+            zone_hw_valve_check,
+            zone_chw_valve_check,
+            chiller_chw_valve_check,
+            chiller_htrec_valve_check,
+            boiler_hw_valve_check,
+        ],
+        BDL_CirculationLoopTypes.WLHP: [
+            zone_cw_valve_check,
+            boiler_hw_valve_check,
+            heat_rejection_cw_valve_check,
+            ground_loop_hx_valve_check,
+        ],
+    }
+
     def __init__(self, u_name, rmd):
         super().__init__(u_name, rmd)
         self.rmd.circulation_loop_names.append(u_name)
@@ -677,287 +782,40 @@ class CirculationLoop(BaseNode):
         """Determine the flow control type for the circulation loop"""
         loop_type = self.keyword_value_pairs.get(BDL_CirculationLoopKeywords.TYPE)
 
-        for circulation_loop_name in self.rmd.circulation_loop_names:
-            circulation_loop = self.rmd.bdl_obj_instances.get(circulation_loop_name)
-            primary_loop = circulation_loop.keyword_value_pairs.get(
-                BDL_CirculationLoopKeywords.PRIMARY_LOOP
-            )
-            valve_type = circulation_loop.keyword_value_pairs.get(
-                BDL_CirculationLoopKeywords.VALVE_TYPE_2ND
+        # Secondary loops with two-way valves vary the flow of their primary loop, whatever its type
+        valve_checks = [
+            (
+                BDL_Commands.CIRCULATION_LOOP,
+                BDL_CirculationLoopKeywords.PRIMARY_LOOP,
+                BDL_CirculationLoopKeywords.VALVE_TYPE_2ND,
+                BDL_SecondaryLoopValveTypes.TWO_WAY,
             )
-            if (
-                primary_loop == self.u_name
-                and valve_type == BDL_SecondaryLoopValveTypes.TWO_WAY
-            ):
-                return FluidLoopFlowControlOptions.VARIABLE_FLOW
-
-        for system_name in self.rmd.system_names:
-            system = self.rmd.bdl_obj_instances.get(system_name)
-            if loop_type == BDL_CirculationLoopTypes.CHW:
-                cooling_loop = system.keyword_value_pairs.get(
-                    BDL_SystemKeywords.CHW_LOOP
-                )
-                valve_type = system.keyword_value_pairs.get(
-                    BDL_SystemKeywords.CHW_VALVE_TYPE
-                )
-                if (
-                    cooling_loop == self.u_name
-                    and valve_type == BDL_SystemCoolingValveTypes.TWO_WAY
-                ):
-                    return FluidLoopFlowControlOptions.VARIABLE_FLOW
-            elif loop_type == BDL_CirculationLoopTypes.HW:
-                heating_loop = system.keyword_value_pairs.get(
-                    BDL_SystemKeywords.HW_LOOP
-                )
-                valve_type = system.keyword_value_pairs.get(
-                    BDL_SystemKeywords.HW_VALVE_TYPE
-                )
-                if (
-                    heating_loop == self.u_name
-                    and valve_type == BDL_SystemHeatingValveTypes.TWO_WAY
-                ):
-                    return FluidLoopFlowControlOptions.VARIABLE_FLOW
-            elif loop_type == BDL_CirculationLoopTypes.CW:
-                pass
-            elif loop_type == BDL_CirculationLoopTypes.PIPE2:
-                cooling_loop = system.keyword_value_pairs.get(
-                    BDL_SystemKeywords.CHW_LOOP
-                )
-                heating_loop = system.keyword_value_pairs.get(
-                    BDL_SystemKeywords.HW_LOOP
-                )
-                cooling_valve_type = system.keyword_value_pairs.get(
-                    BDL_SystemKeywords.CHW_VALVE_TYPE
-                )
-                heating_valve_type = system.keyword_value_pairs.get(
-                    BDL_SystemKeywords.HW_VALVE_TYPE
-                )
-                if (
-                    cooling_loop == self.u_name
-                    and cooling_valve_type == BDL_SystemCoolingValveTypes.TWO_WAY
-                ):
-                    return FluidLoopFlowControlOptions.VARIABLE_FLOW
-                if (
-                    heating_loop == self.u_name
-                    and heating_valve_type == BDL_SystemHeatingValveTypes.TWO_WAY
-                ):
-                    return FluidLoopFlowControlOptions.VARIABLE_FLOW
-            elif loop_type == BDL_CirculationLoopTypes.WLHP:
-                pass
-
-        for zone_name in self.rmd.zone_names:
-            zone = self.rmd.bdl_obj_instances.get(zone_name)
-            if loop_type == BDL_CirculationLoopTypes.CHW:
-                cooling_loop = zone.keyword_value_pairs.get(BDL_ZoneKeywords.CHW_LOOP)
-                valve_type = zone.keyword_value_pairs.get(
-                    BDL_ZoneKeywords.CHW_VALVE_TYPE
-                )
-                if (
-                    cooling_loop == self.u_name
-                    and valve_type == BDL_FlowControlOptions.VARIABLE_FLOW
-                ):
-                    return FluidLoopFlowControlOptions.VARIABLE_FLOW
-            elif loop_type == BDL_CirculationLoopTypes.HW:
-                heating_loop = zone.keyword_value_pairs.get(BDL_ZoneKeywords.HW_LOOP)
-                valve_type = zone.keyword_value_pairs.get(
-                    BDL_ZoneKeywords.HW_VALVE_TYPE
-                )
-                if (
-                    heating_loop == self.u_name
-                    and valve_type == BDL_FlowControlOptions.VARIABLE_FLOW
-                ):
-                    return FluidLoopFlowControlOptions.VARIABLE_FLOW
-            elif loop_type in [
-                BDL_CirculationLoopTypes.CW,
-                BDL_CirculationLoopTypes.WLHP,
-            ]:
-                condensing_loop = zone.keyword_value_pairs.get(BDL_ZoneKeywords.CW_LOOP)
-                has_valve = zone.keyword_value_pairs.get(BDL_ZoneKeywords.CW_VALVE)
-                if (
-                    condensing_loop == self.u_name
-                    and has_valve == BDL_ZoneCondenserValveOptions.YES
-                ):
-                    return FluidLoopFlowControlOptions.VARIABLE_FLOW
-            elif loop_type == BDL_CirculationLoopTypes.PIPE2:
-                heating_loop = zone.keyword_value_pairs.get(BDL_ZoneKeywords.HW_LOOP)
-                cooling_loop = zone.keyword_value_pairs.get(BDL_ZoneKeywords.CHW_LOOP)
-                heating_valve_type = zone.keyword_value_pairs.get(
-                    BDL_ZoneKeywords.HW_VALVE_TYPE
-                )
-                cooling_valve_type = zone.keyword_value_pairs.get(
-                    BDL_ZoneKeywords.CHW_VALVE_TYPE
-                )
-                if (
-                    heating_loop == self.u_name
-                    and heating_valve_type == BDL_FlowControlOptions.VARIABLE_FLOW
-                ):
-                    return FluidLoopFlowControlOptions.VARIABLE_FLOW
-                if (
-                    cooling_loop == self.u_name
-                    and cooling_valve_type == BDL_FlowControlOptions.VARIABLE_FLOW
-                ):
-                    return FluidLoopFlowControlOptions.VARIABLE_FLOW
-
-        for chiller_name in self.rmd.chiller_names:
-            chiller = self.rmd.bdl_obj_instances.get(chiller_name)
-            if loop_type == BDL_CirculationLoopTypes.CHW:
-                cooling_loop = chiller.keyword_value_pairs.get(
-                    BDL_ChillerKeywords.CHW_LOOP
-                )
-                valve_type = chiller.keyword_value_pairs.get(
-                    BDL_ChillerKeywords.CHW_FLOW_CTRL
-                )
-                if (
-                    cooling_loop == self.u_name
-                    and valve_type == BDL_FlowControlOptions.VARIABLE_FLOW
-                ):
-                    return FluidLoopFlowControlOptions.VARIABLE_FLOW
-            elif loop_type == BDL_CirculationLoopTypes.HW:
-                heating_loop = chiller.keyword_value_pairs.get(
-                    BDL_ChillerKeywords.HTREC_LOOP
-                )
-                valve_type = chiller.keyword_value_pairs.get(
-                    BDL_ChillerKeywords.HTREC_FLOW_CTRL
-                )
-                if (
-                    heating_loop == self.u_name
-                    and valve_type == BDL_FlowControlOptions.VARIABLE_FLOW
-                ):
-                    return FluidLoopFlowControlOptions.VARIABLE_FLOW
-            elif loop_type == BDL_CirculationLoopTypes.CW:
-                condensing_loop = chiller.keyword_value_pairs.get(
-                    BDL_ChillerKeywords.CW_LOOP
-                )
-                valve_type = chiller.keyword_value_pairs.get(
-                    BDL_ChillerKeywords.CW_FLOW_CTRL
-                )
-                if (
-                    condensing_loop == self.u_name
-                    and valve_type == BDL_FlowControlOptions.VARIABLE_FLOW
-                ):
-                    return FluidLoopFlowControlOptions.VARIABLE_FLOW
-            elif loop_type == BDL_CirculationLoopTypes.PIPE2:
-                cooling_loop = chiller.keyword_value_pairs.get(
-                    BDL_ChillerKeywords.CHW_LOOP
-                )
-                heating_loop = chiller.keyword_value_pairs.get(
-                    BDL_ChillerKeywords.HTREC_LOOP
-                )
-                cooling_valve_type = chiller.keyword_value_pairs.get(
-                    BDL_ChillerKeywords.CHW_FLOW_CTRL
-                )
-                heating_valve_type = chiller.keyword_value_pairs.get(
-                    BDL_ChillerKeywords.HTREC_FLOW_CTRL
-                )
-                if (
-                    cooling_loop == self.u_name
-                    and cooling_valve_type == BDL_FlowControlOptions.VARIABLE_FLOW
-                ):
-                    return FluidLoopFlowControlOptions.VARIABLE_FLOW
-                if (
-                    heating_loop == self.u_name
-                    and heating_valve_type == BDL_FlowControlOptions.VARIABLE_FLOW
-                ):
-                    return FluidLoopFlowControlOptions.VARIABLE_FLOW
-            elif loop_type == BDL_CirculationLoopTypes.WLHP:
-                pass  # Unused for chillers
-
-        for boiler_name in self.rmd.boiler_names:
-            boiler = self.rmd.bdl_obj_instances.get(boiler_name)
-
-            if loop_type in [
-                BDL_CirculationLoopTypes.CHW,
-                BDL_CirculationLoopTypes.CW,
-            ]:
-                pass  # Unused for boilers
-            elif loop_type in [
-                BDL_CirculationLoopTypes.HW,
-                BDL_CirculationLoopTypes.PIPE2,
-                BDL_CirculationLoopTypes.WLHP,
-            ]:
-                heating_loop = boiler.keyword_value_pairs.get(
-                    BDL_BoilerKeywords.HW_LOOP
-                )
-                valve_type = boiler.keyword_value_pairs.get(
-                    BDL_BoilerKeywords.HW_FLOW_CTRL
-                )
-                if (
-                    heating_loop == self.u_name
-                    and valve_type == BDL_FlowControlOptions.VARIABLE_FLOW
-                ):
-                    return FluidLoopFlowControlOptions.VARIABLE_FLOW
-
-        for heat_rejection_name in self.rmd.heat_rejection_names:
-            heat_rejection = self.rmd.bdl_obj_instances.get(heat_rejection_name)
-
-            if loop_type in [
-                BDL_CirculationLoopTypes.CHW,
-                BDL_CirculationLoopTypes.HW,
-                BDL_CirculationLoopTypes.PIPE2,
-            ]:
-                pass  # Unused for heat rejections
-
-            elif loop_type in [
-                BDL_CirculationLoopTypes.CW,
-                BDL_CirculationLoopTypes.WLHP,
-            ]:
-                condensing_loop = heat_rejection.keyword_value_pairs.get(
-                    BDL_HeatRejectionKeywords.CW_LOOP
-                )
-                valve_type = heat_rejection.keyword_value_pairs.get(
-                    BDL_HeatRejectionKeywords.CW_FLOW_CTRL
-                )
-                if (
-                    condensing_loop == self.u_name
-                    and valve_type == BDL_FlowControlOptions.VARIABLE_FLOW
-                ):
-                    return FluidLoopFlowControlOptions.VARIABLE_FLOW
+        ]
+        valve_checks.extend(self.loop_valve_checks.get(loop_type, []))
 
-        for ground_loop_hx_name in self.rmd.ground_loop_hx_names:
-            ground_loop_hx = self.rmd.bdl_obj_instances.get(ground_loop_hx_name)
-
-            if loop_type in [
-                BDL_CirculationLoopTypes.CHW,
-                BDL_CirculationLoopTypes.HW,
-                BDL_CirculationLoopTypes.PIPE2,
-            ]:
-                pass  # Unused for ground loop heat exchangers
-            elif loop_type in [
-                BDL_CirculationLoopTypes.CW,
-                BDL_CirculationLoopTypes.WLHP,
-            ]:
-                condensing_loop = ground_loop_hx.keyword_value_pairs.get(
-                    BDL_GroundLoopHXKeywords.CIRCULATION_LOOP
-                )
-                valve_type = ground_loop_hx.keyword_value_pairs.get(
-                    BDL_GroundLoopHXKeywords.HX_FLOW_CTRL
-                )
-                if (
-                    condensing_loop == self.u_name
-                    and valve_type == BDL_FlowControlOptions.VARIABLE_FLOW
-                ):
+        for bdl_command, loop_keyword, valve_keyword, variable_valve in valve_checks:
+            for obj_name in self.rmd.get_loop_references(
+                self.u_name, bdl_command, loop_keyword
+            ):
+                obj = self.rmd.bdl_obj_instances.get(obj_name)
+                if obj.keyword_value_pairs.get(valve_keyword) == variable_valve:
                     return FluidLoopFlowControlOptions.VARIABLE_FLOW
 
         return FluidLoopFlowControlOptions.FIXED_FLOW
 
     def is_loop_operation_continuous(self):
-        for system_name in self.rmd.system_names:
-            system = self.rmd.bdl_obj_instances.get(system_name)
-            system_fan_schedule = system.keyword_value_pairs.get(
-                BDL_SystemKeywords.FAN_SCHEDULE
-            )
-            if system_fan_schedule:
-                if self.is_operation_schedule_continuous(system_fan_schedule):
-                    return True
+        for system_fan_schedule in self.rmd.get_system_fan_schedule_names():
+            if self.is_operation_schedule_continuous(system_fan_schedule):
+                return True
         return False
 
     def is_operation_schedule_continuous(self, schedule_u_name):
         schedule = self.rmd.bdl_obj_instances.get(schedule_u_name)
         if schedule:
-            hourly_values = schedule.hourly_values
-            if hourly_values:
+            statistics = schedule.get_statistics()
+            if statistics:
                 # If hourly_values contains any 0 or -1, the system is not continuous
-                return not any([x == 0 or x == -1 for x in hourly_values])
+                return statistics["is_continuous"]
         else:
             raise ValueError(f"Schedule {schedule_u_name} not found in the RMD.")
 
@@ -14,6 +14,8 @@ class Construction(BaseNode):
     """Construction object in the tree."""
 
     bdl_command = BDL_Commands.CONSTRUCTION
+    # Constructions are made of layers of materials
+    command_dependencies = [BDL_Commands.MATERIAL, BDL_Commands.LAYERS]
 
     def __init__(self, u_name, rmd):
         super().__init__(u_name, rmd)
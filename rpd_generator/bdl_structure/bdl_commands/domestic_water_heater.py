@@ -20,6 +20,8 @@ class DomesticWaterHeater(BaseNode):
     """DomesticWaterHeater object in the tree."""
 
     bdl_command = BDL_Commands.DW_HEATER
+    # Water heaters read the fuel type of their meter and the loop they serve
+    command_dependencies = [BDL_Commands.FUEL_METER, BDL_Commands.CIRCULATION_LOOP]
 
     heater_type_map = {
         BDL_DWHeaterTypes.GAS: ServiceWaterHeaterOptions.CONVENTIONAL,
@@ -24,6 +24,15 @@ class Door(ChildNode):
     """Door object in the tree."""
 
     bdl_command = BDL_Commands.DOOR
+    # Doors belong to a wall and read the building azimuth and their construction. Windows come first so they are
+    # listed before doors on a wall
+    command_dependencies = [
+        "BUILD-PARAMETERS",
+        BDL_Commands.CONSTRUCTION,
+        BDL_Commands.EXTERIOR_WALL,
+        BDL_Commands.INTERIOR_WALL,
+        BDL_Commands.WINDOW,
+    ]
 
     def __init__(self, u_name, parent, rmd):
         super().__init__(u_name, parent, rmd)
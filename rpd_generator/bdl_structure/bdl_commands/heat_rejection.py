@@ -21,6 +21,8 @@ class HeatRejection(BaseNode):
     """Heat Rejection object in the tree."""
 
     bdl_command = BDL_Commands.HEAT_REJECTION
+    # Heat rejections read the loop they serve and its pumps
+    command_dependencies = [BDL_Commands.PUMP, BDL_Commands.CIRCULATION_LOOP]
 
     heat_rejection_type_map = {
         BDL_HeatRejectionTypes.OPEN_TWR: HeatRejectionOptions.OPEN_CIRCUIT_COOLING_TOWER,
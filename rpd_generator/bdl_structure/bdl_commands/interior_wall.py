@@ -24,6 +24,12 @@ class InteriorWall(
     """InteriorWall object in the tree."""
 
     bdl_command = BDL_Commands.INTERIOR_WALL
+    # Walls belong to a space and read the building azimuth and their construction
+    command_dependencies = [
+        "BUILD-PARAMETERS",
+        BDL_Commands.CONSTRUCTION,
+        BDL_Commands.SPACE,
+    ]
 
     CEILING_TILT_THRESHOLD = 60
     FLOOR_TILT_THRESHOLD = 120
@@ -81,6 +81,8 @@ class Layer(BaseDefinition):
     """Layer object in the tree."""
 
     bdl_command = BDL_Commands.LAYERS
+    # Layers are made of materials
+    command_dependencies = [BDL_Commands.MATERIAL]
 
     def __init__(self, u_name, rmd):
         super().__init__(u_name, rmd)
@@ -1,6 +1,7 @@
 from rpd_generator.bdl_structure.base_definition import BaseDefinition
 from rpd_generator.bdl_structure.bdl_commands.schedule import Schedule
 from rpd_generator.utilities import schedule_funcs
+from rpd_generator.utilities.hourly_values import HourlyValues, get_day_values
 from rpd_generator.bdl_structure.bdl_enumerations.bdl_enums import BDLEnums
 
 
@@ -14,6 +15,8 @@ BDL_ScheduleTypes = BDLEnums.bdl_enums["ScheduleTypes"]
 
 class SiteParameters(BaseDefinition):
     bdl_command = BDL_Commands.SITE_PARAMETERS
+    # The run period adds the first entries of the RPD calendar
+    command_dependencies = [BDL_Commands.RUN_PERIOD_PD]
 
     def __init__(self, u_name, rmd):
         super().__init__(u_name, rmd)
@@ -46,13 +49,16 @@ class SiteParameters(BaseDefinition):
         assert (
             len(monthly_ground_temps) == 12
         ), "Ground temperature schedule must have 12 values."
-        hours_in_month = [744, 672, 744, 720, 744, 720, 744, 744, 720, 744, 720, 744]
-        hourly_values = []
+        days_in_month = [31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31]
+        day_values = []
         for i, temp in enumerate(monthly_ground_temps):
-            hourly_values.extend([self.try_float(temp)] * hours_in_month[i])
+            # Every day of the month shares the same row of 24 hourly values
+            day_values.extend(
+                [get_day_values([self.try_float(temp)] * 24)] * days_in_month[i]
+            )
         ground_t_schedule = Schedule("Ground Temperature Schedule", self.rmd)
         ground_t_schedule.type = BDL_ScheduleTypes.TEMPERATURE
-        ground_t_schedule.hourly_values = hourly_values
+        ground_t_schedule.hourly_values = HourlyValues.from_day_values(day_values)
         self.rmd.bdl_obj_instances["Ground Temperature Schedule"] = ground_t_schedule
 
 
@@ -103,6 +109,8 @@ class FixedShade(BaseDefinition):
 
 class Holidays(BaseDefinition):
     bdl_command = BDL_Commands.HOLIDAYS
+    # Holidays are laid out on the calendar of the run period year
+    command_dependencies = [BDL_Commands.RUN_PERIOD_PD]
 
     def __init__(self, u_name, rmd):
         super().__init__(u_name, rmd)
@@ -126,7 +134,7 @@ class Holidays(BaseDefinition):
                 calendar, Schedule.holiday_months, Schedule.holiday_days
             )
 
-        Schedule.annual_calendar = calendar
+        Schedule.set_annual_calendar(calendar)
 
 
 class DesignDay(BaseDefinition):
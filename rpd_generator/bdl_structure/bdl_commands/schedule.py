@@ -1,6 +1,15 @@
+from array import array
+
 from rpd_generator.bdl_structure.base_node import BaseNode
 from rpd_generator.bdl_structure.base_definition import BaseDefinition
 from rpd_generator.bdl_structure.bdl_enumerations.bdl_enums import BDLEnums
+from rpd_generator.utilities import schedule_funcs
+from rpd_generator.utilities.hourly_values import (
+    HourlyValues,
+    get_coincident_values,
+    get_day_values,
+    get_hourly_value_statistics,
+)
 
 BDL_Commands = BDLEnums.bdl_enums["Commands"]
 BDL_ScheduleTypes = BDLEnums.bdl_enums["ScheduleTypes"]
@@ -10,6 +19,22 @@ BDL_ScheduleKeywords = BDLEnums.bdl_enums["ScheduleKeywords"]
 LAST_DAY = 364
 
 
+def intern_schedule_values(rmd, key: tuple, expand):
+    """
+    Get the hourly values of a day, week or annual schedule from the values already created for an equivalent
+    schedule of the model, so that equivalent schedules share them. They are only created for the first schedule.
+    :param rmd: RulesetModelDescription that stores the shared values
+    :param key: (tuple) BDL command and structure of the schedule; equivalent schedules have equal keys
+    :param expand: (callable) function that creates the hourly values
+    :return: hourly values shared by every schedule with the same key
+    """
+    with rmd.interned_schedule_values_lock:
+        hourly_values = rmd.interned_schedule_values.get(key)
+        if hourly_values is None:
+            hourly_values = rmd.interned_schedule_values[key] = expand()
+    return hourly_values
+
+
 class DaySchedulePD(BaseDefinition):
     """DaySchedulePD object in the tree."""
 
@@ -35,7 +60,20 @@ class DaySchedulePD(BaseDefinition):
                 BDL_DayScheduleKeywords.VALUES
             )
             day_sch_values_list = [self.try_float(val) for val in day_sch_values_list]
-            self.hourly_values = day_sch_values_list
+            day_values = get_day_values(day_sch_values_list)
+            # Day schedules with the same values share one row
+            self.hourly_values = intern_schedule_values(
+                self.rmd,
+                (
+                    BDL_Commands.DAY_SCHEDULE_PD,
+                    (
+                        day_values.tobytes()
+                        if isinstance(day_values, array)
+                        else tuple(day_values)
+                    ),
+                ),
+                lambda: day_values,
+            )
 
         elif day_sch_type == BDL_ScheduleTypes.RESET_TEMP:
             self.outdoor_high_for_loop_supply_reset_temperature = self.try_float(
@@ -56,6 +94,8 @@ class WeekSchedulePD(BaseDefinition):
     """WeekSchedulePD object in the tree."""
 
     bdl_command = BDL_Commands.WEEK_SCHEDULE_PD
+    # Week schedules are made of day schedules
+    command_dependencies = [BDL_Commands.DAY_SCHEDULE_PD]
 
     def __init__(self, u_name, rmd):
         super().__init__(u_name, rmd)
@@ -77,10 +117,19 @@ class WeekSchedulePD(BaseDefinition):
             day_schedule_names = self.keyword_value_pairs.get(
                 BDL_WeekScheduleKeywords.DAY_SCHEDULES
             )
-            self.day_type_hourly_values = [
+            day_type_hourly_values = [
                 self.rmd.bdl_obj_instances[day_sch_name].hourly_values
                 for day_sch_name in day_schedule_names
             ]
+            # Week schedules made of the same day rows share one list of rows
+            self.day_type_hourly_values = intern_schedule_values(
+                self.rmd,
+                (
+                    BDL_Commands.WEEK_SCHEDULE_PD,
+                    tuple(map(id, day_type_hourly_values)),
+                ),
+                lambda: day_type_hourly_values,
+            )
 
         elif wk_sch_type == BDL_ScheduleTypes.RESET_TEMP:
             attributes = {
@@ -108,6 +157,12 @@ class Schedule(BaseNode):
     """Schedule object in the tree."""
 
     bdl_command = BDL_Commands.SCHEDULE_PD
+    # Annual schedules lay week schedules out on the calendar of the run period and its holidays
+    command_dependencies = [
+        BDL_Commands.RUN_PERIOD_PD,
+        BDL_Commands.HOLIDAYS,
+        BDL_Commands.WEEK_SCHEDULE_PD,
+    ]
 
     year = None
     day_of_week_for_january_1 = None
@@ -115,6 +170,10 @@ class Schedule(BaseNode):
     holiday_months = None
     holiday_days = None
     annual_calendar = {}
+    # Compiled from the annual calendar by set_annual_calendar(): the zero-based day type index of each day of the
+    # year, and the index of each "month/day" date in the year
+    calendar_day_type_indices = ()
+    calendar_date_ordinals = {}
     supported_hourly_schedules = [
         BDL_ScheduleTypes.ON_OFF,
         BDL_ScheduleTypes.ON_OFF_FLAG,
@@ -132,6 +191,10 @@ class Schedule(BaseNode):
         self.outdoor_low_for_loop_supply_reset_temperature = None
         self.loop_supply_temperature_at_outdoor_high = None
         self.loop_supply_temperature_at_outdoor_low = None
+        # statistics of the hourly values, computed on first use
+        self.statistics = None
+        # distinct pairs of coincident hourly values mapped to the u_name of the other schedule, computed on first use
+        self.coincident_values = {}
 
         # data elements with no children
         self.purpose = None
@@ -162,8 +225,6 @@ class Schedule(BaseNode):
             *self.supported_hourly_schedules,
             BDL_ScheduleTypes.RESET_TEMP,
         ]:
-            proj_calendar = self.annual_calendar
-
             # Get the month value where a new week-schedule begins
             ann_months = (
                 self.keyword_value_pairs.get(BDL_ScheduleKeywords.MONTH)
@@ -188,56 +249,79 @@ class Schedule(BaseNode):
                 self.keyword_value_pairs.get(BDL_ScheduleKeywords.WEEK_SCHEDULES)
             ]
 
-            # Create a list to hold the index where there is a change in week schedule based on mo/day in ann sch
-            schedule_change_indices = [
-                list(proj_calendar.keys()).index(f"{ann_months[i]}/{ann_days[i]}") + 1
+            # Create a set to hold the index where there is a change in week schedule based on mo/day in ann sch
+            schedule_change_indices = {
+                self.calendar_date_ordinals[f"{ann_months[i]}/{ann_days[i]}"] + 1
                 for i in range(len(ann_months))
-            ]
-
-            # Loop through each day of the year in the calendar. Extend the hourly schedule values based on the day type
-            # result is an 8760 list with the hourly schedule value for the whole year.
-            wk_sch_index = 0
+            }
+            day_type_indices = self.calendar_day_type_indices
 
+            # Select the day schedule values of each day of the year in the calendar based on the day type, one range
+            # of days per week schedule. The result is an 8760 sequence with the hourly schedule value for the whole year.
             if ann_sch_type in self.supported_hourly_schedules:
-                hourly_values = []
-                for day_index, day_type in enumerate(proj_calendar.values()):
-                    # Check if the index is a change point. If so, continue to the next weekly schedule index
-                    if day_index in schedule_change_indices and day_index != LAST_DAY:
-                        wk_sch_index += 1
-
-                    wk_schedule_pd = self.rmd.bdl_obj_instances[
-                        week_schedules[wk_sch_index]
-                    ]
-                    hourly_values.extend(
-                        wk_schedule_pd.day_type_hourly_values[day_type - 1]
+                week_ranges = [
+                    (
+                        self.rmd.bdl_obj_instances[
+                            week_schedules[wk_sch_index]
+                        ].day_type_hourly_values,
+                        start,
+                        end,
+                    )
+                    for wk_sch_index, start, end in self.get_week_schedule_ranges(
+                        schedule_change_indices
                     )
-                self.hourly_values = hourly_values
+                ]
+
+                def expand_hourly_values():
+                    day_values = []
+                    for day_type_hourly_values, start, end in week_ranges:
+                        day_values.extend(
+                            map(
+                                day_type_hourly_values.__getitem__,
+                                day_type_indices[start:end],
+                            )
+                        )
+                    return HourlyValues.from_day_values(day_values)
+
+                # Schedules that use the same week schedules over the same days share one set of hourly values, which
+                # is only expanded for the first of them
+                self.hourly_values = intern_schedule_values(
+                    self.rmd,
+                    (
+                        BDL_Commands.SCHEDULE_PD,
+                        day_type_indices,
+                        tuple(
+                            (id(day_type_hourly_values), start, end)
+                            for day_type_hourly_values, start, end in week_ranges
+                        ),
+                    ),
+                    expand_hourly_values,
+                )
 
             elif ann_sch_type == BDL_ScheduleTypes.RESET_TEMP:
                 outdoor_high_for_loop_supply_reset_temperature = set()
                 outdoor_low_for_loop_supply_reset_temperature = set()
                 loop_supply_temperature_at_outdoor_high = set()
                 loop_supply_temperature_at_outdoor_low = set()
-                for day_index, day_type in enumerate(proj_calendar.values()):
-                    # Check if the index is a change point. If so, continue to the next weekly schedule index
-                    if day_index in schedule_change_indices and day_index != LAST_DAY:
-                        wk_sch_index += 1
-
+                for wk_sch_index, start, end in self.get_week_schedule_ranges(
+                    schedule_change_indices
+                ):
                     wk_schedule_pd = self.rmd.bdl_obj_instances[
                         week_schedules[wk_sch_index]
                     ]
-                    outdoor_high_for_loop_supply_reset_temperature.add(
-                        wk_schedule_pd.day_type_outside_highs[day_type - 1]
-                    )
-                    outdoor_low_for_loop_supply_reset_temperature.add(
-                        wk_schedule_pd.day_type_outside_lows[day_type - 1]
-                    )
-                    loop_supply_temperature_at_outdoor_high.add(
-                        wk_schedule_pd.day_type_supply_highs[day_type - 1]
-                    )
-                    loop_supply_temperature_at_outdoor_low.add(
-                        wk_schedule_pd.day_type_supply_lows[day_type - 1]
-                    )
+                    for day_type_index in set(day_type_indices[start:end]):
+                        outdoor_high_for_loop_supply_reset_temperature.add(
+                            wk_schedule_pd.day_type_outside_highs[day_type_index]
+                        )
+                        outdoor_low_for_loop_supply_reset_temperature.add(
+                            wk_schedule_pd.day_type_outside_lows[day_type_index]
+                        )
+                        loop_supply_temperature_at_outdoor_high.add(
+                            wk_schedule_pd.day_type_supply_highs[day_type_index]
+                        )
+                        loop_supply_temperature_at_outdoor_low.add(
+                            wk_schedule_pd.day_type_supply_lows[day_type_index]
+                        )
                 if len(outdoor_high_for_loop_supply_reset_temperature) == 1:
                     self.outdoor_high_for_loop_supply_reset_temperature = (
                         outdoor_high_for_loop_supply_reset_temperature.pop()
@@ -255,6 +339,61 @@ class Schedule(BaseNode):
                         loop_supply_temperature_at_outdoor_low.pop()
                     )
 
+    def get_statistics(self):
+        """
+        Get the statistics of the hourly values. They are computed the first time they are requested, so this must not
+        be called before the hourly values are populated.
+        :return: (dict) returned by get_hourly_value_statistics(), or None if the schedule has no hourly values
+        """
+        if self.statistics is None and self.hourly_values:
+            self.statistics = get_hourly_value_statistics(self.hourly_values)
+        return self.statistics
+
+    def get_values_coincident_with(self, other_schedule) -> set:
+        """
+        Get the distinct pairs of values this schedule and another schedule have in the same hour. They are computed
+        the first time they are requested for the other schedule.
+        :param other_schedule: Schedule with hourly values
+        :return: (set) of (value, other schedule value) tuples
+        """
+        if other_schedule.u_name not in self.coincident_values:
+            self.coincident_values[other_schedule.u_name] = get_coincident_values(
+                self.hourly_values, other_schedule.hourly_values
+            )
+        return self.coincident_values[other_schedule.u_name]
+
+    @staticmethod
+    def set_annual_calendar(calendar: dict):
+        """
+        Set the calendar shared by all schedules and compile it for expanding schedules.
+        :param calendar: dictionary mapping "month/day" to a day type, returned by `generate_year_calendar()`
+        :return: None
+        """
+        Schedule.annual_calendar = calendar
+        Schedule.calendar_day_type_indices, Schedule.calendar_date_ordinals = (
+            schedule_funcs.compile_calendar(calendar)
+        )
+
+    def get_week_schedule_ranges(self, schedule_change_indices: set) -> list:
+        """
+        Get the range of days of the year that each week schedule applies to.
+        :param schedule_change_indices: set of day indices where the next week schedule begins
+        :return: list of (week schedule index, first day index, day index after the last day) tuples
+        """
+        num_days = len(self.calendar_day_type_indices)
+        change_points = sorted(
+            day_index
+            for day_index in schedule_change_indices
+            if day_index < num_days and day_index != LAST_DAY
+        )
+        ranges = []
+        start = 0
+        for wk_sch_index, change_point in enumerate(change_points):
+            ranges.append((wk_sch_index, start, change_point))
+            start = change_point
+        ranges.append((len(change_points), start, num_days))
+        return ranges
+
     def populate_data_group(self):
         """Populate schema structure for schedule object."""
         self.schedule_data_structure = {
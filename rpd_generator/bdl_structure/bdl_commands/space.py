@@ -16,6 +16,8 @@ class Space(ChildNode, ParentNode):
     """Space object in the tree."""
 
     bdl_command = BDL_Commands.SPACE
+    # Spaces belong to a floor and set the volume of their zone
+    command_dependencies = [BDL_Commands.FLOOR, BDL_Commands.ZONE]
 
     infiltration_algorithm_map = {
         BDL_InfiltrationAlgorithmOptions.NONE: "None",
@@ -66,6 +66,18 @@ class System(ParentNode):
     """System object in the tree."""
 
     bdl_command = BDL_Commands.SYSTEM
+    # Systems read the fuel type of their meter, the energy sources of the plant equipment on their loops, and their fan schedules
+    command_dependencies = [
+        BDL_Commands.FUEL_METER,
+        BDL_Commands.STEAM_METER,
+        BDL_Commands.SCHEDULE_PD,
+        BDL_Commands.CIRCULATION_LOOP,
+        BDL_Commands.BOILER,
+        BDL_Commands.CHILLER,
+        BDL_Commands.DW_HEATER,
+    ]
+    # Systems update the heating and cooling type maps they share
+    populate_in_file_order = True
     zonal_system_types = [
         BDL_SystemTypes.UHT,
         BDL_SystemTypes.UVT,
@@ -563,7 +575,9 @@ class System(ParentNode):
             self.populate_air_energy_recovery()
 
     def get_output_requests(self):
-        """Get the output requests for the system dependent on various system component types."""
+        """Get the output requests for the system dependent on various system component types. The zonal requests
+        depend on is_zonal_system and output_cool_type, which are only set during population, so they are not included
+        in the model-wide prefetch."""
         requests = {
             "Outside Air Ratio": (2201005, self.u_name, ""),
             "Cooling Capacity": (2201006, self.u_name, ""),
@@ -1465,21 +1479,22 @@ class System(ParentNode):
             min_oa_sch = self.rmd.bdl_obj_instances.get(min_oa_sch_name)
             if not min_oa_sch:
                 return FanSystemOperationOptions.CONTINUOUS
+            min_oa_sch_statistics = min_oa_sch.get_statistics()
             if not fan_sch:  # (and min_oa_sch)
-                min_oa_sch_values = min_oa_sch.hourly_values
-                if min_oa_sch_values:
-                    for i in range(len(min_oa_sch_values)):
-                        if min_oa_sch_values[i] == 0:
-                            return FanSystemOperationOptions.CYCLING
+                if min_oa_sch_statistics:
+                    if min_oa_sch_statistics["has_zero"]:
+                        return FanSystemOperationOptions.CYCLING
                     return FanSystemOperationOptions.CONTINUOUS
                 return FanSystemOperationOptions.CYCLING
             if fan_sch and min_oa_sch:
-                fan_sch_values = fan_sch.hourly_values
-                min_oa_sch_values = min_oa_sch.hourly_values
-                if fan_sch_values and min_oa_sch_values:
-                    for i in range(len(fan_sch_values)):
-                        if min_oa_sch_values[i] == 0 and fan_sch_values[i] in (1, -999):
-                            return FanSystemOperationOptions.CYCLING
+                if fan_sch.hourly_values and min_oa_sch_statistics:
+                    if min_oa_sch_statistics["has_zero"] and any(
+                        min_oa_value == 0 and fan_value in (1, -999)
+                        for fan_value, min_oa_value in fan_sch.get_values_coincident_with(
+                            min_oa_sch
+                        )
+                    ):
+                        return FanSystemOperationOptions.CYCLING
                     return FanSystemOperationOptions.CONTINUOUS
 
         elif self.keyword_value_pairs.get(BDL_SystemKeywords.TYPE) in [
@@ -32,6 +32,8 @@ class MasterMeters(BaseDefinition):
 class FuelMeter(BaseDefinition):
 
     bdl_command = BDL_Commands.FUEL_METER
+    # Master meters assign fuel meters to end uses
+    command_dependencies = [BDL_Commands.MASTER_METERS]
 
     fuel_type_map = {
         BDL_FuelTypes.NATURAL_GAS: EnergySourceOptions.NATURAL_GAS,
@@ -61,6 +63,8 @@ class FuelMeter(BaseDefinition):
 class ElecMeter(BaseDefinition):
 
     bdl_command = BDL_Commands.ELEC_METER
+    # Master meters assign electric meters to end uses
+    command_dependencies = [BDL_Commands.MASTER_METERS]
 
     def __init__(self, u_name, rmd):
         super().__init__(u_name, rmd)
@@ -99,6 +103,8 @@ class SteamMeter(BaseNode):
     """Steam Meter object in the tree."""
 
     bdl_command = BDL_Commands.STEAM_METER
+    # Master meters assign steam meters to end uses
+    command_dependencies = [BDL_Commands.MASTER_METERS]
 
     def __init__(self, u_name, rmd):
         super().__init__(u_name, rmd)
@@ -148,6 +154,8 @@ class CHWMeter(BaseNode):
     """Chiled Water Meter object in the tree."""
 
     bdl_command = BDL_Commands.CHW_METER
+    # Steam meters come first so their external fluid sources are listed first
+    command_dependencies = [BDL_Commands.MASTER_METERS, BDL_Commands.STEAM_METER]
 
     def __init__(self, u_name, rmd):
         super().__init__(u_name, rmd)
@@ -26,6 +26,13 @@ class Window(ChildNode):
     """Window object in the tree."""
 
     bdl_command = BDL_Commands.WINDOW
+    # Windows belong to a wall and read the building azimuth and their glass type
+    command_dependencies = [
+        "BUILD-PARAMETERS",
+        BDL_Commands.GLASS_TYPE,
+        BDL_Commands.EXTERIOR_WALL,
+        BDL_Commands.INTERIOR_WALL,
+    ]
 
     def __init__(self, u_name, parent, rmd):
         super().__init__(u_name, parent, rmd)
@@ -25,6 +25,8 @@ class Zone(ChildNode):
     """Zone object in the tree."""
 
     bdl_command = BDL_Commands.ZONE
+    # Systems create the zonal systems of their zones
+    command_dependencies = [BDL_Commands.SYSTEM]
 
     heat_source_map = {
         BDL_ZoneHeatSourceOptions.NONE: None,
@@ -8,3 +8,7 @@ class ChildNode(BaseNode):
         super().__init__(u_name, rmd)
         self.parent = parent
         parent.add_child(self)
+
+    def get_populate_dependencies(self):
+        """Return the u_names of specific objects that must populate before this object."""
+        return [self.parent.u_name]
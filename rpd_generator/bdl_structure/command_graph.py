@@ -0,0 +1,104 @@
+import heapq
+from concurrent.futures import ThreadPoolExecutor
+
+
+def get_command_order(bdl_command_dict: dict) -> list:
+    """
+    Order BDL commands so that every command comes after the commands it depends on. Commands whose dependencies are
+    all placed are taken in alphabetical order, so the order is the same on every run.
+    :param bdl_command_dict: (dict) BDL command (str): class with a command_dependencies attribute
+    :return: (list) BDL commands in the order their objects are created and populated
+    """
+    commands = {
+        command: command_class
+        for command, command_class in bdl_command_dict.items()
+        if command is not None
+    }
+    dependents = {command: [] for command in commands}
+    dependency_counts = {}
+    for command, command_class in commands.items():
+        dependencies = {
+            dependency
+            for dependency in command_class.command_dependencies
+            if dependency in commands
+        }
+        dependency_counts[command] = len(dependencies)
+        for dependency in dependencies:
+            dependents[dependency].append(command)
+
+    ready = [command for command, count in dependency_counts.items() if count == 0]
+    heapq.heapify(ready)
+    command_order = []
+    while ready:
+        command = heapq.heappop(ready)
+        command_order.append(command)
+        for dependent in dependents[command]:
+            dependency_counts[dependent] -= 1
+            if dependency_counts[dependent] == 0:
+                heapq.heappush(ready, dependent)
+
+    if len(command_order) < len(commands):
+        cycle = sorted(command for command, count in dependency_counts.items() if count)
+        raise ValueError(f"BDL command dependencies form a cycle: {', '.join(cycle)}")
+    return command_order
+
+
+def get_populate_waves(obj_instances: list) -> list:
+    """
+    Group BDL objects into waves that can be populated one after the other. An object is placed in the wave after the
+    last wave holding an object it depends on: an object of one of its class's command_dependencies, a specific object
+    returned by its get_populate_dependencies(), or, for classes populated in file order, the object of the same
+    command before it.
+    :param obj_instances: (list) BDL objects in the order they were created, which follows get_command_order()
+    :return: (list) waves, each a list of objects in the order they were created
+    """
+    waves = []
+    # u_name: wave index of every object placed so far
+    object_waves = {}
+    # BDL command: index of the last wave holding an object of the command
+    command_waves = {}
+
+    for obj in obj_instances:
+        obj_class = type(obj)
+        wave = 0
+        for command in obj_class.command_dependencies:
+            if command in command_waves:
+                wave = max(wave, command_waves[command] + 1)
+        for u_name in obj.get_populate_dependencies():
+            if u_name in object_waves:
+                wave = max(wave, object_waves[u_name] + 1)
+        if obj_class.populate_in_file_order and obj.bdl_command in command_waves:
+            wave = max(wave, command_waves[obj.bdl_command] + 1)
+
+        if wave == len(waves):
+            waves.append([])
+        waves[wave].append(obj)
+        object_waves[obj.u_name] = wave
+        command_waves[obj.bdl_command] = max(
+            wave, command_waves.get(obj.bdl_command, 0)
+        )
+    return waves
+
+
+def populate_waves(waves: list, threads: int = 1):
+    """
+    Populate the data elements of BDL objects wave by wave. Each wave is populated once the wave before it is done.
+    :param waves: (list) waves of BDL objects from get_populate_waves()
+    :param threads: (int) number of threads the objects of a wave are populated on; 1 populates them in order
+    :return: None
+    """
+    if threads <= 1:
+        for wave in waves:
+            for obj in wave:
+                obj.populate_data_elements()
+        return
+
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        for wave in waves:
+            # Consuming the results waits for the wave and raises the first exception from it
+            for _ in executor.map(_populate_data_elements, wave):
+                pass
+
+
+def _populate_data_elements(obj):
+    obj.populate_data_elements()
@@ -17,7 +17,26 @@ class Config:
     EQUEST_INSTALL_PATH = None
     DOE22_DATA_PATH = None
     DOE23_DATA_PATH = None
-    ACTIVE_RULESET = RULESETS["ASHRAE 90.1-2019"]
+    # Cache simulation results in a file next to the simulation output files so repeat runs skip the D2Result.dll
+    USE_RESULT_CACHE = False
+    # Spool parsed BDL commands to temporary files while reading large models instead of holding them all in memory
+    SPOOL_BDL_COMMANDS = False
+    # Threads to fetch simulation output on; with more than 1, output is fetched while BDL objects populate and each
+    # object waits only for the results it reads
+    OUTPUT_FETCH_THREADS = 1
+    # Make one result request at a time even when fetching on several threads, in case D2Result.dll is not thread-safe
+    SERIALIZE_RESULT_CALLS = False
+    # Threads to populate BDL objects that do not depend on one another on; 1 populates every object in turn
+    POPULATE_THREADS = 1
+    # Spaces to indent the RPD JSON file by; None writes compact JSON, which is smaller and faster to encode
+    JSON_INDENT = 4
+    # Significant digits to round floats in the RPD JSON file to, e.g. 6 for hourly schedule values; None keeps them all
+    JSON_SIGNIFICANT_DIGITS = None
+    ACTIVE_RULESET = Ruleset(
+        name="ASHRAE 90.1-2019",
+        enum_filename=RULESETS["ASHRAE 90.1-2019"]["enum_filename"],
+        output_filename=RULESETS["ASHRAE 90.1-2019"]["output_filename"],
+    )
     SchemaEnums.update_schema_enum(ACTIVE_RULESET)
 
     @staticmethod
@@ -29,85 +29,179 @@ class ModelInputReader:
     """Model input reader class."""
 
     bdl_command_dict = None
-    known_units = [
-        "",
-        "F",
-        "F (DELTA)",
-        "KNOTS",
-        "FT",
-        "IN",
-        "DEGREES",
-        "HR-SQFT-F /BTU",
-        "BTU/HR-FT-F",
-        "LB/CUFT",
-        "BTU/LB-F",
-        "BTU/HR-SQFT-F",
-        "FRAC.OR MULT.",
-        "SQFT",
-        "CUFT",
-        "CFM/SQFT",
-        "BTU/HR/PERSON",
-        "W/SQFT",
-        "BTU/HR",
-        "KW",
-        "LB/SQFT",
-        "CFM",
-        "FOOTCANDLES",
-        "LUMEN / WATT",
-        "BTU/BTU",
-        "BTU/UNIT",
-        "LBS/KW",
-        "$/UNIT",
-        "GPM",
-        "PERCENT",
-        "GAL/MIN",
-        "MBTU/HR",
-        "BTU/HR-F",
-        "KW/CFM",
-        "IN-WATER",
-        "CFM/TON",
-        "HP",
-        "R",
-        "HOURS",
-        "GALLONS/MIN/TON",
-        "GAL",
-        "KW/TON",
-        "BTU/LB",
-    ]
+    known_units = frozenset(
+        [
+            "",
+            "F",
+            "F (DELTA)",
+            "KNOTS",
+            "FT",
+            "IN",
+            "DEGREES",
+            "HR-SQFT-F /BTU",
+            "BTU/HR-FT-F",
+            "LB/CUFT",
+            "BTU/LB-F",
+            "BTU/HR-SQFT-F",
+            "FRAC.OR MULT.",
+            "SQFT",
+            "CUFT",
+            "CFM/SQFT",
+            "BTU/HR/PERSON",
+            "W/SQFT",
+            "BTU/HR",
+            "KW",
+            "LB/SQFT",
+            "CFM",
+            "FOOTCANDLES",
+            "LUMEN / WATT",
+            "BTU/BTU",
+            "BTU/UNIT",
+            "LBS/KW",
+            "$/UNIT",
+            "GPM",
+            "PERCENT",
+            "GAL/MIN",
+            "MBTU/HR",
+            "BTU/HR-F",
+            "KW/CFM",
+            "IN-WATER",
+            "CFM/TON",
+            "HP",
+            "R",
+            "HOURS",
+            "GALLONS/MIN/TON",
+            "GAL",
+            "KW/TON",
+            "BTU/LB",
+        ]
+    )
+    # The keyword of a definition line is the second field when the line is split on runs of 2 or more spaces
+    keyword_split = re.compile(r" {2,}").split
 
     def __init__(self):
         ModelInputReader.bdl_command_dict = _get_bdl_commands_for_rpd()
         self.current_parent_floor = None
         self.current_parent_space = None
         self.current_parent = None
+        self.doe2_version = None
 
     def read_input_bdl_file(self, bdl_file_path: str):
         """
         Read BDL input file and return a dictionary of object instances.
 
         :param bdl_file_path: Path to the BDL file.
-        :return: A dictionary with BDL commands as keys and lists of .
+        :return: A dictionary with the DOE-2 version, "file_commands" with BDL commands as keys and lists of command
+        dictionaries as values, and "name_index" with unique names as keys and their command dictionaries as values.
         """
+        file_commands = {}
+        name_index = {}
+        # Commands are never removed, so a "DATA FOR" block can refer to any command read before it
+        open_commands = {}
+
+        for command, command_dict, block_complete in self._parse_bdl_file(
+            bdl_file_path, open_commands
+        ):
+            if not block_complete:
+                file_commands.setdefault(command, []).append(command_dict)
+                name_index.setdefault(command_dict["unique_name"], command_dict)
+
+        return {
+            "doe2_version": self.doe2_version,
+            "file_commands": file_commands,
+            "name_index": name_index,
+        }
+
+    def iter_input_bdl_commands(self, bdl_file_path: str):
+        """
+        Read BDL input file and yield each command as soon as its "DATA FOR" block is complete, so the whole model
+        never has to be held in memory. Commands without a "DATA FOR" block are yielded once the file has been read.
+        The DOE-2 version is available from the doe2_version attribute as soon as the version line has been read.
+
+        "DATA FOR" blocks are not always in the same order as the command lines, so each command is yielded with the
+        position of its command line in the file to allow the order of read_input_bdl_file() to be restored.
+
+        :param bdl_file_path: Path to the BDL file.
+        :return: Generator of (command, command dictionary, position) tuples.
+        """
+        open_commands = {}
+
+        for command, command_dict, block_complete in self._parse_bdl_file(
+            bdl_file_path, open_commands
+        ):
+            if not block_complete:
+                continue
+
+            unique_name = command_dict["unique_name"]
+            _, open_command_dict, position = open_commands.get(
+                unique_name, (None, None, None)
+            )
+            if open_command_dict is command_dict:
+                del open_commands[unique_name]
+                yield command, command_dict, position
+
+        for command, command_dict, position in list(open_commands.values()):
+            yield command, command_dict, position
+        open_commands.clear()
+
+    def _parse_bdl_file(self, bdl_file_path: str, open_commands: dict):
+        """
+        Parse a BDL input file line by line.
+
+        Each line is classified once by its first column. Lines written by BDLCIO32 for keyword values and notes
+        (including "DATA FOR" lines) begin with "-"; command lines, library entries, and the DOE-2 version line do not.
+
+        :param bdl_file_path: Path to the BDL file.
+        :param open_commands: Dictionary of unique names and (command, command dictionary, position) tuples that
+        "DATA FOR" blocks are matched to, where position counts the commands opened before it in the file. New commands
+        are added to it; callers may remove commands whose block is complete.
+        :return: Generator of (command, command dictionary, block_complete) tuples. Each command is yielded with
+        block_complete False when its command line is read and with block_complete True when its "DATA FOR" block ends.
+        """
+        self.doe2_version = None
 
         with open(bdl_file_path, "r") as bdl_file:
-            doe2_version = None
-            file_commands = {}
+            # Per-command sets of (unique name, parent) already read
+            seen_commands = {}
+            # Number of commands opened so far, which is the position of the next command in the file
+            num_opened = 0
 
-            active_command_dict = None
+            active_command, active_command_dict = None, None
             record_data_for = False
 
             for line in bdl_file:
-                if not line.strip():
+                if line.isspace():
                     continue
 
-                if "JJHirsch DOE-2 Version:" in line:
-                    doe2_version = line.split(":")[1].split()[0].strip()
+                if line[0] == "-":
+                    if "DATA FOR" in line:
+                        if record_data_for and active_command_dict is not None:
+                            yield active_command, active_command_dict, True
+                        record_data_for = True
+                        active_command, active_command_dict = (
+                            self._find_data_for_command(
+                                line, active_command, active_command_dict, open_commands
+                            )
+                        )
+
+                    elif (
+                        record_data_for
+                        and active_command_dict is not None
+                        and " = " in line
+                    ):
+                        keyword, value, units = self._parse_definition_line(line)
+                        self._add_keyword_value(active_command_dict, keyword, value)
                     continue
 
-                if record_data_for and line[0] != "-":
+                if record_data_for:
                     record_data_for = False
+                    if active_command_dict is not None:
+                        yield active_command, active_command_dict, True
 
-                if '" = ' in line or "$LIBRARY-ENTRY" in line:
+                if "JJHirsch DOE-2 Version:" in line:
+                    self.doe2_version = line.split(":")[1].split()[0].strip()
+
+                elif '" = ' in line or "$LIBRARY-ENTRY" in line:
                     unique_name, command = (
                         self._parse_command_line(line)
                         if '" = ' in line
@@ -117,51 +211,67 @@ class ModelInputReader:
                         command_dict = {"unique_name": unique_name}
                         self._track_current_parents(command, command_dict)
                         command_dict = self._set_parent(command, command_dict)
-                        if command_dict not in file_commands.setdefault(command, []):
-                            file_commands[command].append(command_dict)
-                        active_command_dict = command_dict
-                    continue
+                        command_key = (unique_name, command_dict.get("parent"))
+                        seen = seen_commands.setdefault(command, set())
+                        if command_key in seen:
+                            active_command, active_command_dict, _ = open_commands.get(
+                                unique_name, (None, None, None)
+                            )
+                        else:
+                            seen.add(command_key)
+                            open_commands.setdefault(
+                                unique_name, (command, command_dict, num_opened)
+                            )
+                            num_opened += 1
+                            yield command, command_dict, False
+                            active_command, active_command_dict = command, command_dict
 
                 elif "DATA FOR" in line:
                     record_data_for = True
-                    obj_u_name = line.split("DATA FOR ")[1].strip()
-                    if (
-                        active_command_dict is None
-                        or obj_u_name != active_command_dict["unique_name"]
-                    ):
-                        active_command_dict = next(
-                            (
-                                cmd_dict
-                                for cmd_list in file_commands.values()
-                                for cmd_dict in cmd_list
-                                if cmd_dict["unique_name"] == obj_u_name
-                            ),
-                            None,
-                        )
-                    continue
+                    active_command, active_command_dict = self._find_data_for_command(
+                        line, active_command, active_command_dict, open_commands
+                    )
 
-                elif (
-                    record_data_for
-                    and " = " in line
-                    and active_command_dict is not None
-                ):
-                    keyword, value, units = self._parse_definition_line(line)
+            if record_data_for and active_command_dict is not None:
+                yield active_command, active_command_dict, True
 
-                    if keyword in active_command_dict and isinstance(
-                        active_command_dict[keyword], list
-                    ):
-                        active_command_dict[keyword].append(value)
+    @staticmethod
+    def _find_data_for_command(
+        line, active_command, active_command_dict, open_commands
+    ):
+        """
+        Find the command dictionary that a "DATA FOR" line refers to.
 
-                    elif keyword in active_command_dict:
-                        active_command_dict[keyword] = [
-                            active_command_dict[keyword],
-                            value,
-                        ]
+        :param line: Line to be parsed.
+        :param active_command: Command that values are currently being recorded to.
+        :param active_command_dict: Command dictionary that values are currently being recorded to.
+        :param open_commands: Dictionary of unique names and (command, command dictionary, position) tuples.
+        :return: tuple: The command and command dictionary with the unique name from the line, or (None, None).
+        """
+        obj_u_name = line.split("DATA FOR ")[1].strip()
+        if active_command_dict is not None and (
+            obj_u_name == active_command_dict["unique_name"]
+        ):
+            return active_command, active_command_dict
+        return open_commands.get(obj_u_name, (None, None, None))[:2]
 
-                    else:
-                        active_command_dict[keyword] = value
+    @staticmethod
+    def _add_keyword_value(command_dict, keyword, value):
+        """
+        Add a keyword value to a command dictionary. Repeated keywords collect their values in a list.
 
-            return {"doe2_version": doe2_version, "file_commands": file_commands}
+        :param command_dict: Command dictionary to add the value to.
+        :param keyword: Keyword parsed from a definition line.
+        :param value: Value parsed from a definition line.
+        :return: None
+        """
+        existing_value = command_dict.get(keyword)
+        if existing_value is None and keyword not in command_dict:
+            command_dict[keyword] = value
+        elif isinstance(existing_value, list):
+            existing_value.append(value)
+        else:
+            command_dict[keyword] = [existing_value, value]
 
     @staticmethod
     def _parse_command_line(line):
@@ -196,19 +306,17 @@ class ModelInputReader:
         :return: tuple: Keyword and value extracted from the line.
         """
         potential_units = line[104:].strip()
-        has_expected_whitespace = line[75:80] == "     " and (
-            len(line) < 105 or line[103] == " "
-        )
-        if potential_units in self.known_units and has_expected_whitespace:
-            parts, units = line[:104].split(" = "), line[104:].strip()
-            keyword = re.split(r" {2,}", parts[0])[1].strip()
-            value = parts[1].strip()
-            return keyword, value, units
+        if (
+            potential_units in self.known_units
+            and line[75:80] == "     "
+            and (len(line) < 105 or line[103] == " ")
+        ):
+            parts, units = line[:104].split(" = ", 2), potential_units
         else:
-            parts = line.split(" = ")
-            keyword = re.split(r" {2,}", parts[0])[1].strip()
-            value = parts[1].strip()
-            return keyword, value, None
+            parts, units = line.split(" = ", 2), None
+        keyword = self.keyword_split(parts[0], 2)[1].strip()
+        value = parts[1].strip()
+        return keyword, value, units
 
     def _track_current_parents(self, command, command_dict):
         """
@@ -1,7 +1,13 @@
 import ctypes
 import os
+import threading
 from pathlib import Path
 
+from rpd_generator.doe2_file_readers.output_request_planner import (
+    MAX_MRTS_PER_CALL,
+    get_file_type,
+)
+
 
 # noinspection PyTypeChecker
 class MRTArray(ctypes.Structure):
@@ -13,9 +19,6 @@ class MRTArray(ctypes.Structure):
     ]
 
 
-NHR_DICT = None
-
-
 def read_nhr_list(file_path):
     nhr_dict = {}
     with open(file_path, "r") as file:
@@ -27,13 +30,6 @@ def read_nhr_list(file_path):
     return nhr_dict
 
 
-def get_nhr_dict(nhr_list_path):
-    global NHR_DICT
-    if NHR_DICT is None:
-        NHR_DICT = read_nhr_list(nhr_list_path)
-    return NHR_DICT
-
-
 """
 
 Get Multiple Result
@@ -58,7 +54,197 @@ pMRTs: Pointer to an array of MultResultsType structures:
 """
 
 
-# noinspection PyTypeChecker, PyCallingNonCallable
+class ResultReaderSession:
+    """
+    Result reader backed by the eQUEST D2Result.dll. The library is loaded once, the function prototypes are bound
+    once, and the request and value buffers are allocated once and reused for every call.
+
+    Any object with the same interface (nhr_dict, get_multiple_results and get_string_result) can be used in place of
+    this class by passing its factory to set_result_reader_factory().
+    """
+
+    # noinspection PyTypeChecker
+    def __init__(self, d2_result_dll: str, doe2_data_dir: str):
+        """
+        :param d2_result_dll: (string) path to user's eQUEST D2Result.dll file included with installation files
+        :param doe2_data_dir: (string) path to the data directory of the appropriate version of DOE-2 (e.g. DOE-2.2 or DOE-2.3)
+        """
+        if not os.path.exists(d2_result_dll):
+            raise FileNotFoundError(f"D2Result.dll not found at {d2_result_dll}")
+
+        self.d2_result_dll = ctypes.CDLL(d2_result_dll)
+        self.doe2_dir = (str(Path(doe2_data_dir) / "DOE23") + "\\").encode("utf-8")
+        self.nhr_dict = read_nhr_list(
+            str(Path(doe2_data_dir) / "DOE23" / "NHRList.txt")
+        )
+
+        self.multiple_result_dll = self.d2_result_dll.D2R_GetMultipleResult
+        self.multiple_result_dll.argtypes = [
+            ctypes.c_char_p,  # pszDOE2Dir
+            ctypes.c_char_p,  # pszFileName
+            ctypes.c_int,  # iFileType
+            ctypes.POINTER(ctypes.c_float),  # pfData
+            ctypes.c_int,  # iMaxValues
+            ctypes.c_int,  # iNumMRTs
+            ctypes.POINTER(MRTArray),  # pMRTs
+        ]
+        self.multiple_result_dll.restype = ctypes.c_long
+
+        self.single_result_dll = self.d2_result_dll.D2R_GetSingleResult
+        self.single_result_dll.argtypes = [
+            ctypes.c_char_p,  # pszDOE2Dir
+            ctypes.c_char_p,  # pszFileName
+            ctypes.c_int,  # iEntryID
+            ctypes.POINTER(ctypes.c_char),  # pfData
+            ctypes.c_int,  # iMaxValues
+            ctypes.c_char * 40,  # pszReportKey
+            ctypes.c_char * 40,  # pszRowKey
+        ]
+        self.single_result_dll.restype = ctypes.c_long
+
+        # Reusable buffers, one set per thread so that calls made from several threads do not overwrite each other
+        self.thread_buffers = threading.local()
+
+    def get_buffers(self):
+        """
+        Get the request and value buffers of the calling thread, allocating them on the thread's first call.
+        :return: namespace with mrt_array, pf_data, str_data, report_key_arr and row_key_arr buffers
+        """
+        buffers = self.thread_buffers
+        if not hasattr(buffers, "mrt_array"):
+            buffers.mrt_array = (MRTArray * MAX_MRTS_PER_CALL)()
+            buffers.pf_data = (ctypes.c_float * MAX_MRTS_PER_CALL)()
+            buffers.str_data = ctypes.create_string_buffer(256)
+            buffers.report_key_arr = (ctypes.c_char * 40)()
+            buffers.row_key_arr = (ctypes.c_char * 40)()
+        return buffers
+
+    # noinspection PyTypeChecker, PyCallingNonCallable
+    def get_multiple_results(self, project_fname: str, request_array: list) -> list:
+        """
+        Get Multiple Results from the simulation output files
+        :param project_fname: (string) path to project with project name NOT INCLUDING FILE EXTENSION
+        :param request_array: (list) list of entry_id: (int) from NHRList.txt corresponding to the value to retrieve,
+        report_key: (string) to use when RI > 0 and when value to retrieve refers to a particular BDL component,
+        and row_key: (string) to use when KT > 0 and when a report has multiple row where each row provides results for a separate building component or month of the year
+        :return: list of returned values from the binary simulation output files
+        """
+        num_mrts = len(request_array)
+        if num_mrts == 0:
+            return []
+        file_type = get_file_type(request_array[0][0])
+
+        buffers = self.get_buffers()
+        if num_mrts > len(buffers.mrt_array):
+            buffers.mrt_array = (MRTArray * num_mrts)()
+        mrt_array = buffers.mrt_array
+
+        max_values: int = 0
+        for i, value_request in enumerate(request_array):
+            entry_id, report_key, row_key = value_request
+
+            mrt_array[i].entry_id = entry_id
+            mrt_array[i].return_value = 0
+            mrt_array[i].psz_report_key = report_key.encode("utf-8")
+            mrt_array[i].psz_row_key = row_key.encode("utf-8")
+
+            max_values += self.nhr_dict.get(entry_id, 0)
+
+        if max_values > len(buffers.pf_data):
+            buffers.pf_data = (ctypes.c_float * max_values)()
+        else:
+            # Values the DLL does not write read as 0, not as the values of the previous call
+            ctypes.memset(
+                buffers.pf_data, 0, ctypes.sizeof(ctypes.c_float) * max_values
+            )
+
+        self.multiple_result_dll(
+            self.doe2_dir,
+            project_fname.encode("utf-8"),
+            file_type,
+            buffers.pf_data,
+            max_values,
+            num_mrts,
+            mrt_array,
+        )
+
+        return buffers.pf_data[:max_values]
+
+    # noinspection PyTypeChecker, PyCallingNonCallable
+    def get_string_result(
+        self,
+        project_fname: str,
+        entry_id: int,
+        report_key: str = "",
+        row_key: str = "",
+    ) -> str:
+        """
+        Get single result from the simulation output files expected to be a string
+        :param project_fname: (string) path to project with project name NOT INCLUDING FILE EXTENSION
+        :param entry_id: (int) id from NHRList.txt corresponding to the value to retrieve
+        :param report_key: (string) to use when RI > 0 and when value to retrieve refers to a particular BDL component
+        :param row_key: (string) to use when KT > 0 and when a report has multiple row where each row provides results for a separate building component or month of the year
+        :return: value from binary simulation output files
+        """
+        buffers = self.get_buffers()
+        buffers.str_data.value = b""
+        buffers.report_key_arr.value = report_key.encode("utf-8")
+        buffers.row_key_arr.value = row_key.encode("utf-8")
+
+        self.single_result_dll(
+            self.doe2_dir,
+            project_fname.encode("utf-8"),
+            entry_id,
+            buffers.str_data,
+            1,
+            buffers.report_key_arr,
+            buffers.row_key_arr,
+        )
+
+        # Return the string from the buffer
+        return buffers.str_data.value.decode("utf-8").strip()
+
+
+_result_reader_factory = ResultReaderSession
+_result_readers = {}
+
+
+def set_result_reader_factory(factory=None):
+    """
+    Set the backend used to retrieve results from the simulation output files. Sessions created by the previous
+    backend are discarded.
+    :param factory: (callable) called with the D2Result.dll path and the DOE-2 data directory to create a result
+    reader; None restores the default D2Result.dll backend
+    :return: None
+    """
+    global _result_reader_factory
+    _result_reader_factory = factory or ResultReaderSession
+    _result_readers.clear()
+
+
+def get_result_reader_factory():
+    """
+    Get the backend used to retrieve results from the simulation output files.
+    :return: (callable) factory passed to set_result_reader_factory(), or ResultReaderSession
+    """
+    return _result_reader_factory
+
+
+def get_result_reader(d2_result_dll: str, doe2_data_dir: str):
+    """
+    Get the result reader for a D2Result.dll path and DOE-2 data directory, creating it on first use.
+    :param d2_result_dll: (string) path to user's eQUEST D2Result.dll file included with installation files
+    :param doe2_data_dir: (string) path to the data directory of the appropriate version of DOE-2 (e.g. DOE-2.2 or DOE-2.3)
+    :return: result reader for the given paths
+    """
+    key = (d2_result_dll, doe2_data_dir)
+    result_reader = _result_readers.get(key)
+    if result_reader is None:
+        result_reader = _result_reader_factory(d2_result_dll, doe2_data_dir)
+        _result_readers[key] = result_reader
+    return result_reader
+
+
 def get_multiple_results(
     d2_result_dll: str, doe2_data_dir: str, project_fname: str, request_array: list
 ) -> list:
@@ -72,46 +258,11 @@ def get_multiple_results(
     and row_key: (string) to use when KT > 0 and when a report has multiple row where each row provides results for a separate building component or month of the year
     :return: list of returned values from the binary simulation output files
     """
-    d2_result_dll = ctypes.CDLL(d2_result_dll)
-    multiple_result_dll = d2_result_dll.D2R_GetMultipleResult
-    nhr_list_path = str(Path(doe2_data_dir) / "DOE23" / "NHRList.txt")
-    nhr_dict = get_nhr_dict(nhr_list_path)
-    doe2_data_dir = str(Path(doe2_data_dir) / "DOE23") + "\\"
-
-    num_mrts = len(request_array)
-    mrt_array = (MRTArray * num_mrts)()
-    if len(request_array) > 0:
-        file_type = int(str(request_array[0][0])[0]) - 1
-    else:
-        return []
-
-    max_values: int = 0
-    for i, value_request in enumerate(request_array):
-        entry_id, report_key, row_key = value_request
-
-        mrt_array[i].entry_id = entry_id
-        mrt_array[i].psz_report_key = report_key.encode("utf-8")
-        mrt_array[i].psz_row_key = row_key.encode("utf-8")
-
-        if entry_id in nhr_dict:
-            max_values += nhr_dict[entry_id]
-
-    pf_data = (ctypes.c_float * max_values)()
-
-    multiple_result_dll(
-        ctypes.c_char_p(doe2_data_dir.encode("utf-8")),
-        ctypes.c_char_p(project_fname.encode("utf-8")),
-        ctypes.c_int(file_type),
-        pf_data,
-        ctypes.c_int(max_values),
-        ctypes.c_int(num_mrts),
-        mrt_array,
+    return get_result_reader(d2_result_dll, doe2_data_dir).get_multiple_results(
+        project_fname, request_array
     )
 
-    return [data for data in pf_data]
-
 
-# noinspection PyTypeChecker,PyCallingNonCallable
 def get_string_result(
     d2_result_dll: str,
     doe2_dir: str,
@@ -134,40 +285,6 @@ def get_string_result(
 
     :return: value from binary simulation output files
     """
-
-    if not os.path.exists(d2_result_dll):
-        raise FileNotFoundError(f"D2Result.dll not found at {d2_result_dll}")
-
-    # Load DLL
-    d2_result_dll = ctypes.CDLL(d2_result_dll)
-    doe2_dir = str(Path(doe2_dir) / "DOE23") + "\\"
-
-    single_result_dll = d2_result_dll.D2R_GetSingleResult
-    single_result_dll.argtypes = [
-        ctypes.c_char_p,  # pszDOE2Dir
-        ctypes.c_char_p,  # pszFileName
-        ctypes.c_int,  # iEntryID
-        ctypes.POINTER(ctypes.c_char),  # pfData
-        ctypes.c_int,  # iMaxValues
-        ctypes.c_char * 40,  # pszReportKey
-        ctypes.c_char * 40,  # pszRowKey
-    ]
-    single_result_dll.restype = ctypes.c_long
-
-    pf_data = ctypes.create_string_buffer(256)
-    report_key_arr = (ctypes.c_char * 40)(*report_key.encode("utf-8"))
-    row_key_arr = (ctypes.c_char * 40)(*row_key.encode("utf-8"))
-
-    # Call the function
-    single_result_dll(
-        doe2_dir.encode("utf-8"),
-        project_fname.encode("utf-8"),
-        entry_id,
-        pf_data,
-        1,
-        report_key_arr,
-        row_key_arr,
+    return get_result_reader(d2_result_dll, doe2_dir).get_string_result(
+        project_fname, entry_id, report_key, row_key
     )
-
-    # Return the string from the buffer
-    return pf_data.value.decode("utf-8").strip()
@@ -0,0 +1,80 @@
+import logging
+
+logger = logging.getLogger(__name__)
+
+# D2R_GetMultipleResult only uses the first 12 MultResultsType structures
+MAX_MRTS_PER_CALL = 12
+
+
+def get_file_type(entry_id: int) -> int:
+    """
+    Get the simulation output file type for an NHRList.txt entry id.
+    :param entry_id: (int) id from NHRList.txt
+    :return: (int) 0 for Loads results, 1 for HVAC, 2 for Utility Rate
+    """
+    return int(str(entry_id)[0]) - 1
+
+
+class OutputRequestPlanner:
+    """
+    Collects simulation output requests from any number of BDL objects and packs them into batches for
+    D2R_GetMultipleResult. Every batch holds at most 12 requests that read from the same output file and retrieve
+    the same number of values, so requests from different objects share a single call to the DLL.
+    """
+
+    def __init__(self, nhr_dict: dict, batch_size: int = MAX_MRTS_PER_CALL):
+        """
+        :param nhr_dict: (dict) entry_id (int): number of values retrieved (int), as read from NHRList.txt
+        :param batch_size: (int) maximum number of requests in each batch
+        """
+        self.nhr_dict = nhr_dict
+        self.batch_size = batch_size
+        # Dictionary keys are used as an insertion-ordered set of request tuples
+        self.requests = {}
+        # Requests left out of the last plan, which are reported as having no value
+        self.unplanned_requests = []
+
+    def add_requests(self, requests):
+        """
+        Register output requests. Duplicate requests are only planned once.
+        :param requests: (dict or iterable) description (str): (tuple) of entry_id: (int), report_key: (str), and
+        row_key: (str), or an iterable of those tuples
+        """
+        if isinstance(requests, dict):
+            requests = requests.values()
+        for request in requests:
+            self.requests.setdefault(tuple(request), None)
+
+    def plan(self) -> list:
+        """
+        Group the registered requests by output file type and pack each group into full batches.
+        Only requests that retrieve a single value are planned; the returned values of requests retrieving multiple
+        values (e.g. monthly results) cannot be reassociated with their keys. Requests that are left out, including
+        those whose entry id is not in NHRList.txt, are logged as a warning and kept in unplanned_requests.
+        :return: (list) list of batches, each a list of (entry_id, report_key, row_key) tuples
+        """
+        file_type_groups = {}
+        self.unplanned_requests = []
+        for request in self.requests:
+            entry_id = request[0]
+            if self.nhr_dict.get(entry_id) != 1:
+                self.unplanned_requests.append(request)
+                continue
+            file_type_groups.setdefault(get_file_type(entry_id), []).append(request)
+
+        for request in self.unplanned_requests:
+            value_count = self.nhr_dict.get(request[0])
+            if value_count is None:
+                reason = "its entry id is not in NHRList.txt"
+            else:
+                reason = f"it retrieves {value_count} values"
+            logger.warning(
+                "Output request %s is not fetched because %s", request, reason
+            )
+
+        batches = []
+        for file_type in sorted(file_type_groups):
+            group = file_type_groups[file_type]
+            for i in range(0, len(group), self.batch_size):
+                batches.append(group[i : i + self.batch_size])
+        return batches
@@ -0,0 +1,177 @@
+import hashlib
+import os
+import sqlite3
+import threading
+
+OUTPUT_FILE_EXTENSIONS = [".erp", ".lrp", ".srp", ".nhk"]
+RESULT_CACHE_EXTENSION = ".d2rcache"
+
+
+def get_output_files_signature(project_fname: str) -> tuple:
+    """
+    Get the size and modification time of each simulation output file of a project.
+    :param project_fname: (string) path to project with project name NOT INCLUDING FILE EXTENSION
+    :return: (tuple) of (extension, size, modification time) for each output file that exists
+    """
+    signature = []
+    for extension in OUTPUT_FILE_EXTENSIONS:
+        try:
+            stat = os.stat(project_fname + extension)
+        except OSError:
+            continue
+        signature.append((extension, stat.st_size, stat.st_mtime_ns))
+    return tuple(signature)
+
+
+def get_output_fingerprint(project_fname: str) -> str:
+    """
+    Hash the contents of the simulation output files of a project (.erp, .lrp, .srp, .nhk).
+    :param project_fname: (string) path to project with project name NOT INCLUDING FILE EXTENSION
+    :return: (string) hex digest that changes whenever any of the output files change
+    """
+    sha256 = hashlib.sha256()
+    for extension in OUTPUT_FILE_EXTENSIONS:
+        file_path = project_fname + extension
+        if not os.path.exists(file_path):
+            continue
+        sha256.update(extension.encode("utf-8"))
+        with open(file_path, "rb") as output_file:
+            for block in iter(lambda: output_file.read(1 << 20), b""):
+                sha256.update(block)
+    return sha256.hexdigest()
+
+
+class ResultCache:
+    """
+    SQLite cache of values retrieved from the simulation output files. Values are keyed by the fingerprint of the
+    output files and the (entry_id, report_key, row_key) request tuple, so a cache is only used while the simulation
+    output it was built from is unchanged. The cache file does not depend on eQUEST or the D2Result.dll and can be
+    read on any platform.
+    """
+
+    def __init__(self, cache_path: str, fingerprint: str):
+        """
+        :param cache_path: (string) path to the cache file, created if it does not exist
+        :param fingerprint: (string) fingerprint of the simulation output files returned by get_output_fingerprint()
+        """
+        self.cache_path = cache_path
+        self.fingerprint = fingerprint
+        self.lock = threading.Lock()
+        self.connection = sqlite3.connect(cache_path, check_same_thread=False)
+        self.connection.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS results (
+                fingerprint TEXT, entry_id INTEGER, report_key TEXT, row_key TEXT, value REAL,
+                PRIMARY KEY (fingerprint, entry_id, report_key, row_key)
+            );
+            CREATE TABLE IF NOT EXISTS string_results (
+                fingerprint TEXT, entry_id INTEGER, report_key TEXT, row_key TEXT, value TEXT,
+                PRIMARY KEY (fingerprint, entry_id, report_key, row_key)
+            );
+            """
+        )
+        # Results from previous simulation output can never be used again
+        for table in ["results", "string_results"]:
+            self.connection.execute(
+                f"DELETE FROM {table} WHERE fingerprint != ?", (fingerprint,)
+            )
+        self.connection.commit()
+
+        self.results = {
+            (entry_id, report_key, row_key): value
+            for entry_id, report_key, row_key, value in self.connection.execute(
+                "SELECT entry_id, report_key, row_key, value FROM results"
+            )
+        }
+        self.string_results = {
+            (entry_id, report_key, row_key): value
+            for entry_id, report_key, row_key, value in self.connection.execute(
+                "SELECT entry_id, report_key, row_key, value FROM string_results"
+            )
+        }
+
+    def get_results(self, requests) -> dict:
+        """
+        Get the cached values of output requests.
+        :param requests: (iterable) of (tuple) entry_id: (int), report_key: (str), and row_key: (str)
+        :return: (dict) request (tuple): value (float or None when the simulation output had no value) for every
+        request found in the cache
+        """
+        return {
+            request: self.results[request]
+            for request in requests
+            if request in self.results
+        }
+
+    def add_results(self, results: dict):
+        """
+        Add values retrieved from the simulation output to the cache.
+        :param results: (dict) request (tuple): value (float or None)
+        :return: None
+        """
+        with self.lock:
+            self.results.update(results)
+            self.connection.executemany(
+                "INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?)",
+                [
+                    (self.fingerprint, *request, value)
+                    for request, value in results.items()
+                ],
+            )
+            self.connection.commit()
+
+    def get_string_result(self, request: tuple) -> str | None:
+        """
+        Get the cached value of a string output request.
+        :param request: (tuple) entry_id: (int), report_key: (str), and row_key: (str)
+        :return: (str) cached value, or None if the request is not cached
+        """
+        return self.string_results.get(request)
+
+    def add_string_result(self, request: tuple, value: str):
+        """
+        Add a string value retrieved from the simulation output to the cache.
+        :param request: (tuple) entry_id: (int), report_key: (str), and row_key: (str)
+        :param value: (str) value retrieved from the simulation output
+        :return: None
+        """
+        with self.lock:
+            self.string_results[request] = value
+            self.connection.execute(
+                "INSERT OR REPLACE INTO string_results VALUES (?, ?, ?, ?, ?)",
+                (self.fingerprint, *request, value),
+            )
+            self.connection.commit()
+
+    def close(self):
+        self.connection.close()
+
+
+_result_caches = {}
+
+
+def get_result_cache(project_fname: str) -> ResultCache:
+    """
+    Get the result cache stored next to a project's simulation output files. The output files are only hashed again
+    when their size or modification time changes.
+    :param project_fname: (string) path to project with project name NOT INCLUDING FILE EXTENSION
+    :return: ResultCache for the current simulation output of the project
+    """
+    signature = get_output_files_signature(project_fname)
+    cached_signature, result_cache = _result_caches.get(project_fname, (None, None))
+    if result_cache is None or cached_signature != signature:
+        if result_cache is not None:
+            result_cache.close()
+        result_cache = ResultCache(
+            project_fname + RESULT_CACHE_EXTENSION,
+            get_output_fingerprint(project_fname),
+        )
+        _result_caches[project_fname] = (signature, result_cache)
+    return result_cache
+
+
+def close_result_caches():
+    """Close every open result cache."""
+    for _, result_cache in _result_caches.values():
+        result_cache.close()
+    _result_caches.clear()
@@ -0,0 +1,333 @@
+import functools
+import json
+import os
+import threading
+from pathlib import Path
+
+from rpd_generator.doe2_file_readers import model_output_reader
+
+RECORDING_EXTENSION = ".d2rrec"
+RECORDING_VERSION = 1
+
+
+class ResultRecording:
+    """
+    Portable record of every request made to the simulation output of one project and the values returned for it.
+    Recordings are written as JSON, do not depend on eQUEST or the D2Result.dll, and can be replayed on any platform.
+    """
+
+    def __init__(self, project_name: str):
+        """
+        :param project_name: (string) path of the project relative to the recording root, without any file extension
+        """
+        self.project_name = project_name
+        # entry_id (int): number of values retrieved (int), for every entry id that was requested
+        self.nhr_dict = {}
+        # (entry_id, report_key, row_key) request (tuple): list of values returned for the request
+        self.results = {}
+        # (entry_id, report_key, row_key) request (tuple): string value returned for the request
+        self.string_results = {}
+        self.lock = threading.Lock()
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state["lock"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.lock = threading.Lock()
+
+    def add_results(self, nhr_dict: dict, request_array: list, values: list):
+        """
+        Record the values returned by a D2R_GetMultipleResult call.
+        :param nhr_dict: (dict) entry_id (int): number of values retrieved (int), as read from NHRList.txt
+        :param request_array: (list) of (tuple) entry_id: (int), report_key: (str), and row_key: (str)
+        :param values: (list) values returned for the requests, in request order
+        :return: None
+        """
+        with self.lock:
+            i = 0
+            for request in request_array:
+                request = tuple(request)
+                num_values = nhr_dict.get(request[0], 0)
+                self.nhr_dict[request[0]] = num_values
+                self.results[request] = [
+                    float(value) for value in values[i : i + num_values]
+                ]
+                i += num_values
+
+    def add_string_result(self, request: tuple, value: str):
+        """
+        Record the value returned by a D2R_GetSingleResult call.
+        :param request: (tuple) entry_id: (int), report_key: (str), and row_key: (str)
+        :param value: (str) value returned for the request
+        :return: None
+        """
+        with self.lock:
+            self.string_results[tuple(request)] = value
+
+    def save(self, file_path: str):
+        """
+        Write the recording to a JSON file.
+        :param file_path: (string) path to the recording file
+        :return: None
+        """
+        with self.lock:
+            recording = {
+                "version": RECORDING_VERSION,
+                "project": self.project_name,
+                "nhr_dict": {
+                    str(entry_id): num_values
+                    for entry_id, num_values in sorted(self.nhr_dict.items())
+                },
+                "results": [
+                    [*request, values]
+                    for request, values in sorted(self.results.items())
+                ],
+                "string_results": [
+                    [*request, value]
+                    for request, value in sorted(self.string_results.items())
+                ],
+            }
+        with open(file_path, "w") as recording_file:
+            json.dump(recording, recording_file, indent=1)
+
+    @staticmethod
+    def load(file_path: str):
+        """
+        Read a recording from a JSON file written by ResultRecording.save().
+        :param file_path: (string) path to the recording file
+        :return: ResultRecording
+        """
+        with open(file_path, "r") as recording_file:
+            recording = json.load(recording_file)
+        if recording.get("version") != RECORDING_VERSION:
+            raise ValueError(
+                f"Unsupported result recording version in {file_path}: {recording.get('version')}"
+            )
+
+        result_recording = ResultRecording(recording["project"])
+        result_recording.nhr_dict = {
+            int(entry_id): num_values
+            for entry_id, num_values in recording["nhr_dict"].items()
+        }
+        result_recording.results = {
+            (entry_id, report_key, row_key): values
+            for entry_id, report_key, row_key, values in recording["results"]
+        }
+        result_recording.string_results = {
+            (entry_id, report_key, row_key): value
+            for entry_id, report_key, row_key, value in recording["string_results"]
+        }
+        return result_recording
+
+
+def get_project_name(project_fname: str, recording_root=None) -> str:
+    """
+    Get the name used to match a project to its recording: the path of the project relative to the recording root, so
+    projects with the same file name in different directories under the root have different recordings, and the
+    recordings still match when the root is moved.
+    :param project_fname: (string) path to project with project name NOT INCLUDING FILE EXTENSION
+    :param recording_root: (string or Path) directory the projects are recorded and replayed from; None uses the
+    directory of the project, so only the project's file name is used
+    :return: (string) project name
+    """
+    project_path = Path(os.path.abspath(project_fname.replace("\\", "/")))
+    if recording_root is None:
+        return project_path.name
+    root_path = Path(os.path.abspath(str(recording_root).replace("\\", "/")))
+    try:
+        return project_path.relative_to(root_path).as_posix()
+    except ValueError:
+        raise ValueError(
+            f"Project {project_fname} is not in the recording root {recording_root}"
+        )
+
+
+_recordings = {}
+
+
+class RecordingResultReader:
+    """
+    Result reader that passes every request through to another result reader (normally a D2Result.dll session) and
+    records the request and the returned values for the project it was made against. Recordings are written by
+    save_recordings().
+    """
+
+    def __init__(self, session, recording_root=None):
+        """
+        :param session: result reader the requests are passed through to, e.g. ResultReaderSession
+        :param recording_root: (string or Path) directory project names are taken relative to, see get_project_name()
+        """
+        self.session = session
+        self.recording_root = recording_root
+        self.nhr_dict = self.session.nhr_dict
+
+    def get_recording(self, project_fname: str) -> ResultRecording:
+        recording = _recordings.get(project_fname)
+        if recording is None:
+            recording = ResultRecording(
+                get_project_name(project_fname, self.recording_root)
+            )
+            _recordings[project_fname] = recording
+        return recording
+
+    def get_multiple_results(self, project_fname: str, request_array: list) -> list:
+        values = self.session.get_multiple_results(project_fname, request_array)
+        self.get_recording(project_fname).add_results(
+            self.nhr_dict, request_array, values
+        )
+        return values
+
+    def get_string_result(
+        self,
+        project_fname: str,
+        entry_id: int,
+        report_key: str = "",
+        row_key: str = "",
+    ) -> str:
+        value = self.session.get_string_result(
+            project_fname, entry_id, report_key, row_key
+        )
+        self.get_recording(project_fname).add_string_result(
+            (entry_id, report_key, row_key), value
+        )
+        return value
+
+
+class ReplayResultReader:
+    """
+    Result reader that serves values from recordings without ctypes or the D2Result.dll. Requests that were not
+    recorded are answered the same way the D2Result.dll answers requests it has no value for.
+    """
+
+    def __init__(self, recordings: dict, recording_root=None):
+        """
+        :param recordings: (dict) project name (str): ResultRecording
+        :param recording_root: (string or Path) directory project names are taken relative to, see get_project_name()
+        """
+        self.recordings = recordings
+        self.recording_root = recording_root
+        # NHRList.txt entries are the same for every project simulated with the same version of DOE-2
+        self.nhr_dict = {}
+        for recording in recordings.values():
+            self.nhr_dict.update(recording.nhr_dict)
+
+    def get_recording(self, project_fname: str) -> ResultRecording:
+        project_name = get_project_name(project_fname, self.recording_root)
+        recording = self.recordings.get(project_name)
+        if recording is None:
+            raise FileNotFoundError(
+                f"No result recording for project {project_name}. Record its simulation results with "
+                f"start_recording() before replaying them."
+            )
+        return recording
+
+    def get_multiple_results(self, project_fname: str, request_array: list) -> list:
+        recording = self.get_recording(project_fname)
+        values = []
+        for request in request_array:
+            request = tuple(request)
+            recorded_values = recording.results.get(request)
+            if recorded_values is None:
+                recorded_values = [-99999.0] * self.nhr_dict.get(request[0], 0)
+            values.extend(recorded_values)
+        return values
+
+    def get_string_result(
+        self,
+        project_fname: str,
+        entry_id: int,
+        report_key: str = "",
+        row_key: str = "",
+    ) -> str:
+        return self.get_recording(project_fname).string_results.get(
+            (entry_id, report_key, row_key), ""
+        )
+
+
+def start_recording(factory=None, recording_root=None):
+    """
+    Record every request made to the D2Result.dll from now on, in addition to returning its values.
+    :param factory: (callable) creates the result reader the requests are passed through to; None uses the default
+    D2Result.dll backend
+    :param recording_root: (string or Path) directory the recorded projects are in; projects are recorded by their
+    path relative to it. None records projects by their file name only
+    :return: None
+    """
+    factory = factory or model_output_reader.ResultReaderSession
+    _recordings.clear()
+    # A partial of a module-level function can be passed to worker processes, unlike a lambda
+    model_output_reader.set_result_reader_factory(
+        functools.partial(_create_recording_reader, factory, recording_root)
+    )
+
+
+def _create_recording_reader(factory, recording_root, d2_result_dll, doe2_data_dir):
+    return RecordingResultReader(factory(d2_result_dll, doe2_data_dir), recording_root)
+
+
+def save_recordings() -> list:
+    """
+    Write a recording for every project requested since start_recording() next to the project's simulation output
+    files and restore the default D2Result.dll backend.
+    :return: (list) paths of the recording files written
+    """
+    recording_paths = []
+    for project_fname, recording in _recordings.items():
+        recording_path = project_fname + RECORDING_EXTENSION
+        recording.save(recording_path)
+        recording_paths.append(recording_path)
+    _recordings.clear()
+    model_output_reader.set_result_reader_factory(None)
+    return recording_paths
+
+
+def pop_recordings() -> dict:
+    """
+    Take the recordings made since start_recording() or the last call, so a worker process can pass them back to
+    the process that saves them.
+    :return: (dict) project path (str): ResultRecording
+    """
+    recordings = dict(_recordings)
+    _recordings.clear()
+    return recordings
+
+
+def merge_recordings(recordings: dict):
+    """
+    Add recordings made in another process, as returned by pop_recordings(), to the recordings written by
+    save_recordings().
+    :param recordings: (dict) project path (str): ResultRecording
+    :return: None
+    """
+    _recordings.update(recordings)
+
+
+def start_replay(recording_paths: list, recording_root=None):
+    """
+    Serve every request from recordings instead of the D2Result.dll. set_result_reader_factory(None) restores the
+    default backend.
+    :param recording_paths: (list) paths of recording files written by save_recordings()
+    :param recording_root: (string or Path) directory the replayed projects are in, matching the recording_root the
+    recordings were made with; it may be a copy of that directory in another location
+    :return: None
+    """
+    recordings = {}
+    for recording_path in recording_paths:
+        recording = ResultRecording.load(str(recording_path))
+        if recording.project_name in recordings:
+            raise ValueError(
+                f"More than one result recording for project {recording.project_name}"
+            )
+        recordings[recording.project_name] = recording
+
+    # A partial of a module-level function can be passed to worker processes, unlike a lambda
+    model_output_reader.set_result_reader_factory(
+        functools.partial(_create_replay_reader, recordings, recording_root)
+    )
+
+
+def _create_replay_reader(recordings, recording_root, d2_result_dll, doe2_data_dir):
+    return ReplayResultReader(recordings, recording_root)
@@ -0,0 +1,73 @@
+import pickle
+import tempfile
+
+
+class SpooledCommandBuffer:
+    """
+    Per-command buffers of parsed BDL command dictionaries. Each buffer is kept in memory up to max_size bytes and
+    spooled to a temporary file beyond that, so the parsed keyword dictionaries of a large model do not have to be
+    held in memory while its objects are created.
+
+    get() returns the command dictionaries of a command in the order of their positions, like the "file_commands"
+    dictionary returned by ModelInputReader.read_input_bdl_file(), so the buffer can be passed to
+    _process_command_group() in its place.
+    """
+
+    def __init__(self, commands=(), max_size: int = 1 << 20):
+        """
+        :param commands: (iterable) of (command, command dictionary, position) tuples, e.g. from
+        ModelInputReader.iter_input_bdl_commands()
+        :param max_size: (int) number of bytes each command's buffer holds in memory before it is spooled to disk
+        """
+        self.max_size = max_size
+        self.buffers = {}
+        for command, command_dict, position in commands:
+            self.add(command, command_dict, position)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def add(self, command: str, command_dict: dict, position: int):
+        """
+        Add a command dictionary to the buffer of its command.
+        :param command: (str) BDL command
+        :param command_dict: (dict) command dictionary read from the BDL file
+        :param position: (int) position of the command in the BDL file
+        :return: None
+        """
+        buffer = self.buffers.get(command)
+        if buffer is None:
+            buffer = tempfile.SpooledTemporaryFile(max_size=self.max_size)
+            self.buffers[command] = buffer
+        buffer.seek(0, 2)
+        pickle.dump((position, command_dict), buffer, protocol=pickle.HIGHEST_PROTOCOL)
+
+    def get(self, command: str, default=None):
+        """
+        Read back the command dictionaries of a command, in the order of their positions in the BDL file.
+        :param command: (str) BDL command
+        :param default: value returned if no dictionaries were added for the command
+        :return: (list) of command dictionaries, or default
+        """
+        buffer = self.buffers.get(command)
+        if buffer is None:
+            return default
+
+        buffer.seek(0)
+        records = []
+        while True:
+            try:
+                records.append(pickle.load(buffer))
+            except EOFError:
+                break
+        records.sort(key=lambda record: record[0])
+        return [command_dict for _, command_dict in records]
+
+    def close(self):
+        """Release every buffer and delete any temporary files."""
+        for buffer in self.buffers.values():
+            buffer.close()
+        self.buffers.clear()
@@ -1,6 +1,6 @@
-import json
 import shutil
 import tempfile
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 from rpd_generator.artifacts.ruleset_project_description import (
@@ -9,60 +9,83 @@ from rpd_generator.artifacts.ruleset_project_description import (
 from rpd_generator.artifacts.ruleset_model_description import RulesetModelDescription
 from rpd_generator.artifacts.building_segment import BuildingSegment
 from rpd_generator.artifacts.building import Building
+from rpd_generator.doe2_file_readers import result_recording
 from rpd_generator.doe2_file_readers.bdlcio32 import process_input_file
 from rpd_generator.doe2_file_readers.model_input_reader import ModelInputReader
+from rpd_generator.doe2_file_readers.model_output_reader import (
+    get_result_reader_factory,
+    set_result_reader_factory,
+)
+from rpd_generator.doe2_file_readers.spooled_command_buffer import SpooledCommandBuffer
 from rpd_generator.bdl_structure import *
+from rpd_generator.bdl_structure.base_node import shutdown_output_fetch_executor
+from rpd_generator.bdl_structure.command_graph import (
+    get_command_order,
+    get_populate_waves,
+    populate_waves,
+)
 from rpd_generator.config import Config
+from rpd_generator.schema.schema_enums import SchemaEnums
 from rpd_generator.utilities import validate_configuration
 from rpd_generator.utilities import unit_converter
 from rpd_generator.utilities import ensure_valid_rpd
-
-
-"""Once development is complete, this can be replaced with a list of all bdl_command attribute values from classes that 
-inherit from BaseNode or BaseDefinition. Each class will also need a priority attribute in this case.
-For now, this is a list of BDL commands that are ready to be processed, in the order they should be processed."""
-COMMAND_PROCESSING_ORDER = [
-    "RUN-PERIOD-PD",
-    "SITE-PARAMETERS",
-    "BUILD-PARAMETERS",  # Building Parameters must populate before Exterior-Walls, Interior-Walls, Underground-Walls, Windows, Doors
-    "MASTER-METERS",  # Master meters must populate bofore other meters and before Systems, Boilers, DW-Heaters, Chillers
-    "FUEL-METER",  # Meters must populate before Systems, Boilers, DW-Heaters, Chillers
-    "ELEC-METER",  # Meters must populate before Systems, Boilers, DW-Heaters, Chillers
-    "STEAM-METER",  # Meters must populate before Systems, Boilers, DW-Heaters, Chillers
-    "CHW-METER",  # Meters must populate before Systems, Boilers, DW-Heaters, Chillers
-    "UTILITY-RATE",
+from rpd_generator.utilities.json_writer import write_json
+
+
+"""BDL commands that are ready to be processed. CONDENSING-UNIT and DESIGN-DAY have classes but are not processed yet.
+The order the commands are processed in comes from the command_dependencies of their classes."""
+PROCESSED_COMMANDS = [
+    "BOILER",
+    "BUILD-PARAMETERS",
+    "CHILLER",
+    "CHW-METER",
+    "CIRCULATION-LOOP",
+    "CONSTRUCTION",
+    "DAY-SCHEDULE-PD",
+    "DOOR",
+    "DW-HEATER",
+    "ELEC-GENERATOR",
+    "ELEC-METER",
+    "EQUIP-CTRL",
+    "EXTERIOR-WALL",
     "FIXED-SHADE",
+    "FLOOR",
+    "FUEL-METER",
     "GLASS-TYPE",
-    "MATERIAL",  # Materials must populate before Layers, Constructions
-    "LAYERS",  # Layers must populate before Constructions
-    "CONSTRUCTION",  # Constructions must populate before Exterior-Walls, Interior-Walls, Underground-Walls, Doors
+    "GROUND-LOOP-HX",
+    "HEAT-REJECTION",
     "HOLIDAYS",
-    "DAY-SCHEDULE-PD",
-    "WEEK-SCHEDULE-PD",
+    "INTERIOR-WALL",
+    "LAYERS",
+    "LOAD-MANAGEMENT",
+    "MASTER-METERS",
+    "MATERIAL",
+    "PUMP",
+    "RUN-PERIOD-PD",
     "SCHEDULE-PD",
-    "PUMP",  # Pumps must populate before Boiler, Chiller, Heat-Rejection, Circulation-Loop
-    "CIRCULATION-LOOP",  # Circulation loops must populate before Boiler, Chiller, DWHeater, Heat-Rejection
-    "BOILER",  # Boilers must populate before systems
-    "CHILLER",  # Chillers must populate before systems
-    "DW-HEATER",  # DWHeaters must populate before systems
-    "HEAT-REJECTION",
-    "GROUND-LOOP-HX",
-    "FLOOR",  # Floors must populate before Spaces
-    "SYSTEM",  # Systems must populate before Zones
-    "ZONE",  # Zones must populate before Spaces
-    "SPACE",  # Spaces must populate before Exterior-Walls, Interior-Walls, Underground-Walls
-    "EXTERIOR-WALL",  # Exterior walls must populate before Windows, Doors
-    "INTERIOR-WALL",  # Interior walls must populate before Windows, Doors
+    "SITE-PARAMETERS",
+    "SPACE",
+    "STEAM-METER",
+    "SYSTEM",
     "UNDERGROUND-WALL",
-    "WINDOW",
-    "DOOR",
-    "EQUIP-CTRL",
-    "LOAD-MANAGEMENT",
-    "ELEC-GENERATOR",
     "UTILITY-RATE",
+    "WEEK-SCHEDULE-PD",
+    "WINDOW",
+    "ZONE",
 ]
 
 
+def get_command_processing_order(bdl_command_dict: dict) -> list:
+    """
+    Get the PROCESSED_COMMANDS in the order their objects are created and populated.
+    :param bdl_command_dict: (dict) BDL command (str): class, as ModelInputReader.bdl_command_dict
+    :return: (list) BDL commands
+    """
+    return get_command_order(
+        {command: bdl_command_dict[command] for command in PROCESSED_COMMANDS}
+    )
+
+
 def write_rpd_json_from_inp(inp_path_str):
     inp_path = Path(inp_path_str)
     # Create a temporary directory to store the files for processing
@@ -97,42 +120,202 @@ def write_rpd_json_from_inp(inp_path_str):
         shutil.copy(str(json_path), inp_path.parent)
 
 
-def write_rpd_json_from_bdl(selected_models: list, json_file_path: str):
-    bdl_input_reader = ModelInputReader()
-    RulesetProjectDescription.bdl_command_dict = bdl_input_reader.bdl_command_dict
+def write_rpd_json_from_bdl(
+    selected_models: list, json_file_path: str, workers: int = 1
+):
+    """
+    Generate an RPD JSON file from one or more BDL files.
+    :param selected_models: (list) paths to the BDL files, one for each RMD
+    :param json_file_path: (str) path of the RPD JSON file to write; a path ending in ".gz" writes a gzip compressed file
+    :param workers: (int) number of worker processes; with more than 1, each model is parsed and populated in its own
+    worker and the RMDs are added to the RPD in the order of selected_models. Results recorded in the workers are
+    passed back, so save_recordings() writes them as it does for a single process
+    :return: None
+    """
     rpd = RulesetProjectDescription()
-    rmds = generate_rmds(bdl_input_reader, selected_models)
-    for rmd in rmds:
-        rmd.bdl_obj_instances["ASHRAE 229"] = rpd
-
-        for obj_instance in list(rmd.bdl_obj_instances.values()):
-            if isinstance(obj_instance, (BaseNode, BaseDefinition)):
-                obj_instance.populate_data_elements()
-
-        for obj_instance in rmd.bdl_obj_instances.values():
-            if isinstance(obj_instance, BaseNode):
-                obj_instance.populate_data_group()
-                obj_instance.insert_to_rpd(rmd)
-
-        rmd.bdl_obj_instances["Default Building Segment"].populate_data_group()
-        rmd.bdl_obj_instances["Default Building Segment"].insert_to_rpd()
-        rmd.bdl_obj_instances["Default Building"].populate_data_group()
-        rmd.bdl_obj_instances["Default Building"].insert_to_rpd(rmd)
-        rmd.populate_data_elements()
-        rmd.populate_data_group()
-        rmd.insert_to_rpd(rpd)
+
+    if workers > 1 and len(selected_models) > 1:
+        with ProcessPoolExecutor(
+            max_workers=min(workers, len(selected_models)),
+            initializer=_initialize_worker,
+            initargs=(_get_config_settings(), get_result_reader_factory()),
+        ) as executor:
+            for rmd_data_structures, calendar, weather, recordings in executor.map(
+                _generate_rmd_data, selected_models
+            ):
+                rpd.ruleset_model_descriptions.extend(rmd_data_structures)
+                result_recording.merge_recordings(recordings)
+                for key, value in calendar.items():
+                    rpd.calendar.setdefault(key, value)
+                for key, value in weather.items():
+                    rpd.weather.setdefault(key, value)
+    else:
+        bdl_input_reader = ModelInputReader()
+        RulesetProjectDescription.bdl_command_dict = bdl_input_reader.bdl_command_dict
+        rmds = generate_rmds(bdl_input_reader, selected_models)
+        for rmd in rmds:
+            populate_rmd(rmd, rpd)
 
     rpd.populate_data_group()
     ensure_valid_rpd.make_ids_unique(rpd.rpd_data_structure)
     unit_converter.convert_to_schema_units(rpd.rpd_data_structure)
-    with open(json_file_path, "w") as json_file:
-        json.dump(rpd.rpd_data_structure, json_file, indent=4)
+    write_json(
+        rpd.rpd_data_structure,
+        json_file_path,
+        indent=Config.JSON_INDENT,
+        significant_digits=Config.JSON_SIGNIFICANT_DIGITS,
+    )
 
+    unique_schedules, total_schedules = count_unique_schedules(
+        rpd.ruleset_model_descriptions
+    )
+    print(f"Schedules: {unique_schedules} unique of {total_schedules}.")
     print(f"RPD JSON file created.")
 
 
+def count_unique_schedules(rmd_data_structures: list) -> tuple:
+    """
+    Count the schedules of the RMDs and the schedules among them with distinct hourly values. Equivalent schedules
+    share their hourly values, so they are counted once.
+    :param rmd_data_structures: (list) RMD data structures
+    :return: (tuple) number of unique schedules (int) and total number of schedules (int)
+    """
+    total_schedules = 0
+    hourly_value_ids = set()
+    schedules_without_hourly_values = 0
+    for rmd_data_structure in rmd_data_structures:
+        for schedule in rmd_data_structure.get("schedules", []):
+            total_schedules += 1
+            hourly_values = schedule.get("hourly_values")
+            if hourly_values is None:
+                schedules_without_hourly_values += 1
+            else:
+                hourly_value_ids.add(id(hourly_values))
+    return len(hourly_value_ids) + schedules_without_hourly_values, total_schedules
+
+
+def populate_rmd(rmd: RulesetModelDescription, rpd: RulesetProjectDescription):
+    """
+    Populate the data groups of every BDL object in a model and insert the RMD into the RPD.
+    :param rmd: RulesetModelDescription
+    :param rpd: RulesetProjectDescription
+    :return: None
+    """
+    rmd.bdl_obj_instances["ASHRAE 229"] = rpd
+
+    try:
+        prefetch_output_data(rmd)
+
+        # Objects added while populating, such as zonal systems, are populated by the objects that add them
+        bdl_objects = [
+            obj_instance
+            for obj_instance in rmd.bdl_obj_instances.values()
+            if isinstance(obj_instance, (BaseNode, BaseDefinition))
+        ]
+        populate_waves(get_populate_waves(bdl_objects), Config.POPULATE_THREADS)
+        # Output that no object read is still added to the results store, and to the result cache
+        rmd.wait_for_output_results(rmd)
+    finally:
+        # Output is only fetched while objects populate, so the fetch threads are not kept past the model
+        shutdown_output_fetch_executor()
+
+    for obj_instance in rmd.bdl_obj_instances.values():
+        if isinstance(obj_instance, BaseNode):
+            obj_instance.populate_data_group()
+            obj_instance.insert_to_rpd(rmd)
+
+    rmd.bdl_obj_instances["Default Building Segment"].populate_data_group()
+    rmd.bdl_obj_instances["Default Building Segment"].insert_to_rpd()
+    rmd.bdl_obj_instances["Default Building"].populate_data_group()
+    rmd.bdl_obj_instances["Default Building"].insert_to_rpd(rmd)
+    rmd.populate_data_elements()
+    rmd.populate_data_group()
+    rmd.insert_to_rpd(rpd)
+
+
+# Config attributes that can be changed at runtime and must be passed on to worker processes
+WORKER_CONFIG_SETTINGS = [
+    "EQUEST_INSTALL_PATH",
+    "DOE22_DATA_PATH",
+    "DOE23_DATA_PATH",
+    "USE_RESULT_CACHE",
+    "SPOOL_BDL_COMMANDS",
+    "POPULATE_THREADS",
+    "OUTPUT_FETCH_THREADS",
+    "SERIALIZE_RESULT_CALLS",
+    "ACTIVE_RULESET",
+]
+
+
+def _get_config_settings() -> dict:
+    return {setting: getattr(Config, setting) for setting in WORKER_CONFIG_SETTINGS}
+
+
+def _initialize_worker(config_settings: dict, result_reader_factory):
+    """
+    Apply the parent process's configuration in a worker process.
+    :param config_settings: (dict) Config attribute names and values
+    :param result_reader_factory: (callable) backend used to retrieve results from the simulation output files
+    :return: None
+    """
+    if config_settings["ACTIVE_RULESET"] != Config.ACTIVE_RULESET:
+        SchemaEnums.update_schema_enum(config_settings["ACTIVE_RULESET"])
+    for setting, value in config_settings.items():
+        setattr(Config, setting, value)
+    set_result_reader_factory(result_reader_factory)
+    # A forked worker inherits the parent's fetch thread pool without its threads, and the parent's recordings
+    shutdown_output_fetch_executor(wait=False)
+    result_recording.pop_recordings()
+
+
+def _generate_rmd_data(model_path_str: str):
+    """
+    Parse and populate a single model in a worker process.
+    :param model_path_str: (str) path to the BDL file
+    :return: (tuple) list of RMD data structures, the RPD calendar and weather data populated by the model, and the
+    results recorded for it (dict), which is empty unless recording
+    """
+    bdl_input_reader = ModelInputReader()
+    RulesetProjectDescription.bdl_command_dict = bdl_input_reader.bdl_command_dict
+    rpd = RulesetProjectDescription()
+    for rmd in generate_rmds(bdl_input_reader, [model_path_str]):
+        populate_rmd(rmd, rpd)
+    return (
+        rpd.ruleset_model_descriptions,
+        rpd.calendar,
+        rpd.weather,
+        result_recording.pop_recordings(),
+    )
+
+
+def prefetch_output_data(rmd: RulesetModelDescription):
+    """
+    Collect the simulation output requests of every node in the model up front and fetch them in full batches, so
+    that nodes read their results from the model's results store during population. With more than one output fetch
+    thread, the batches are fetched while the nodes populate.
+
+    The requests are collected before population, while the state set during population is still at its defaults.
+    The zonal design requests of a System depend on is_zonal_system and output_cool_type, so they are not prefetched
+    and are fetched on their own when the System populates. The rated capacity request of a Boiler is only made while
+    its rated_capacity is unset, which is always the case here, so it is prefetched even for boilers whose rated
+    capacity has been filled in by the time they populate.
+    :param rmd: RulesetModelDescription
+    :return: None
+    """
+    output_requests = []
+    for obj_instance in rmd.bdl_obj_instances.values():
+        if isinstance(obj_instance, BaseNode):
+            output_requests.extend(obj_instance.get_output_requests().values())
+
+    model_requests, _ = rmd.get_output_requests()
+    output_requests.extend(model_requests.values())
+
+    rmd.fetch_output_results(rmd, output_requests, wait=False)
+
+
 def generate_rmds(bdl_input_reader: ModelInputReader, selected_models: list):
     rmds = []
+    command_order = get_command_processing_order(bdl_input_reader.bdl_command_dict)
     for model_path_str in selected_models:
         model_path = Path(model_path_str)
         rmd = RulesetModelDescription(model_path.stem)
@@ -145,8 +328,15 @@ def generate_rmds(bdl_input_reader: ModelInputReader, selected_models: list):
         rmd.bdl_obj_instances["Default Building"] = default_building
         rmd.bdl_obj_instances["Default Building Segment"] = default_building_segment
 
-        model_input_data = bdl_input_reader.read_input_bdl_file(str(model_path))
-        rmd.doe2_version = model_input_data["doe2_version"]
+        if Config.SPOOL_BDL_COMMANDS:
+            file_commands = SpooledCommandBuffer(
+                bdl_input_reader.iter_input_bdl_commands(str(model_path))
+            )
+            rmd.doe2_version = bdl_input_reader.doe2_version
+        else:
+            model_input_data = bdl_input_reader.read_input_bdl_file(str(model_path))
+            file_commands = model_input_data["file_commands"]
+            rmd.doe2_version = model_input_data["doe2_version"]
         if rmd.doe2_version is not None:
             rmd.doe2_data_path = (
                 Config.DOE23_DATA_PATH
@@ -154,7 +344,7 @@ def generate_rmds(bdl_input_reader: ModelInputReader, selected_models: list):
                 else Config.DOE22_DATA_PATH
             )
 
-        for command in COMMAND_PROCESSING_ORDER:
+        for command in command_order:
             special_handling = {}
             if command == "ZONE":
                 special_handling["ZONE"] = (
@@ -164,10 +354,12 @@ def generate_rmds(bdl_input_reader: ModelInputReader, selected_models: list):
                 )
             _process_command_group(
                 command,
-                model_input_data["file_commands"],
+                file_commands,
                 rmd,
                 special_handling,
             )
+        if Config.SPOOL_BDL_COMMANDS:
+            file_commands.close()
         rmds.append(rmd)
     return rmds
 
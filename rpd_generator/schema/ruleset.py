@@ -7,5 +7,14 @@ class Ruleset:
         self.enum_schema_filename = enum_filename
         self.output_schema_filename = output_filename
 
+    def __eq__(self, other):
+        return isinstance(other, Ruleset) and self._key() == other._key()
+
+    def __hash__(self):
+        return hash(self._key())
+
+    def _key(self):
+        return self.name, self.enum_schema_filename, self.output_schema_filename
+
     def __repr__(self):
         return f"Ruleset(name='{self.name}', enum_schema_filename='{self.enum_schema_filename}', output_schema_filename='{self.output_schema_filename}')"
@@ -1,8 +1,11 @@
+import hashlib
 import json
+import os
+import tempfile
 from pathlib import Path
 from collections import defaultdict
+from collections.abc import Mapping
 from rpd_generator.schema.ruleset import Ruleset
-from rpd_generator.utilities.jsonpath_utils import create_jsonpath_value_dict
 
 """This module exports the dictionary schema_enums that provides access to the
 enumerations in the schema files.
@@ -12,6 +15,8 @@ is a class with an attribute for each item in the enumeration. The value
 of the attribute is the same as the attribute name.
 """
 
+SCHEMA_DIR = Path(__file__).parent
+
 
 class _ListEnum:
     """A utility class used to convert a list into a class
@@ -33,56 +38,218 @@ class SchemaEnums:
 
     @staticmethod
     def update_schema_enum(ruleset: Ruleset):
-        # Load the output schema file
-        _output_schema_path = Path(__file__).parent / ruleset["output_filename"]
-        with open(_output_schema_path) as json_file:
-            _output_schema_obj = json.load(json_file)
-
-        # Load the enumeration schema file
-        _enum_schema_path = Path(__file__).parent / ruleset["enum_filename"]
-        with open(_enum_schema_path) as json_file:
-            _enum_schema_obj = json.load(json_file)
-
-        # Load the schema file
-        _schema_path = Path(__file__).parent / "ASHRAE229.schema.json"
-        with open(_schema_path) as json_file:
-            _schema_obj = json.load(json_file)
-
-        # Query for all objects having an enum field
-        # See jsonpath2 docs for parse syntax: https://jsonpath2.readthedocs.io/en/latest/exampleusage.html
-        _output_schema_enum_jsonpath_value_dict = create_jsonpath_value_dict(
-            "$..*[?(@.enum)]", _output_schema_obj
-        )
-        _enum_schema_enum_jsonpath_value_dict = create_jsonpath_value_dict(
-            "$..*[?(@.enum)]", _enum_schema_obj
-        )
-        _schema_enum_jsonpath_value_dict = create_jsonpath_value_dict(
-            "$..*[?(@.enum)]", _schema_obj
+        """
+        Select the ruleset whose enumerations are provided by schema_enums. The enumerations are only loaded when
+        schema_enums is first used.
+        :param ruleset: (Ruleset) ruleset with the enumeration and output schema file names
+        :return: None
+        """
+        SchemaEnums.schema_enums = _LazySchemaEnums(ruleset)
+
+
+class _LazySchemaEnums(Mapping):
+    """Read-only mapping of enumeration names to _ListEnum objects, loaded on first use"""
+
+    def __init__(self, ruleset: Ruleset):
+        self.ruleset = ruleset
+        self._enums = None
+
+    def _load(self) -> dict:
+        if self._enums is None:
+            self._enums = {
+                key: _ListEnum(enum_list)
+                for key, enum_list in load_schema_enum_lists(self.ruleset).items()
+            }
+        return self._enums
+
+    def __getitem__(self, key):
+        return self._load()[key]
+
+    def __iter__(self):
+        return iter(self._load())
+
+    def __len__(self):
+        return len(self._load())
+
+
+def get_schema_hashes(ruleset: Ruleset) -> dict:
+    """
+    Get the SHA-256 hash of each schema file of a ruleset.
+    :param ruleset: (Ruleset) ruleset with the enumeration and output schema file names
+    :return: (dict) schema file name: hexadecimal hash
+    """
+    return {
+        schema_filename: hashlib.sha256(
+            (SCHEMA_DIR / schema_filename).read_bytes()
+        ).hexdigest()
+        for schema_filename in [
+            ruleset.SCHEMA_FILENAME,
+            ruleset.enum_schema_filename,
+            ruleset.output_schema_filename,
+        ]
+    }
+
+
+def get_schema_enums_cache_path(ruleset: Ruleset) -> Path:
+    """
+    Get the path of the prebuilt enumeration cache of a ruleset, which is shipped with the package and regenerated
+    with dev_utils/build_schema_enums_cache.py.
+    :param ruleset: (Ruleset) ruleset with the enumeration and output schema file names
+    :return: (Path) path to the cache file in the resources directory
+    """
+    return (
+        SCHEMA_DIR
+        / "resources"
+        / f"schema_enums_{ruleset.enum_schema_filename.split('.')[0]}.json"
+    )
+
+
+def get_user_schema_enums_cache_path(ruleset: Ruleset) -> Path:
+    """
+    Get the path of the enumeration cache written at runtime for a ruleset whose prebuilt cache is missing or out of
+    date. It is kept in the user's cache directory, never in the package.
+    :param ruleset: (Ruleset) ruleset with the enumeration and output schema file names
+    :return: (Path) path to the cache file in the user's cache directory
+    """
+    if os.name == "nt":
+        cache_dir = os.environ.get("LOCALAPPDATA") or Path.home() / "AppData" / "Local"
+    else:
+        cache_dir = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return (
+        Path(cache_dir)
+        / "rpd_generator"
+        / f"schema_enums_{ruleset.enum_schema_filename.split('.')[0]}.json"
+    )
+
+
+def read_schema_enums_cache(cache_path: Path, schema_hashes: dict):
+    """
+    Read the enumerations from a cache file written for the current schema files.
+    :param cache_path: (Path) path to the cache file
+    :param schema_hashes: (dict) schema file name: hexadecimal hash, from get_schema_hashes()
+    :return: (dict) enumeration name: list of enumeration values, or None if the cache is missing or out of date
+    """
+    try:
+        with open(cache_path) as json_file:
+            cache = json.load(json_file)
+        if cache["schema_hashes"] == schema_hashes:
+            return cache["schema_enums"]
+    except (OSError, ValueError, KeyError):
+        pass
+    return None
+
+
+def write_schema_enums_cache(cache_path: Path, schema_hashes: dict, enum_lists: dict):
+    """
+    Write an enumeration cache file. The file is written under a temporary name and then moved into place, so
+    processes reading or writing the cache at the same time never see a partly written file.
+    :param cache_path: (Path) path to the cache file
+    :param schema_hashes: (dict) schema file name: hexadecimal hash, from get_schema_hashes()
+    :param enum_lists: (dict) enumeration name: list of enumeration values
+    :return: None
+    """
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    with tempfile.NamedTemporaryFile(
+        "w", dir=cache_path.parent, suffix=".tmp", delete=False
+    ) as json_file:
+        json.dump(
+            {"schema_hashes": schema_hashes, "schema_enums": enum_lists},
+            json_file,
+            indent=2,
         )
-        # Merge the dictionaries
-        combined_enum_jsonpath_value_dict = defaultdict(list)
-
-        # Merge dictionaries while combining values
-        for d in (
-            _schema_enum_jsonpath_value_dict,
-            _enum_schema_enum_jsonpath_value_dict,
-            _output_schema_enum_jsonpath_value_dict,
-        ):
-            for key, value in d.items():
-                # Extend the list for the key with new values
-                combined_enum_jsonpath_value_dict[key].extend(value["enum"])
-
-        # Create a dictionary of all the enumerations as dictionaries
-        _enums_dict = {
-            # Extract the last segment of the path in the jsonpath
-            enum_jsonpath.split('"')[-2]: enum_list
-            for enum_jsonpath, enum_list in combined_enum_jsonpath_value_dict.items()
-        }
-
-        # Assign to SchemaEnums with the combined lists
-        SchemaEnums.schema_enums = {
-            key: _ListEnum(enum_list) for key, enum_list in _enums_dict.items()
-        }
+    try:
+        # Temporary files are only readable by their owner
+        os.chmod(json_file.name, 0o644)
+        os.replace(json_file.name, cache_path)
+    except OSError:
+        os.remove(json_file.name)
+        raise
+
+
+def load_schema_enum_lists(ruleset: Ruleset) -> dict:
+    """
+    Load the enumerations of a ruleset from the prebuilt enumeration cache. When it is missing or any schema file has
+    changed since it was built, the enumerations are read from the cache in the user's cache directory, or scanned
+    from the schema files and written to that cache.
+    :param ruleset: (Ruleset) ruleset with the enumeration and output schema file names
+    :return: (dict) enumeration name: list of enumeration values
+    """
+    schema_hashes = get_schema_hashes(ruleset)
+    enum_lists = read_schema_enums_cache(
+        get_schema_enums_cache_path(ruleset), schema_hashes
+    )
+    if enum_lists is not None:
+        return enum_lists
+
+    user_cache_path = get_user_schema_enums_cache_path(ruleset)
+    enum_lists = read_schema_enums_cache(user_cache_path, schema_hashes)
+    if enum_lists is not None:
+        return enum_lists
+
+    enum_lists = scan_schema_enum_lists(ruleset)
+    try:
+        write_schema_enums_cache(user_cache_path, schema_hashes, enum_lists)
+    except OSError:
+        # Without a writable cache directory the enumerations are scanned again next time
+        pass
+    return enum_lists
+
+
+def scan_schema_enum_lists(ruleset: Ruleset) -> dict:
+    """
+    Find every enumeration in the schema files of a ruleset.
+    :param ruleset: (Ruleset) ruleset with the enumeration and output schema file names
+    :return: (dict) enumeration name: list of enumeration values
+    """
+    # Only needed when the enumeration cache is rebuilt, so jsonpath2 is not imported with this module
+    from rpd_generator.utilities.jsonpath_utils import create_jsonpath_value_dict
+
+    # Load the output schema file
+    _output_schema_path = SCHEMA_DIR / ruleset.output_schema_filename
+    with open(_output_schema_path) as json_file:
+        _output_schema_obj = json.load(json_file)
+
+    # Load the enumeration schema file
+    _enum_schema_path = SCHEMA_DIR / ruleset.enum_schema_filename
+    with open(_enum_schema_path) as json_file:
+        _enum_schema_obj = json.load(json_file)
+
+    # Load the schema file
+    _schema_path = SCHEMA_DIR / ruleset.SCHEMA_FILENAME
+    with open(_schema_path) as json_file:
+        _schema_obj = json.load(json_file)
+
+    # Query for all objects having an enum field
+    # See jsonpath2 docs for parse syntax: https://jsonpath2.readthedocs.io/en/latest/exampleusage.html
+    _output_schema_enum_jsonpath_value_dict = create_jsonpath_value_dict(
+        "$..*[?(@.enum)]", _output_schema_obj
+    )
+    _enum_schema_enum_jsonpath_value_dict = create_jsonpath_value_dict(
+        "$..*[?(@.enum)]", _enum_schema_obj
+    )
+    _schema_enum_jsonpath_value_dict = create_jsonpath_value_dict(
+        "$..*[?(@.enum)]", _schema_obj
+    )
+    # Merge the dictionaries
+    combined_enum_jsonpath_value_dict = defaultdict(list)
+
+    # Merge dictionaries while combining values
+    for d in (
+        _schema_enum_jsonpath_value_dict,
+        _enum_schema_enum_jsonpath_value_dict,
+        _output_schema_enum_jsonpath_value_dict,
+    ):
+        for key, value in d.items():
+            # Extend the list for the key with new values
+            combined_enum_jsonpath_value_dict[key].extend(value["enum"])
+
+    # Create a dictionary of all the enumerations as dictionaries
+    _enums_dict = {
+        # Extract the last segment of the path in the jsonpath
+        enum_jsonpath.split('"')[-2]: enum_list
+        for enum_jsonpath, enum_list in combined_enum_jsonpath_value_dict.items()
+    }
+    return _enums_dict
 
 
 def print_schema_enums():
@@ -1,287 +1,312 @@
 import json
+from collections.abc import Hashable
+from itertools import chain, islice
 from pathlib import Path
 import jsonschema
 
 from rpd_generator.config import Config
-from rpd_generator.utilities.jsonpath_utils import find_all, find_all_by_jsonpaths
+from rpd_generator.schema.ruleset import Ruleset
 
 file_dir = Path(__file__).parent
 
-SCHEMA_FILENAME = Config.ACTIVE_RULESET.SCHEMA_FILENAME
-SCHEMA_ENUM_FILENAME = Config.ACTIVE_RULESET.enum_schema_filename
-SCHEMA_OUTPUT_FILENAME = Config.ACTIVE_RULESET.output_schema_filename
-SCHEMA_PATH = file_dir / SCHEMA_FILENAME
-SCHEMA_ENUM_PATH = file_dir / SCHEMA_ENUM_FILENAME
-SCHEMA_OUTPUT_PATH = file_dir / SCHEMA_OUTPUT_FILENAME
-
-
-def check_fluid_loop_association(rpd: dict) -> list:
-    mismatch_list = []
-
-    fluid_loop_id_jsonpaths = [
-        "$.ruleset_model_descriptions[*].fluid_loops[*].id",
-        "$.ruleset_model_descriptions[*].fluid_loops[*].child_loops[*].id",
-    ]
-
-    fluid_reference_jsonpaths = [
-        "$.ruleset_model_descriptions[*].chillers[*].cooling_loop",
-        "$.ruleset_model_descriptions[*].chillers[*].condensing_loop",
-        "$.ruleset_model_descriptions[*].chillers[*].heat_recovery_loop",
-        "$.ruleset_model_descriptions[*].buildings[*].building_segments[*].heating_ventilating_air_conditioning_systems[*].heating_system.hot_water_loop",
-        "$.ruleset_model_descriptions[*].buildings[*].building_segments[*].heating_ventilating_air_conditioning_systems[*].heating_system.water_source_heat_pump_loop",
-        "$.ruleset_model_descriptions[*].buildings[*].building_segments[*].heating_ventilating_air_conditioning_systems[*].cooling_system.chilled_water_loop",
-        "$.ruleset_model_descriptions[*].buildings[*].building_segments[*].heating_ventilating_air_conditioning_systems[*].cooling_system.condenser_water_loop",
-        "$.ruleset_model_descriptions[*].buildings[*].building_segments[*].zones[*].spaces[*].miscellaneous_equipment[*].energy_from_loop",
-        "$.ruleset_model_descriptions[*].buildings[*].building_segments[*].zones[*].spaces[*].miscellaneous_equipment[*].remaining_fraction_to_loop",
-        "$.ruleset_model_descriptions[*].buildings[*].building_segments[*].zones[*].terminals[*].cooling_from_loop",
-        "$.ruleset_model_descriptions[*].buildings[*].building_segments[*].zones[*].terminals[*].heating_from_loop",
-        "$.ruleset_model_descriptions[*].service_water_heating_equipment[*].hot_water_loop",
-        "$.ruleset_model_descriptions[*].heat_rejections[*].loop",
-        "$.ruleset_model_descriptions[*].boilers[*].loop",
-        "$.ruleset_model_descriptions[*].service_water_heating_equipment[*].hot_water_loop",
-        "$.ruleset_model_descriptions[*].external_fluid_sources[*].loop",
+# (ruleset, validator) for the last ruleset a validator was created for
+_schema_validator = (None, None)
+
+
+FLUID_LOOP_ID_JSONPATHS = [
+    "$.ruleset_model_descriptions[*].fluid_loops[*].id",
+    "$.ruleset_model_descriptions[*].fluid_loops[*].child_loops[*].id",
+]
+
+FLUID_LOOP_REFERENCE_JSONPATHS = [
+    "$.ruleset_model_descriptions[*].chillers[*].cooling_loop",
+    "$.ruleset_model_descriptions[*].chillers[*].condensing_loop",
+    "$.ruleset_model_descriptions[*].chillers[*].heat_recovery_loop",
+    "$.ruleset_model_descriptions[*].buildings[*].building_segments[*].heating_ventilating_air_conditioning_systems[*].heating_system.hot_water_loop",
+    "$.ruleset_model_descriptions[*].buildings[*].building_segments[*].heating_ventilating_air_conditioning_systems[*].heating_system.water_source_heat_pump_loop",
+    "$.ruleset_model_descriptions[*].buildings[*].building_segments[*].heating_ventilating_air_conditioning_systems[*].cooling_system.chilled_water_loop",
+    "$.ruleset_model_descriptions[*].buildings[*].building_segments[*].heating_ventilating_air_conditioning_systems[*].cooling_system.condenser_water_loop",
+    "$.ruleset_model_descriptions[*].buildings[*].building_segments[*].zones[*].spaces[*].miscellaneous_equipment[*].energy_from_loop",
+    "$.ruleset_model_descriptions[*].buildings[*].building_segments[*].zones[*].spaces[*].miscellaneous_equipment[*].remaining_fraction_to_loop",
+    "$.ruleset_model_descriptions[*].buildings[*].building_segments[*].zones[*].terminals[*].cooling_from_loop",
+    "$.ruleset_model_descriptions[*].buildings[*].building_segments[*].zones[*].terminals[*].heating_from_loop",
+    "$.ruleset_model_descriptions[*].service_water_heating_equipment[*].hot_water_loop",
+    "$.ruleset_model_descriptions[*].heat_rejections[*].loop",
+    "$.ruleset_model_descriptions[*].boilers[*].loop",
+    "$.ruleset_model_descriptions[*].service_water_heating_equipment[*].hot_water_loop",
+    "$.ruleset_model_descriptions[*].external_fluid_sources[*].loop",
+]
+
+ZONE_ID_JSONPATHS = [
+    "$.ruleset_model_descriptions[*].buildings[*].building_segments[*].zones[*].id",
+]
+
+ZONE_REFERENCE_JSONPATHS = [
+    "$.ruleset_model_descriptions[*].buildings[*].elevators[*].motor_location_zone",
+    "$.ruleset_model_descriptions[*].buildings[*].elevators[*].cab_location_zone",
+    "$.ruleset_model_descriptions[*].buildings[*].refrigerated_cases[*].zone",
+    "$.ruleset_model_descriptions[*].service_water_heating_equipment[*].compressor_zone",
+    "$.ruleset_model_descriptions[*].service_water_heating_equipment[*].compressor_heat_rejection_zone",
+    "$.ruleset_model_descriptions[*].buildings[*].building_segments[*].zones[*].zonal_exhaust_fan.motor_location_zone",
+    "$.ruleset_model_descriptions[*].buildings[*].building_segments[*].zones[*].terminals[*].fan.motor_location_zone",
+    "$.ruleset_model_descriptions[*].buildings[*].building_segments[*].heating_ventilating_air_conditioning_systems[*].fan_system.supply_fans[*].motor_location_zone",
+    "$.ruleset_model_descriptions[*].buildings[*].building_segments[*].heating_ventilating_air_conditioning_systems[*].fan_system.return_fans[*].motor_location_zone",
+    "$.ruleset_model_descriptions[*].buildings[*].building_segments[*].heating_ventilating_air_conditioning_systems[*].fan_system.relief_fans[*].motor_location_zone",
+    "$.ruleset_model_descriptions[*].buildings[*].building_segments[*].heating_ventilating_air_conditioning_systems[*].fan_system.exhaust_fans[*].motor_location_zone",
+    "$.ruleset_model_descriptions[*].service_water_heating_equipment[*].tank.location_zone",
+    "$.ruleset_model_descriptions[*].service_water_heating_equipment[*].solar_thermal_systems[*].tank.location_zone",
+    "$.ruleset_model_descriptions[*].service_water_heating_distribution_systems[*].tanks[*].location_zone",
+    "$.ruleset_model_descriptions[*].buildings[*].building_segments[*].zones[*].surfaces[*].adjacent_zone",
+    "$.ruleset_model_descriptions[*].buildings[*].building_segments[*].zones[*].transfer_airflow_source_zone",
+    "$.ruleset_model_descriptions[*].service_water_heating_distribution_systems[*].service_water_piping[*].location_zone",
+]
+
+SCHEDULE_ID_JSONPATHS = [
+    "$.ruleset_model_descriptions[*].schedules[*].id",
+]
+
+SCHEDULE_REFERENCE_JSONPATHS = [
+    "$.ruleset_model_descriptions[*].buildings[*].elevators[*].cab_motor_multiplier_schedule",
+    "$.ruleset_model_descriptions[*].buildings[*].elevators[*].cab_ventilation_fan_multiplier_schedule",
+    "$.ruleset_model_descriptions[*].buildings[*].elevators[*].cab_lighting_multiplier_schedule",
+    "$.ruleset_model_descriptions[*].buildings[*].refrigerated_cases[*].power_multiplier_schedule",
+    "$.ruleset_model_descriptions[*].buildings[*].exterior_lighting[*].multiplier_schedule",
+    "$.ruleset_model_descriptions[*].buildings[*].building_segments[*].zones[*].infiltration.multiplier_schedule",
+    "$.ruleset_model_descriptions[*].buildings[*].building_segments[*].zones[*].thermostat_cooling_setpoint_schedule",
+    "$.ruleset_model_descriptions[*].buildings[*].building_segments[*].zones[*].thermostat_heating_setpoint_schedule",
+    "$.ruleset_model_descriptions[*].buildings[*].building_segments[*].zones[*].minimum_humidity_setpoint_schedule",
+    "$.ruleset_model_descriptions[*].buildings[*].building_segments[*].zones[*].maximum_humidity_setpoint_schedule",
+    "$.ruleset_model_descriptions[*].buildings[*].building_segments[*].zones[*].exhaust_airflow_rate_multiplier_schedule",
+    "$.ruleset_model_descriptions[*].buildings[*].building_segments[*].zones[*].spaces[*].occupant_multiplier_schedule",
+    "$.ruleset_model_descriptions[*].buildings[*].building_segments[*].zones[*].spaces[*].interior_lighting[*].lighting_multiplier_schedule",
+    "$.ruleset_model_descriptions[*].service_water_heating_distribution_systems[*].flow_multiplier_schedule",
+    "$.ruleset_model_descriptions[*].service_water_heating_distribution_systems[*].entering_water_mains_temperature_schedule",
+    "$.ruleset_model_descriptions[*].buildings[*].building_segments[*].zones[*].spaces[*].service_water_heating_uses[*].use_multiplier_schedule",
+    "$.ruleset_model_descriptions[*].buildings[*].building_open_schedule",
+    "$.ruleset_model_descriptions[*].buildings[*].building_segments[*].zones[*].terminals[*].minimum_outdoor_airflow_multiplier_schedule",
+    "$.ruleset_model_descriptions[*].buildings[*].building_segments[*].zones[*].spaces[*].miscellaneous_equipment[*].multiplier_schedule",
+    "$.ruleset_model_descriptions[*].fluid_loops[*].cooling_or_condensing_design_and_control.operation_schedule",
+    "$.ruleset_model_descriptions[*].fluid_loops[*].heating_design_and_control.operation_schedule",
+    "$.ruleset_model_descriptions[*].fluid_loops[*].child_loops[*].cooling_or_condensing_design_and_control.operation_schedule",
+    "$.ruleset_model_descriptions[*].fluid_loops[*].child_loops[*].heating_design_and_control.operation_schedule",
+    "$.ruleset_model_descriptions[*].heating_ventilation_air_conditioning_systems[*].fan_system.supply_air_temperature_reset_schedule",
+    "$.ruleset_model_descriptions[*].heating_ventilation_air_conditioning_systems[*].fan_system.operating_schedule",
+]
+
+FLUID_LOOP_OR_PIPING_ID_JSONPATHS = [
+    "$.ruleset_model_descriptions[*].fluid_loops[*].id",
+    "$.ruleset_model_descriptions[*].service_water_heating_distribution_systems[*].service_water_piping[*].id",
+    "$.ruleset_model_descriptions[*].fluid_loops[*].child_loops[*].id",
+]
+
+FLUID_LOOP_OR_PIPING_REFERENCE_JSONPATHS = [
+    "$.ruleset_model_descriptions[*].pumps[*].loop_or_piping",
+]
+
+SERVICE_WATER_HEATING_ID_JSONPATHS = [
+    "$.ruleset_model_descriptions[*].service_water_heating_distribution_systems[*].id",
+]
+
+SERVICE_WATER_HEATING_REFERENCE_JSONPATHS = [
+    "$.ruleset_model_descriptions[*].buildings[*].building_segments[*].zones[*].spaces[*].service_water_heating_uses[*].served_by_distribution_system",
+    "$.ruleset_model_descriptions[*].buildings[*].building_segments[*].zones[*].served_by_service_water_heating_system",
+    "$.ruleset_model_descriptions[*].service_water_heating_equipment[*].distribution_system",
+]
+
+HVAC_ID_JSONPATHS = [
+    "$.ruleset_model_descriptions[*].buildings[*].building_segments[*].heating_ventilating_air_conditioning_systems[*].id",
+]
+
+HVAC_REFERENCE_JSONPATHS = [
+    "$.ruleset_model_descriptions[*].buildings[*].building_segments[*].zones[*].terminals[*].served_by_heating_ventilating_air_conditioning_system",
+]
+
+# Checks that every reference to an id has a matching id: check name: (paths of the ids, paths of the references)
+REFERENCE_CHECKS = {
+    "hvac": (HVAC_ID_JSONPATHS, HVAC_REFERENCE_JSONPATHS),
+    "zone": (ZONE_ID_JSONPATHS, ZONE_REFERENCE_JSONPATHS),
+    "fluid_loop": (FLUID_LOOP_ID_JSONPATHS, FLUID_LOOP_REFERENCE_JSONPATHS),
+    "schedule": (SCHEDULE_ID_JSONPATHS, SCHEDULE_REFERENCE_JSONPATHS),
+    "fluid_loop_or_piping": (
+        FLUID_LOOP_OR_PIPING_ID_JSONPATHS,
+        FLUID_LOOP_OR_PIPING_REFERENCE_JSONPATHS,
+    ),
+    "service_water_heating": (
+        SERVICE_WATER_HEATING_ID_JSONPATHS,
+        SERVICE_WATER_HEATING_REFERENCE_JSONPATHS,
+    ),
+}
+RMD_LIST_PATH = "$.ruleset_model_descriptions"
+
+
+def collect_ids_and_references(rpd: dict) -> tuple:
+    """
+    Walk the RPD once and collect the values needed by the reference and unique id checks.
+    :param rpd: (dict) RPD
+    :return: tuple of
+        - dict of check name: set of the ids that can be referenced
+        - dict of check name: list of the referenced ids, in the order of the reference paths and then in document order
+        - dict of (RMD index, path of a list in the RPD): list of the ids of the objects in the list
+    """
+    id_lists = {check: [] for check in REFERENCE_CHECKS}
+    # References are collected separately for each path and joined in path order once the walk is complete
+    reference_lists = {
+        check: [[] for _ in reference_jsonpaths]
+        for check, (_, reference_jsonpaths) in REFERENCE_CHECKS.items()
+    }
+    # path: list of functions that collect the values found at the path
+    collectors = {}
+    for check, (id_jsonpaths, reference_jsonpaths) in REFERENCE_CHECKS.items():
+        for jsonpath in id_jsonpaths:
+            collectors.setdefault(jsonpath, []).append(id_lists[check].append)
+        for jsonpath, values in zip(reference_jsonpaths, reference_lists[check]):
+            collectors.setdefault(jsonpath, []).append(values.append)
+    list_ids = {}
+
+    def visit(node, path, rmd_index):
+        if isinstance(node, dict):
+            for key, value in node.items():
+                value_path = f"{path}.{key}"
+                for collect in collectors.get(value_path, ()):
+                    collect(value)
+                if isinstance(value, (dict, list)):
+                    visit(value, value_path, rmd_index)
+        else:
+            item_path = f"{path}[*]"
+            for i, item in enumerate(node):
+                if rmd_index is not None and isinstance(item, dict) and "id" in item:
+                    list_ids.setdefault((rmd_index, path), []).append(item["id"])
+                if isinstance(item, (dict, list)):
+                    visit(item, item_path, i if path == RMD_LIST_PATH else rmd_index)
+
+    visit(rpd, "$", None)
+
+    id_sets = {
+        check: {object_id for object_id in ids if isinstance(object_id, Hashable)}
+        for check, ids in id_lists.items()
+    }
+    references = {
+        check: list(chain.from_iterable(values))
+        for check, values in reference_lists.items()
+    }
+    return id_sets, references, list_ids
+
+
+def get_mismatched_references(id_sets: dict, references: dict, check: str) -> list:
+    """
+    Get the references of a check that do not match any id.
+    :param id_sets: (dict) check name: set of ids, from collect_ids_and_references()
+    :param references: (dict) check name: list of references, from collect_ids_and_references()
+    :param check: (str) name of the check in REFERENCE_CHECKS
+    :return: (list) of the references without a matching id, in reference order
+    """
+    ids = id_sets[check]
+    return [
+        reference
+        for reference in references[check]
+        if not isinstance(reference, Hashable) or reference not in ids
     ]
 
-    fluid_loop_id_list = find_all_by_jsonpaths(fluid_loop_id_jsonpaths, rpd)
 
-    referenced_id_list = find_all_by_jsonpaths(
-        fluid_reference_jsonpaths,
-        rpd,
-    )
+def get_non_unique_id_error(list_ids: dict) -> str:
+    """
+    Get the error message for the lists in the RMDs that hold objects with the same id.
+    :param list_ids: (dict) (RMD index, list path): list of ids, from collect_ids_and_references()
+    :return: (str) error message, or an empty string if all ids are unique
+    """
+    bad_paths = [
+        f"ruleset_model_descriptions[{rmd_index}]{list_path[len(RMD_LIST_PATH) + 3:]}"
+        for (rmd_index, list_path), ids in list_ids.items()
+        if len(ids) != len(set(ids))
+    ]
+    return f"Non-unique ids for paths: {'; '.join(bad_paths)}" if bad_paths else ""
 
-    for fluid_loop_id in referenced_id_list:
-        if fluid_loop_id not in fluid_loop_id_list:
-            mismatch_list.append(fluid_loop_id)
 
-    return mismatch_list
+def check_fluid_loop_association(rpd: dict) -> list:
+    return get_mismatched_references(*collect_ids_and_references(rpd)[:2], "fluid_loop")
 
 
 def check_zone_association(rpd: dict) -> list:
-    mismatch_list = []
-    zone_reference_jsonpaths = [
-        "$.ruleset_model_descriptions[*].buildings[*].elevators[*].motor_location_zone",
-        "$.ruleset_model_descriptions[*].buildings[*].elevators[*].cab_location_zone",
-        "$.ruleset_model_descriptions[*].buildings[*].refrigerated_cases[*].zone",
-        "$.ruleset_model_descriptions[*].service_water_heating_equipment[*].compressor_zone",
-        "$.ruleset_model_descriptions[*].service_water_heating_equipment[*].compressor_heat_rejection_zone",
-        "$.ruleset_model_descriptions[*].buildings[*].building_segments[*].zones[*].zonal_exhaust_fan.motor_location_zone",
-        "$.ruleset_model_descriptions[*].buildings[*].building_segments[*].zones[*].terminals[*].fan.motor_location_zone",
-        "$.ruleset_model_descriptions[*].buildings[*].building_segments[*].heating_ventilating_air_conditioning_systems[*].fan_system.supply_fans[*].motor_location_zone",
-        "$.ruleset_model_descriptions[*].buildings[*].building_segments[*].heating_ventilating_air_conditioning_systems[*].fan_system.return_fans[*].motor_location_zone",
-        "$.ruleset_model_descriptions[*].buildings[*].building_segments[*].heating_ventilating_air_conditioning_systems[*].fan_system.relief_fans[*].motor_location_zone",
-        "$.ruleset_model_descriptions[*].buildings[*].building_segments[*].heating_ventilating_air_conditioning_systems[*].fan_system.exhaust_fans[*].motor_location_zone",
-        "$.ruleset_model_descriptions[*].service_water_heating_equipment[*].tank.location_zone",
-        "$.ruleset_model_descriptions[*].service_water_heating_equipment[*].solar_thermal_systems[*].tank.location_zone",
-        "$.ruleset_model_descriptions[*].service_water_heating_distribution_systems[*].tanks[*].location_zone",
-        "$.ruleset_model_descriptions[*].buildings[*].building_segments[*].zones[*].surfaces[*].adjacent_zone",
-        "$.ruleset_model_descriptions[*].buildings[*].building_segments[*].zones[*].transfer_airflow_source_zone",
-        "$.ruleset_model_descriptions[*].service_water_heating_distribution_systems[*].service_water_piping[*].location_zone",
-    ]
-    zone_id_list = find_all(
-        "$.ruleset_model_descriptions[*].buildings[*].building_segments[*].zones[*].id",
-        rpd,
-    )
-    referenced_id_list = find_all_by_jsonpaths(zone_reference_jsonpaths, rpd)
-
-    for zone_id in referenced_id_list:
-        if zone_id not in zone_id_list:
-            mismatch_list.append(zone_id)
-    return mismatch_list
+    return get_mismatched_references(*collect_ids_and_references(rpd)[:2], "zone")
 
 
 def check_schedule_association(rpd: dict) -> list:
-    mismatch_list = []
-
-    schedule_id_list = find_all("$.ruleset_model_descriptions[*].schedules[*].id", rpd)
-    schedule_reference_jsonpaths = [
-        "$.ruleset_model_descriptions[*].buildings[*].elevators[*].cab_motor_multiplier_schedule",
-        "$.ruleset_model_descriptions[*].buildings[*].elevators[*].cab_ventilation_fan_multiplier_schedule",
-        "$.ruleset_model_descriptions[*].buildings[*].elevators[*].cab_lighting_multiplier_schedule",
-        "$.ruleset_model_descriptions[*].buildings[*].refrigerated_cases[*].power_multiplier_schedule",
-        "$.ruleset_model_descriptions[*].buildings[*].exterior_lighting[*].multiplier_schedule",
-        "$.ruleset_model_descriptions[*].buildings[*].building_segments[*].zones[*].infiltration.multiplier_schedule",
-        "$.ruleset_model_descriptions[*].buildings[*].building_segments[*].zones[*].thermostat_cooling_setpoint_schedule",
-        "$.ruleset_model_descriptions[*].buildings[*].building_segments[*].zones[*].thermostat_heating_setpoint_schedule",
-        "$.ruleset_model_descriptions[*].buildings[*].building_segments[*].zones[*].minimum_humidity_setpoint_schedule",
-        "$.ruleset_model_descriptions[*].buildings[*].building_segments[*].zones[*].maximum_humidity_setpoint_schedule",
-        "$.ruleset_model_descriptions[*].buildings[*].building_segments[*].zones[*].exhaust_airflow_rate_multiplier_schedule",
-        "$.ruleset_model_descriptions[*].buildings[*].building_segments[*].zones[*].spaces[*].occupant_multiplier_schedule",
-        "$.ruleset_model_descriptions[*].buildings[*].building_segments[*].zones[*].spaces[*].interior_lighting[*].lighting_multiplier_schedule",
-        "$.ruleset_model_descriptions[*].service_water_heating_distribution_systems[*].flow_multiplier_schedule",
-        "$.ruleset_model_descriptions[*].service_water_heating_distribution_systems[*].entering_water_mains_temperature_schedule",
-        "$.ruleset_model_descriptions[*].buildings[*].building_segments[*].zones[*].spaces[*].service_water_heating_uses[*].use_multiplier_schedule",
-        "$.ruleset_model_descriptions[*].buildings[*].building_open_schedule",
-        "$.ruleset_model_descriptions[*].buildings[*].building_segments[*].zones[*].terminals[*].minimum_outdoor_airflow_multiplier_schedule",
-        "$.ruleset_model_descriptions[*].buildings[*].building_segments[*].zones[*].spaces[*].miscellaneous_equipment[*].multiplier_schedule",
-        "$.ruleset_model_descriptions[*].fluid_loops[*].cooling_or_condensing_design_and_control.operation_schedule",
-        "$.ruleset_model_descriptions[*].fluid_loops[*].heating_design_and_control.operation_schedule",
-        "$.ruleset_model_descriptions[*].fluid_loops[*].child_loops[*].cooling_or_condensing_design_and_control.operation_schedule",
-        "$.ruleset_model_descriptions[*].fluid_loops[*].child_loops[*].heating_design_and_control.operation_schedule",
-        "$.ruleset_model_descriptions[*].heating_ventilation_air_conditioning_systems[*].fan_system.supply_air_temperature_reset_schedule",
-        "$.ruleset_model_descriptions[*].heating_ventilation_air_conditioning_systems[*].fan_system.operating_schedule",
-    ]
-
-    referenced_id_list = find_all_by_jsonpaths(schedule_reference_jsonpaths, rpd)
-
-    for schedule_id in referenced_id_list:
-        if schedule_id not in schedule_id_list:
-            mismatch_list.append(schedule_id)
-    return mismatch_list
+    return get_mismatched_references(*collect_ids_and_references(rpd)[:2], "schedule")
 
 
 def check_fluid_loop_or_piping_association(rpd: dict) -> list:
-    mismatch_list = []
-    fluid_loop_or_piping_id_jsonpaths = [
-        "$.ruleset_model_descriptions[*].fluid_loops[*].id",
-        "$.ruleset_model_descriptions[*].service_water_heating_distribution_systems[*].service_water_piping[*].id",
-        "$.ruleset_model_descriptions[*].fluid_loops[*].child_loops[*].id",
-    ]
-
-    fluid_loop_or_piping_id_list = find_all_by_jsonpaths(
-        fluid_loop_or_piping_id_jsonpaths, rpd
-    )
-
-    referenced_fluid_loop_or_piping_id_list = find_all(
-        "$.ruleset_model_descriptions[*].pumps[*].loop_or_piping",
-        rpd,
+    return get_mismatched_references(
+        *collect_ids_and_references(rpd)[:2], "fluid_loop_or_piping"
     )
-    for fluid_loop_or_piping_id in referenced_fluid_loop_or_piping_id_list:
-        if fluid_loop_or_piping_id not in fluid_loop_or_piping_id_list:
-            mismatch_list.append(fluid_loop_or_piping_id)
-    return mismatch_list
 
 
 def check_service_water_heating_association(rpd: dict) -> list:
-    mismatch_list = []
-    service_water_heating_id_list = find_all(
-        "$.ruleset_model_descriptions[*].service_water_heating_distribution_systems[*].id",
-        rpd,
-    )
-
-    service_water_heating_reference_jsonpaths = [
-        "$.ruleset_model_descriptions[*].buildings[*].building_segments[*].zones[*].spaces[*].service_water_heating_uses[*].served_by_distribution_system",
-        "$.ruleset_model_descriptions[*].buildings[*].building_segments[*].zones[*].served_by_service_water_heating_system",
-        "$.ruleset_model_descriptions[*].service_water_heating_equipment[*].distribution_system",
-    ]
-
-    referenced_service_water_heating_id_list = find_all_by_jsonpaths(
-        service_water_heating_reference_jsonpaths, rpd
+    return get_mismatched_references(
+        *collect_ids_and_references(rpd)[:2], "service_water_heating"
     )
 
-    for service_water_heating_id in referenced_service_water_heating_id_list:
-        if service_water_heating_id not in service_water_heating_id_list:
-            mismatch_list.append(service_water_heating_id)
-    return mismatch_list
-
 
 def check_hvac_association(rpd: dict) -> list:
-    mismatch_list = []
-    hvac_id_list = find_all(
-        "$.ruleset_model_descriptions[*].buildings[*].building_segments[*].heating_ventilating_air_conditioning_systems[*].id",
-        rpd,
-    )
-    served_by_hvac_id_list = find_all(
-        "$.ruleset_model_descriptions[*].buildings[*].building_segments[*].zones[*].terminals[*].served_by_heating_ventilating_air_conditioning_system",
-        rpd,
-    )
-    for hvac_id in served_by_hvac_id_list:
-        if hvac_id not in hvac_id_list:
-            mismatch_list.append(hvac_id)
-    return mismatch_list
+    return get_mismatched_references(*collect_ids_and_references(rpd)[:2], "hvac")
 
 
 def check_unique_ids_in_ruleset_model_descriptions(rmd: dict) -> str:
-    ruleset_model_descriptions = rmd.get("ruleset_model_descriptions", [])
-
-    bad_paths = []
-    for rmd_index, rmd in enumerate(ruleset_model_descriptions):
-        paths = json_paths_to_lists(rmd)
-
-        for list_path in paths:
-            ids = find_all(list_path + "[*].id", rmd)
-            if len(ids) != len(set(ids)):
-                bad_path = f"ruleset_model_descriptions[{rmd_index}]{list_path[1:]}"
-                bad_paths.append(bad_path)
-
-    error_msg = f"Non-unique ids for paths: {'; '.join(bad_paths)}" if bad_paths else ""
-
-    return error_msg
-
-
-def json_paths_to_lists(val: dict | list, path="$") -> set:
-    paths = set()
-    if isinstance(val, dict):
-        paths = json_paths_to_lists_from_dict(val, path)
-    elif isinstance(val, list):
-        paths = json_paths_to_lists_from_list(val, path)
-
-    return paths
-
-
-def json_paths_to_lists_from_dict(rmd: dict, path: str) -> set:
-    paths = set()
-    for key, val in rmd.items():
-        new_path = f"{path}.{key}"
-        new_paths = json_paths_to_lists(val, new_path)
-        paths = paths.union(new_paths)
-
-    return paths
-
-
-def json_paths_to_lists_from_list(rmd_list: list, path: str) -> list:
-    paths = {path}
-    for rmd in rmd_list:
-        new_path = f"{path}[*]"
-        new_paths = json_paths_to_lists(rmd, new_path)
-        paths = paths.union(new_paths)
-
-    return paths
+    return get_non_unique_id_error(collect_ids_and_references(rmd)[2])
 
 
 def non_schema_validate_rmd(rmd_obj):
     error = []
-    unique_id_error = check_unique_ids_in_ruleset_model_descriptions(rmd_obj)
+    # Collect every id and reference in a single walk of the RPD
+    id_sets, references, list_ids = collect_ids_and_references(rmd_obj)
+
+    unique_id_error = get_non_unique_id_error(list_ids)
     passed = not unique_id_error
     if not passed:
         error.append(unique_id_error)
 
-    mismatch_hvac_errors = check_hvac_association(rmd_obj)
+    mismatch_hvac_errors = get_mismatched_references(id_sets, references, "hvac")
     passed = passed and not mismatch_hvac_errors
     if mismatch_hvac_errors:
         error.append(
             f"Cannot find HVAC systems {mismatch_hvac_errors} in the HeatingVentilationAirConditioningSystems data group."
         )
 
-    mismatch_zone_errors = check_zone_association(rmd_obj)
+    mismatch_zone_errors = get_mismatched_references(id_sets, references, "zone")
     passed = passed and not mismatch_zone_errors
     if mismatch_zone_errors:
         error.append(
             f"Cannot find zones {mismatch_zone_errors} in the Zone data group."
         )
 
-    mismatch_fluid_loop_errors = check_fluid_loop_association(rmd_obj)
+    mismatch_fluid_loop_errors = get_mismatched_references(
+        id_sets, references, "fluid_loop"
+    )
     passed = passed and not mismatch_fluid_loop_errors
     if mismatch_fluid_loop_errors:
         error.append(
             f"Cannot find fluid loop {mismatch_fluid_loop_errors} in the FluidLoop data group."
         )
 
-    mismatch_schedule_errors = check_schedule_association(rmd_obj)
+    mismatch_schedule_errors = get_mismatched_references(
+        id_sets, references, "schedule"
+    )
     passed = passed and not mismatch_schedule_errors
     if mismatch_schedule_errors:
         error.append(
             f"Cannot find schedule {mismatch_schedule_errors} in the Schedule data group."
         )
 
-    mismatch_fluid_loop_piping_errors = check_fluid_loop_or_piping_association(rmd_obj)
+    mismatch_fluid_loop_piping_errors = get_mismatched_references(
+        id_sets, references, "fluid_loop_or_piping"
+    )
     passed = passed and not mismatch_fluid_loop_piping_errors
     if mismatch_fluid_loop_piping_errors:
         error.append(
             f"Cannot find piping {mismatch_fluid_loop_piping_errors} in the FluidLoop or ServiceWaterHeatingDistributionSystems data group."
         )
 
-    mismatch_service_water_heating_errors = check_service_water_heating_association(
-        rmd_obj
+    mismatch_service_water_heating_errors = get_mismatched_references(
+        id_sets, references, "service_water_heating"
     )
     passed = passed and not mismatch_service_water_heating_errors
     if mismatch_service_water_heating_errors:
@@ -292,33 +317,56 @@ def non_schema_validate_rmd(rmd_obj):
     return {"passed": passed, "error": error if error else None}
 
 
-def schema_validate_rmd(rmd_obj):
-    with open(SCHEMA_PATH) as json_file:
-        schema = json.load(json_file)
-    with open(SCHEMA_ENUM_PATH) as json_file:
-        schema_enum = json.load(json_file)
-    with open(SCHEMA_OUTPUT_PATH) as json_file:
-        schema_output = json.load(json_file)
-
-    schema_map = {
-        SCHEMA_FILENAME: schema,
-        SCHEMA_ENUM_FILENAME: schema_enum,
-        SCHEMA_OUTPUT_FILENAME: schema_output,
-    }
+def get_schema_validator(ruleset: Ruleset = None):
+    """
+    Get a JSON schema validator for a ruleset. The schema files are only loaded and the validator is only created when
+    the ruleset changes, e.g. with Config.set_active_ruleset(), so repeated validations reuse the same validator.
+    :param ruleset: (Ruleset) ruleset whose schema files are validated against; None uses the active ruleset
+    :return: jsonschema validator
+    """
+    global _schema_validator
+    ruleset = ruleset or Config.ACTIVE_RULESET
+
+    cached_ruleset, validator = _schema_validator
+    if validator is not None and cached_ruleset == ruleset:
+        return validator
+
+    # The schemas refer to the enumerations of other rulesets too, so every schema file is made available to $ref
+    schema_map = {}
+    for schema_path in sorted(file_dir.glob("*.schema.json")):
+        with open(schema_path) as json_file:
+            schema_map[schema_path.name] = json.load(json_file)
+    schema = schema_map[ruleset.SCHEMA_FILENAME]
     resolver = jsonschema.RefResolver.from_schema(schema, store=schema_map)
 
     validator = jsonschema.validators.validator_for(schema)
     validator = validator(schema, resolver=resolver)
-
-    try:
-        validator.validate(rmd_obj)
+    _schema_validator = (ruleset, validator)
+    return validator
+
+
+def schema_validate_rmd(rmd_obj, max_errors: int = 1):
+    """
+    Validate an RPD against the schema of the active ruleset.
+    :param rmd_obj: (dict) RPD
+    :param max_errors: (int) maximum number of schema errors to report; None reports every error. With more than 1,
+    each error message is preceded by the JSON path of the invalid value.
+    :return: dictionary with "passed" (bool) and "error" (str, or None if the RPD is valid)
+    """
+    errors = list(islice(get_schema_validator().iter_errors(rmd_obj), max_errors))
+    if not errors:
         return {"passed": True, "error": None}
-    except jsonschema.exceptions.ValidationError as err:
-        return {"passed": False, "error": "schema invalid: " + err.message}
+    if max_errors == 1:
+        return {"passed": False, "error": "schema invalid: " + errors[0].message}
+    return {
+        "passed": False,
+        "error": "schema invalid: "
+        + "; ".join(f"{err.json_path}: {err.message}" for err in errors),
+    }
 
 
-def validate_rmd(rmd_obj, test=False):
-    result = schema_validate_rmd(rmd_obj)
+def validate_rmd(rmd_obj, test=False, max_errors: int = 1):
+    result = schema_validate_rmd(rmd_obj, max_errors)
 
     if result["passed"] and not test:
         result = non_schema_validate_rmd(rmd_obj)
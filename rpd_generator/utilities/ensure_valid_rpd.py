@@ -1,98 +1,139 @@
-import re
-import copy
-
-
-def make_ids_unique(
-    data: dict | list,
-    seen_ids=None,
-    id_counters=None,
-    visited=None,
-    parent=None,
-    key=None,
-) -> None:
+from itertools import compress, repeat
+
+
+def make_ids_unique(data: dict | list) -> None:
     """
     Ensure that the rpd data structure is valid by appending a number to the end of the id if it is not unique, and removing empty dictionaries.
+
+    Objects are visited depth first in key order, so the first object with an id keeps it and later objects with the
+    same id are numbered in the order they appear. A dictionary that is reached a second time (the same object appears
+    in more than one place) is copied before it is renumbered, so that each place gets its own ids. Only the parts of
+    the copy that contain ids are copied; the rest stays shared.
     :param data: data structure
-    :param seen_ids: dictionary of ids that have been seen
-    :param id_counters: dictionary of ids that have been seen with a counter
-    :param visited: set of visited objects
-    :param parent: parent object
-    :param key: key of the object in the parent
     :return: None
     """
-    if seen_ids is None:
-        seen_ids = {}
-    if id_counters is None:
-        id_counters = {}
-    if visited is None:
-        visited = set()
-
-    if isinstance(data, dict):
-        obj_id = id(data)
-
-        if obj_id in visited:
-            if parent is not None and key is not None:
-                data_copy = copy.deepcopy(data)
-                parent[key] = data_copy
-                data = data_copy
-                obj_id = id(data)
-            else:
-                return
-
-        visited.add(obj_id)
-
-        if "id" in data:
-            current_id = data["id"]
-
-            if current_id in seen_ids:
-                match = re.search(r"--(\d+)$", current_id)
-                if match:
-                    number = int(match.group(1)) + 1
-                    unique_id = re.sub(r"--\d+$", f"--{number}", current_id)
-                else:
-                    seen_ids[current_id] += 1
-                    unique_id = f"{current_id}--{seen_ids[current_id]}"
-
-                while unique_id in seen_ids:
-                    match = re.search(r"--(\d+)$", unique_id)
-                    if match:
-                        number = int(match.group(1)) + 1
-                        unique_id = re.sub(r"--\d+$", f"--{number}", unique_id)
-
-                data["id"] = unique_id
-                seen_ids[unique_id] = 0
+    # ids that have been assigned: number of times the id has been renamed
+    seen_ids = {}
+    # "<base>--<n>" id that has been assigned: a suffix number at or below the next one free for the base
+    next_suffixes = {}
+    # id(obj): obj for every dictionary visited; holding the objects keeps their id() from being reused
+    visited = {}
+    # id(obj): True if the dictionary or list contains an id at any depth, for every container that has been left
+    has_ids = {}
+
+    # Entries are ("enter", obj, parent, key) to visit obj, or ("exit", obj, keys) once everything below obj is
+    # visited, where keys are the keys or indices of obj that hold dictionaries or lists
+    stack = [("enter", data, None, None)]
+    while stack:
+        entry = stack.pop()
+        obj = entry[1]
+
+        if entry[0] == "exit":
+            keys = entry[2]
+            has_ids[id(obj)] = any(has_ids.get(id(obj[k]), False) for k in keys) or (
+                isinstance(obj, dict) and "id" in obj
+            )
+            empty_keys = [k for k in keys if isinstance(obj[k], dict) and not obj[k]]
+            if not empty_keys:
+                continue
+            if isinstance(obj, dict):
+                for k in empty_keys:
+                    del obj[k]
             else:
-                seen_ids[current_id] = 0
+                obj[:] = [item for item in obj if not isinstance(item, dict) or item]
+            continue
 
-        keys_to_remove = []
-        for k, value in list(data.items()):
-            if isinstance(value, dict):
-                make_ids_unique(
-                    value, seen_ids, id_counters, visited, parent=data, key=k
-                )
-                if not value:
-                    keys_to_remove.append(k)
-            elif isinstance(value, list):
-                make_ids_unique(
-                    value, seen_ids, id_counters, visited, parent=data, key=k
+        parent, key = entry[2], entry[3]
+        if isinstance(obj, dict):
+            if id(obj) in visited:
+                if parent is None or not has_ids.get(id(obj), True):
+                    # Sharing an object without ids does not change the output
+                    continue
+                obj = _copy_with_ids(obj, has_ids, {})
+                parent[key] = obj
+            visited[id(obj)] = obj
+
+            if "id" in obj:
+                obj["id"] = _get_unique_id(obj["id"], seen_ids, next_suffixes)
+            keys = [k for k, value in obj.items() if isinstance(value, (dict, list))]
+        else:
+            # Long lists are mostly hourly values, so the types of the items are checked before the items themselves
+            if any(issubclass(t, (dict, list)) for t in set(map(type, obj))):
+                keys = list(
+                    compress(
+                        range(len(obj)), map(isinstance, obj, repeat((dict, list)))
+                    )
                 )
+            else:
+                keys = []
 
-        for k in keys_to_remove:
-            del data[k]
+        stack.append(("exit", obj, keys))
+        for k in reversed(keys):
+            stack.append(("enter", obj[k], obj, k))
 
-    elif isinstance(data, list):
-        items_to_remove = []
-        for index, item in enumerate(data):
-            if isinstance(item, dict):
-                make_ids_unique(
-                    item, seen_ids, id_counters, visited, parent=data, key=index
-                )
-                if not item:
-                    items_to_remove.append(item)
-            elif isinstance(item, list):
-                make_ids_unique(
-                    item, seen_ids, id_counters, visited, parent=data, key=index
-                )
 
-        for item in items_to_remove:
-            data.remove(item)
+def _get_unique_id(current_id: str, seen_ids: dict, next_suffixes: dict) -> str:
+    """
+    Get an id that has not been seen and record it as seen. An id that has been seen is numbered with a "--<n>"
+    suffix: ids that already end in a suffix count up from it, other ids count the times they have been renamed.
+    :param current_id: id of the object
+    :param seen_ids: ids that have been assigned: number of times the id has been renamed
+    :param next_suffixes: "<base>--<n>" id that has been assigned: a suffix number at or below the next one free
+    :return: unique id
+    """
+    if current_id not in seen_ids:
+        seen_ids[current_id] = 0
+        return current_id
+
+    base, separator, suffix = current_id.rpartition("--")
+    if separator and suffix.isdecimal():
+        number = int(suffix) + 1
+    else:
+        seen_ids[current_id] += 1
+        base, number = current_id, seen_ids[current_id]
+
+    # Skip over the numbers already taken, remembering where each run of taken numbers ends
+    unique_id = f"{base}--{number}"
+    taken_ids = []
+    while unique_id in seen_ids:
+        taken_ids.append(unique_id)
+        number = max(number + 1, next_suffixes.get(unique_id, 0))
+        unique_id = f"{base}--{number}"
+    for taken_id in taken_ids:
+        next_suffixes[taken_id] = number + 1
+
+    seen_ids[unique_id] = 0
+    return unique_id
+
+
+def _copy_with_ids(obj: dict | list, has_ids: dict, memo: dict) -> dict | list:
+    """
+    Copy the dictionaries and lists that contain ids, sharing everything else with the original.
+    :param obj: dictionary or list that contains ids
+    :param has_ids: id(obj): True if the dictionary or list contains an id at any depth
+    :param memo: id(obj): copy, so objects that appear more than once are copied once, as copy.deepcopy() does
+    :return: copy of obj
+    """
+    obj_copy = memo.get(id(obj))
+    if obj_copy is not None:
+        return obj_copy
+
+    if isinstance(obj, dict):
+        obj_copy = {}
+        memo[id(obj)] = obj_copy
+        for key, value in obj.items():
+            obj_copy[key] = (
+                _copy_with_ids(value, has_ids, memo)
+                if has_ids.get(id(value), False)
+                else value
+            )
+    else:
+        obj_copy = []
+        memo[id(obj)] = obj_copy
+        for item in obj:
+            obj_copy.append(
+                _copy_with_ids(item, has_ids, memo)
+                if has_ids.get(id(item), False)
+                else item
+            )
+    return obj_copy
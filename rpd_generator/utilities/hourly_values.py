@@ -0,0 +1,180 @@
+from array import array
+from collections import Counter
+from collections.abc import Sequence
+from itertools import chain
+
+HOURS_PER_DAY = 24
+
+
+def get_day_values(values: list):
+    """
+    Store the hourly values of a day in a typed array of doubles.
+    :param values: (list) hourly values of the day
+    :return: array('d') of the values, or the list unchanged if any value is not a number (e.g. None)
+    """
+    try:
+        return array("d", values)
+    except TypeError:
+        return values
+
+
+class HourlyValues(Sequence):
+    """
+    Read-only sequence of the hourly values of a year, stored as one row of 24 values per day. Days that use the same
+    day schedule share a single row, so a year of values holds one reference per day instead of one float per hour.
+    The values are only expanded to a list when the RPD is written to JSON.
+    """
+
+    __slots__ = ("day_values",)
+
+    def __init__(self, day_values: list):
+        """
+        :param day_values: (list) of day rows, each a sequence of 24 hourly values
+        """
+        self.day_values = day_values
+
+    @staticmethod
+    def from_day_values(day_values: list):
+        """
+        Create the hourly values of a year from its day rows.
+        :param day_values: (list) of day rows, each a sequence of hourly values
+        :return: HourlyValues, or a flat list if any day does not have 24 hourly values
+        """
+        if all(len(values) == HOURS_PER_DAY for values in day_values):
+            return HourlyValues(day_values)
+        return list(chain.from_iterable(day_values))
+
+    def __len__(self):
+        return len(self.day_values) * HOURS_PER_DAY
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self.tolist()[index]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("hourly value index out of range")
+        day, hour = divmod(index, HOURS_PER_DAY)
+        return self.day_values[day][hour]
+
+    def __iter__(self):
+        return chain.from_iterable(self.day_values)
+
+    def __eq__(self, other):
+        if isinstance(other, HourlyValues):
+            other = other.tolist()
+        elif not isinstance(other, (list, array)):
+            return NotImplemented
+        return self.tolist() == list(other)
+
+    def __repr__(self):
+        return f"HourlyValues({len(self)} values)"
+
+    def tolist(self) -> list:
+        return list(chain.from_iterable(self.day_values))
+
+
+def serialize_hourly_values(obj):
+    """
+    Convert hourly value containers to lists when writing JSON. Pass as the default argument of json.dump().
+    :param obj: object the JSON encoder cannot serialize
+    :return: (list) of hourly values
+    """
+    if isinstance(obj, (HourlyValues, array)):
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def get_distinct_rows(hourly_values) -> dict:
+    """
+    Get the distinct rows of hourly values and the number of times each is used. Days that share a row are counted
+    once, so the values of a year can be analyzed one day schedule at a time.
+    :param hourly_values: HourlyValues, or a flat sequence of hourly values
+    :return: (dict) id(row): (row, number of times the row is used)
+    """
+    if isinstance(hourly_values, HourlyValues):
+        rows = {id(values): values for values in hourly_values.day_values}
+        row_counts = Counter(map(id, hourly_values.day_values))
+        return {row_id: (rows[row_id], count) for row_id, count in row_counts.items()}
+    return {id(hourly_values): (hourly_values, 1)}
+
+
+def get_values_hash(hourly_values) -> int:
+    """
+    Hash hourly values by their distinct day rows and the row each day uses, so a row shared by many days is only
+    hashed once. Equal values have equal hashes, whether they are HourlyValues or a flat sequence.
+    :param hourly_values: HourlyValues, or a flat sequence of hourly values
+    :return: (int) hash of the values
+    """
+    if isinstance(hourly_values, HourlyValues):
+        day_rows = hourly_values.day_values
+    else:
+        values = list(hourly_values)
+        day_rows = [
+            values[i : i + HOURS_PER_DAY] for i in range(0, len(values), HOURS_PER_DAY)
+        ]
+
+    # row values (tuple): index of the row, in the order the rows are first used
+    row_indexes = {}
+    # id(row): index of the row, so rows with the same values share an index
+    id_indexes = {}
+    for values in day_rows:
+        if id(values) not in id_indexes:
+            id_indexes[id(values)] = row_indexes.setdefault(
+                tuple(values), len(row_indexes)
+            )
+    return hash(
+        (tuple(row_indexes), tuple(id_indexes[id(values)] for values in day_rows))
+    )
+
+
+def get_hourly_value_statistics(hourly_values) -> dict:
+    """
+    Summarize the hourly values of a schedule. Each distinct day row is only scanned once.
+    :param hourly_values: HourlyValues, or a flat sequence of hourly values
+    :return: (dict) with keys
+        "is_continuous": True if no value is 0 or -1 (off),
+        "has_zero": True if any value is 0,
+        "min" and "max": smallest and largest value, ignoring values that are not set,
+        "equivalent_full_load_hours": sum of the values,
+        "hash": hash of the values from get_values_hash(); equal values have equal hashes
+    """
+    rows = get_distinct_rows(hourly_values).values()
+    distinct_values = {value for values, _ in rows for value in values}
+    numbers = [value for value in distinct_values if value is not None]
+    return {
+        "is_continuous": 0 not in distinct_values and -1 not in distinct_values,
+        "has_zero": 0 in distinct_values,
+        "min": min(numbers, default=None),
+        "max": max(numbers, default=None),
+        "equivalent_full_load_hours": sum(
+            sum(value for value in values if value is not None) * count
+            for values, count in rows
+        ),
+        "hash": get_values_hash(hourly_values),
+    }
+
+
+def get_coincident_values(hourly_values, other_hourly_values) -> set:
+    """
+    Get the distinct pairs of values that two sets of hourly values have in the same hour.
+    :param hourly_values: HourlyValues, or a flat sequence of hourly values
+    :param other_hourly_values: HourlyValues, or a flat sequence of hourly values of the same length
+    :return: (set) of (value, other value) tuples
+    """
+    if isinstance(hourly_values, HourlyValues) and isinstance(
+        other_hourly_values, HourlyValues
+    ):
+        # Days that pair the same two rows only need to be compared once
+        row_pairs = {
+            (id(values), id(other_values)): (values, other_values)
+            for values, other_values in zip(
+                hourly_values.day_values, other_hourly_values.day_values
+            )
+        }
+        return {
+            value_pair
+            for values, other_values in row_pairs.values()
+            for value_pair in zip(values, other_values)
+        }
+    return set(zip(hourly_values, other_hourly_values))
@@ -0,0 +1,103 @@
+import gzip
+import json
+from array import array
+
+from rpd_generator.utilities.hourly_values import (
+    HourlyValues,
+    serialize_hourly_values,
+)
+
+try:
+    import orjson
+except ImportError:
+    # orjson is optional; compact JSON is encoded with the standard library without it
+    orjson = None
+
+
+def write_json(
+    data: dict,
+    json_file_path: str,
+    indent: int | None = 4,
+    significant_digits: int | None = None,
+):
+    """
+    Write data, such as the RPD data structure, to a JSON file. Files whose name ends in ".gz" are gzip compressed.
+    Compact JSON is encoded with orjson when it is installed. The file is the same as the standard library writes
+    except that orjson does not escape non-ASCII characters and writes NaN and infinite floats as null, where the
+    standard library writes NaN, Infinity and -Infinity, which are not valid JSON.
+    :param data: (dict) data to write; hourly value containers are written as lists
+    :param json_file_path: (str) path of the JSON file to write
+    :param indent: (int) number of spaces each level is indented by; None writes compact JSON on a single line
+    :param significant_digits: (int) number of significant digits floats are rounded to; None writes floats in full
+    :return: None
+    """
+    if significant_digits is not None:
+        data = round_floats(data, significant_digits)
+    is_gzip = str(json_file_path).endswith(".gz")
+
+    if indent is None and orjson is not None:
+        # orjson encodes to bytes, which are written as they are
+        json_bytes = orjson.dumps(
+            data, default=serialize_hourly_values, option=orjson.OPT_NON_STR_KEYS
+        )
+        open_file = gzip.open if is_gzip else open
+        with open_file(json_file_path, "wb") as json_file:
+            json_file.write(json_bytes)
+        return
+
+    if is_gzip:
+        json_file = gzip.open(json_file_path, "wt", encoding="utf-8")
+    else:
+        json_file = open(json_file_path, "w", encoding="utf-8")
+    with json_file:
+        # json.dump writes the document in chunks instead of building it as a single string
+        json.dump(
+            data,
+            json_file,
+            indent=indent,
+            separators=(",", ":") if indent is None else None,
+            default=serialize_hourly_values,
+        )
+
+
+def round_floats(data, significant_digits: int):
+    """
+    Copy data with every float rounded to a number of significant digits. The day rows of hourly values are rounded
+    once each, however many days share them.
+    :param data: data to copy; dictionaries, lists, and hourly value containers are copied, other values are kept
+    :param significant_digits: (int) number of significant digits to round to
+    :return: copy of data with rounded floats
+    """
+    float_format = f".{significant_digits}g"
+    rounded_rows = {}
+
+    def round_row(values) -> list:
+        row_key = id(values)
+        if row_key not in rounded_rows:
+            rounded_rows[row_key] = (
+                values,
+                [
+                    (
+                        float(format(value, float_format))
+                        if type(value) is float
+                        else value
+                    )
+                    for value in values
+                ],
+            )
+        return rounded_rows[row_key][1]
+
+    def round_value(value):
+        if isinstance(value, float):
+            return float(format(value, float_format))
+        if isinstance(value, dict):
+            return {key: round_value(item) for key, item in value.items()}
+        if isinstance(value, list):
+            return [round_value(item) for item in value]
+        if isinstance(value, HourlyValues):
+            return HourlyValues([round_row(values) for values in value.day_values])
+        if isinstance(value, array):
+            return round_row(value)
+        return value
+
+    return round_value(data)
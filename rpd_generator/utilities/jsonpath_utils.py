@@ -1,17 +1,73 @@
+import re
+from functools import lru_cache
 from itertools import chain
-from jsonpath2 import match
+from jsonpath2.path import Path
 from typing import TypedDict
 
+# Maximum number of compiled JSONPath expressions kept in memory
+JSONPATH_CACHE_SIZE = 1024
+# A single ".key", "[*]", or "[index]" step of a JSONPath
+SIMPLE_PATH_STEP = re.compile(r"\.([A-Za-z_][A-Za-z0-9_]*)|\[(\*|[0-9]+)\]")
+
 
 class ZonesTerminalsServedByHVACSys(TypedDict):
     terminal_list: list[str]
     zone_list: list[str]
 
 
+@lru_cache(maxsize=JSONPATH_CACHE_SIZE)
+def compile_jsonpath(jpath: str):
+    """
+    Parse a JSONPath once and keep it for reuse.
+    :param jpath: (str) JSONPath starting at the root ("$")
+    :return: tuple of the parsed jsonpath2 Path and, for paths made only of ".key", "[*]", and "[index]" steps, a
+    tuple of the steps (str keys, int indices, and None for wildcards) that find_all() follows without jsonpath2;
+    otherwise None
+    """
+    # Parse every path with jsonpath2 so invalid paths raise the same errors with or without the fast path
+    path = Path.parse_str(jpath)
+
+    steps = []
+    position = 1
+    for step in SIMPLE_PATH_STEP.finditer(jpath, 1):
+        if step.start() != position:
+            break
+        key, index = step.groups()
+        steps.append(key if key is not None else (None if index == "*" else int(index)))
+        position = step.end()
+    simple_steps = tuple(steps) if position == len(jpath) else None
+
+    return path, simple_steps
+
+
+def find_all_with_steps(steps, obj):
+    """
+    Find all values at the end of a sequence of simple steps, in the same order as jsonpath2.
+    :param steps: (tuple) str keys, int indices, and None for wildcards, from compile_jsonpath()
+    :param obj: (dict or list) object to search
+    :return: (list) of values found
+    """
+    values = [obj]
+    for step in steps:
+        next_values = []
+        for value in values:
+            if step is None:
+                if isinstance(value, list):
+                    next_values.extend(value)
+                elif isinstance(value, dict):
+                    next_values.extend(value.values())
+            elif isinstance(step, str):
+                if isinstance(value, dict) and step in value:
+                    next_values.append(value[step])
+            elif isinstance(value, list) and step < len(value):
+                next_values.append(value[step])
+        values = next_values
+    return values
+
+
 def create_jsonpath_value_dict(jpath, obj):
-    return {
-        m.node.tojsonpath(): m.current_value for m in match(ensure_root(jpath), obj)
-    }
+    path, _ = compile_jsonpath(ensure_root(jpath))
+    return {m.node.tojsonpath(): m.current_value for m in path.match(obj)}
 
 
 def ensure_root(jpath):
@@ -19,7 +75,10 @@ def ensure_root(jpath):
 
 
 def find_all(jpath, obj):
-    return [m.current_value for m in match(ensure_root(jpath), obj) if m]
+    path, simple_steps = compile_jsonpath(ensure_root(jpath))
+    if simple_steps is not None:
+        return find_all_with_steps(simple_steps, obj)
+    return [m.current_value for m in path.match(obj) if m]
 
 
 def find_all_by_jsonpaths(jpaths: list, obj: dict) -> list:
@@ -27,10 +86,7 @@ def find_all_by_jsonpaths(jpaths: list, obj: dict) -> list:
 
 
 def find_all_with_field_value(jpath, field, value, obj):
-    return [
-        m.current_value
-        for m in match(ensure_root(f'{jpath}[?(@.{field}="{value}")]'), obj)
-    ]
+    return find_all(f'{jpath}[?(@.{field}="{value}")]', obj)
 
 
 def find_all_with_filters(jpath, filters, obj):
@@ -39,9 +95,7 @@ def find_all_with_filters(jpath, filters, obj):
         [f'@.{field}="{value}"' for field, value in filters.items()]
     )
 
-    return [
-        m.current_value for m in match(ensure_root(f"{jpath}[?({filter_expr})]"), obj)
-    ]
+    return find_all(f"{jpath}[?({filter_expr})]", obj)
 
 
 def find_one(jpath, obj, default=None):
@@ -104,6 +104,18 @@ def generate_year_calendar(year: int, first_day: str) -> dict:
     return day_types_365
 
 
+def compile_calendar(calendar: dict) -> tuple:
+    """
+    Compile a calendar dictionary into the forms used to expand schedules.
+    :param calendar: dictionary mapping "month/day" to a day type, returned by `generate_year_calendar()`
+    :return: tuple of the zero-based day type index of each day of the year, and a dictionary mapping "month/day" to
+    the index of the day in the year
+    """
+    day_type_indices = tuple(day_type - 1 for day_type in calendar.values())
+    date_ordinals = {date: day_index for day_index, date in enumerate(calendar)}
+    return day_type_indices, date_ordinals
+
+
 def set_holiday_if_workday(day_types_365: dict, date: str):
     """Helper function to set the date as a holiday if it's a workday."""
     if day_types_365[date] == MONDAY:
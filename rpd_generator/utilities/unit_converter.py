@@ -1,11 +1,9 @@
 import os
 import json
-import pint
-from jsonpath2 import match
+from functools import lru_cache
 
 
 path_to_ureg = os.path.join(os.path.dirname(__file__), "resources", "unit_registry.txt")
-ureg = pint.UnitRegistry(path_to_ureg, autoconvert_offset_to_baseunit=True)
 
 path_to_schema_units = os.path.join(
     os.path.dirname(os.path.dirname(__file__)),
@@ -16,46 +14,157 @@ path_to_schema_units = os.path.join(
 path_to_equest_units = os.path.join(
     os.path.dirname(__file__), "resources", "equest_units.json"
 )
-path_to_json_paths = os.path.join(
-    os.path.dirname(__file__), "resources", "manual_item_json_paths.json"
+path_to_schema = os.path.join(
+    os.path.dirname(os.path.dirname(__file__)), "schema", "ASHRAE229.schema.json"
 )
+SCHEMA_DEFINITION_REF = "ASHRAE229.schema.json#/definitions/"
 
 
-def convert_to_schema_units(rpd_json):
-    """Converts the units of the json data to the standard units defined in the schema"""
+@lru_cache(maxsize=None)
+def get_unit_registry():
+    """
+    Get the unit registry shared by every unit conversion. The registry is created on first use, so importing this
+    module does not pay for importing pint and parsing unit_registry.txt.
+    :return: pint.UnitRegistry defined by unit_registry.txt
+    """
+    import pint
+
+    return pint.UnitRegistry(path_to_ureg, autoconvert_offset_to_baseunit=True)
+
+
+@lru_cache(maxsize=None)
+def get_conversion_factors(from_units: str, to_units: str) -> tuple:
+    """
+    Get the factors that convert a value from one unit to another as value * scale + offset. Factors are computed with
+    the unit registry once per pair of units.
+    :param from_units: (str) units to convert from
+    :param to_units: (str) units to convert to
+    :return: (tuple) scale (float) and offset (float); the offset is 0.0 unless either unit has an offset, e.g. F to C
+    :raises pint.errors.DimensionalityError: if the units cannot be converted to one another
+    """
+    ureg = get_unit_registry()
+
+    def convert(value):
+        return (value * ureg(from_units)).to(to_units).magnitude
+
+    offset = convert(0.0)
+    if offset == 0:
+        return convert(1.0), 0.0
+    # Reference points far from zero keep the scale of offset units accurate to the last few bits
+    return (convert(1000.0) - convert(-1000.0)) / 2000.0, offset
+
+
+def convert_value(value: float, from_units: str, to_units: str) -> float:
+    """
+    Convert a value from one unit to another using the cached conversion factors.
+    :param value: (float) value to convert
+    :param from_units: (str) units to convert from
+    :param to_units: (str) units to convert to
+    :return: (float) converted value
+    :raises pint.errors.DimensionalityError: if the units cannot be converted to one another
+    """
+    scale, offset = get_conversion_factors(from_units, to_units)
+    if offset:
+        return value * scale + offset
+    return value * scale
+
+
+@lru_cache(maxsize=None)
+def get_conversion_plan() -> tuple:
+    """
+    Compile the unit conversions of every data group from the eQUEST units, the schema units, and the data group
+    structure of the schema. Data groups that neither have values to convert nor lead to a data group that does are
+    left out, so the RPD walk does not descend into them.
+    :return: (tuple) name of the root data group (str) and a dictionary of data group name (str): (conversions,
+    children), where conversions is a list of (key, eQUEST units, schema units, (scale, offset) or None) tuples and
+    children is a list of (key, data group name) tuples for the keys that hold child data groups
+    """
+    from pint.errors import PintError
+
     with open(path_to_equest_units) as f:
         equest_units = json.load(f)
 
     with open(path_to_schema_units) as f:
         schema_units = json.load(f)
 
-    with open(path_to_json_paths) as f:
-        item_paths = json.load(f)
+    with open(path_to_schema) as f:
+        schema = json.load(f)
+
+    conversions = {}
+    for data_group, unit_dict in equest_units.items():
+        conversions[data_group] = []
+        for key, from_units in unit_dict.items():
+            to_units = schema_units.get(data_group).get(key)
+            try:
+                factors = get_conversion_factors(from_units, to_units)
+            except PintError:
+                # Units that are not known yet; converting a value with them raises the error again
+                factors = None
+            conversions[data_group].append((key, from_units, to_units, factors))
+
+    children = {}
+    for data_group, definition in schema["definitions"].items():
+        children[data_group] = []
+        for key, prop in definition.get("properties", {}).items():
+            ref = prop.get("$ref") or prop.get("items", {}).get("$ref", "")
+            if ref.startswith(SCHEMA_DEFINITION_REF):
+                children[data_group].append((key, ref[len(SCHEMA_DEFINITION_REF) :]))
+
+    # Keep the data groups with values to convert and, repeatedly, their parents
+    needed = {data_group for data_group, convs in conversions.items() if convs}
+    added = True
+    while added:
+        added = False
+        for data_group, child_list in children.items():
+            if data_group not in needed and any(
+                child in needed for _, child in child_list
+            ):
+                needed.add(data_group)
+                added = True
+
+    plan = {
+        data_group: (
+            conversions.get(data_group, []),
+            [(key, child) for key, child in children[data_group] if child in needed],
+        )
+        for data_group in needed
+    }
+    return schema["$ref"][len(SCHEMA_DEFINITION_REF) :], plan
 
+
+def convert_to_schema_units(rpd_json):
+    """
+    Converts the units of the json data to the standard units defined in the schema in a single walk of the RPD.
+    :param rpd_json: (dict) RPD; values are converted in place
+    :return: None
+    """
+    root_data_group, plan = get_conversion_plan()
     processed_ids = set()
 
-    def convert_units(dg, json_data, unit_dict):
-        for element in json_data:
-            if id(element) in processed_ids:
-                continue  # Prevent processing the same object multiple times
-
-            processed_ids.add(id(element))  # Mark this object as processed
-
-            if isinstance(element, list):
-                convert_units(dg, element, unit_dict)  # Recurse into lists
-            elif isinstance(element, dict):
-                for key, value in element.items():
-                    if key in unit_dict and isinstance(value, (int, float)):
-                        element[key] = value * ureg(unit_dict[key])
-                        schema_unit = schema_units.get(dg).get(key)
-                        element[key] = element[key].to(schema_unit)
-                        element[key] = element[key].magnitude
-
-    for data_group in equest_units:
-        elements_w_units = equest_units[data_group]
-        json_paths = item_paths.get(data_group)
-
-        for json_path in json_paths:
-            matches = [m.current_value for m in match(json_path, rpd_json)]
-            unique_matches = [obj for obj in matches if id(obj) not in processed_ids]
-            convert_units(data_group, unique_matches, elements_w_units)
+    def convert_units(element, data_group):
+        if id(element) in processed_ids:
+            return  # Prevent processing the same object multiple times
+        processed_ids.add(id(element))
+
+        conversions, children = plan[data_group]
+        for key, from_units, to_units, factors in conversions:
+            value = element.get(key)
+            if isinstance(value, (int, float)):
+                if factors is None:
+                    element[key] = convert_value(value, from_units, to_units)
+                elif factors[1]:
+                    element[key] = value * factors[0] + factors[1]
+                else:
+                    element[key] = value * factors[0]
+
+        for key, child_data_group in children:
+            child = element.get(key)
+            if isinstance(child, dict):
+                convert_units(child, child_data_group)
+            elif isinstance(child, list):
+                for item in child:
+                    if isinstance(item, dict):
+                        convert_units(item, child_data_group)
+
+    if root_data_group in plan:
+        convert_units(rpd_json, root_data_group)
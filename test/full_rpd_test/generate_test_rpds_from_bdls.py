@@ -1,5 +1,7 @@
+import argparse
 from pathlib import Path
 from rpd_generator import main as rpd_generator
+from rpd_generator.doe2_file_readers import result_recording
 from rpd_generator.utilities import validate_configuration
 
 
@@ -16,5 +18,34 @@ def generate_test_rpds_from_bdls():
 
 
 if __name__ == "__main__":
-    validate_configuration.find_equest_installation()
+    parser = argparse.ArgumentParser(
+        description="Generate the test case RPDs from the test case BDL files."
+    )
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument(
+        "--record",
+        action="store_true",
+        help="Record the simulation results used next to each test case (requires eQUEST).",
+    )
+    mode.add_argument(
+        "--replay",
+        action="store_true",
+        help="Serve the simulation results from recordings made with --record (runs without eQUEST).",
+    )
+    args = parser.parse_args()
+
+    if args.replay:
+        result_recording.start_replay(
+            Path(__file__).parent.rglob(f"*{result_recording.RECORDING_EXTENSION}"),
+            Path(__file__).parent,
+        )
+    else:
+        validate_configuration.find_equest_installation()
+        if args.record:
+            result_recording.start_recording(recording_root=Path(__file__).parent)
+
     generate_test_rpds_from_bdls()
+
+    if args.record:
+        for recording_path in result_recording.save_recordings():
+            print(f"Recorded simulation results to {recording_path}")
@@ -1,8 +1,14 @@
+import argparse
 import sys
 import os
 import json
 import math
+import re
+import time
+import xml.etree.ElementTree as ET
+from concurrent.futures import ProcessPoolExecutor
 from difflib import get_close_matches
+from functools import partial
 
 from rpd_generator.utilities.jsonpath_utils import (
     find_one,
@@ -19,6 +25,71 @@ def load_json_file(file_path):
         return json.load(file)
 
 
+def build_id_index(json_data):
+    """
+    Index every object with an id in a JSON document in a single walk of the document.
+    Returns a dictionary of ids and lists of (location, object, parent object) tuples in document order, where the
+    location is a tuple of the keys and list indices leading to the object and the parent object is the nearest
+    enclosing object with an id.
+    """
+    id_index = {}
+
+    def index_node(node, location, parent):
+        if isinstance(node, dict):
+            object_id = node.get("id")
+            if isinstance(object_id, str):
+                id_index.setdefault(object_id, []).append((location, node, parent))
+                parent = node
+            for key, value in node.items():
+                if isinstance(value, (dict, list)):
+                    index_node(value, location + (key,), parent)
+        elif isinstance(node, list):
+            for i, value in enumerate(node):
+                if isinstance(value, (dict, list)):
+                    index_node(value, location + (i,), parent)
+
+    index_node(json_data, (), None)
+    return id_index
+
+
+def get_path_steps(json_path):
+    """
+    Split a JSON path of keys and list indices into steps comparable to id index locations. [*] becomes None.
+    """
+    return tuple(
+        key if key else (None if index == "*" else int(index))
+        for key, index in re.findall(r"\.(\w+)|\[(\*|\d+)\]", json_path)
+    )
+
+
+def find_indexed_objects(id_index, collection_path, object_id):
+    """Finds the objects with the id at locations that match a path such as '$.ruleset_model_descriptions[0].pumps[*]'."""
+    if not isinstance(object_id, str):
+        return []
+    steps = get_path_steps(collection_path)
+    return [
+        (obj, parent)
+        for location, obj, parent in id_index.get(object_id, [])
+        if len(location) == len(steps)
+        and all(step is None or step == key for step, key in zip(steps, location))
+    ]
+
+
+def find_aligned_value(json_key_path, group, object_id, id_index):
+    """
+    Finds the value at a JSON key path for the object with the id in a group of objects such as 'zones', without
+    searching the whole document. Any filter or path following the group in the JSON key path is applied to the object.
+    """
+    collection_end = json_key_path.index(f"{group}[*]") + len(group) + 3
+    for obj, _ in find_indexed_objects(
+        id_index, json_key_path[:collection_end], object_id
+    ):
+        values = find_all("$[*]" + json_key_path[collection_end:], [obj])
+        if values:
+            return values[0]
+    return None
+
+
 def compare_json_values(spec, generated_values, reference_values, generated_ids):
     """Compares a list of generated and reference JSON values based on the spec."""
     json_key_path = spec["json-key-path"]
@@ -822,7 +893,14 @@ def map_objects(generated_json, reference_json):
     return object_id_map, warnings, errors
 
 
-def handle_special_cases(path_spec, object_id_map, generated_json, reference_json):
+def handle_special_cases(
+    path_spec,
+    object_id_map,
+    generated_json,
+    reference_json,
+    generated_index,
+    reference_index,
+):
     warnings = []
     errors = []
 
@@ -911,61 +989,35 @@ def handle_special_cases(path_spec, object_id_map, generated_json, reference_jso
         aligned_generated_values = {}
         aligned_reference_values = {}
 
-        generated_zones = get_zones_from_json(generated_json)
-
-        generated_surfaces = find_all(
-            json_key_path[
-                : json_key_path.index("].", json_key_path.index("surfaces")) + 1
-            ],
-            generated_json,
-        )
+        surface_path = json_key_path[
+            : json_key_path.index("].", json_key_path.index("surfaces")) + 1
+        ]
+        generated_surfaces = find_all(surface_path, generated_json)
 
         # Iterate through the generated surfaces to populate data for each surface individually, ensuring correct alignment via object mapping
         for generated_surface in generated_surfaces:
             generated_surface_id = generated_surface["id"]
             reference_surface_id = object_id_map.get(generated_surface_id)
 
-            aligned_reference_surface = find_one(
-                json_key_path[
-                    : json_key_path.index("].", json_key_path.index("surfaces")) + 1
-                ]
-                + f'[?(@.id="{reference_surface_id}")]',
-                reference_json,
-                None,
+            aligned_reference_surface = find_aligned_value(
+                surface_path, "surfaces", reference_surface_id, reference_index
             )
 
-            generated_parent_zone = next(
-                zone
-                for zone in generated_zones
-                if any(
-                    surface["id"] == generated_surface_id
-                    for surface in zone.get("surfaces", [])
-                )
-            )
+            # The parent of a surface in the id index is the zone it belongs to
+            generated_parent_zone = find_indexed_objects(
+                generated_index,
+                json_key_path[: json_key_path.index("surfaces[*]") + 11],
+                generated_surface_id,
+            )[0][1]
             generated_parent_zone_id = generated_parent_zone["id"]
             reference_parent_zone_id = object_id_map.get(generated_parent_zone_id)
 
             generated_value = generated_surface.get(json_key_path.split(".")[-1])
             aligned_generated_values[generated_surface_id] = generated_value
             # Extract values from aligned surfaces using the specified key path
-            if "surfaces[*][?(@" in json_key_path:
-                aligned_reference_value = find_one(
-                    json_key_path.replace(
-                        "surfaces[*][?(",
-                        f'surfaces[*][?(@.id="{reference_surface_id}" and ',
-                    ),
-                    reference_json,
-                    None,
-                )
-            else:
-                aligned_reference_value = find_one(
-                    json_key_path.replace(
-                        "surfaces[*]",
-                        f'surfaces[*][?(@.id="{reference_surface_id}")]',
-                    ),
-                    reference_json,
-                    None,
-                )
+            aligned_reference_value = find_aligned_value(
+                json_key_path, "surfaces", reference_surface_id, reference_index
+            )
             aligned_reference_values[generated_surface_id] = aligned_reference_value
 
             mismatched_wall_origin_adjacent_zone = (
@@ -999,7 +1051,7 @@ def handle_special_cases(path_spec, object_id_map, generated_json, reference_jso
 
 
 def handle_ordered_comparisons(
-    path_spec, object_id_map, reference_json, generated_json
+    path_spec, object_id_map, reference_json, generated_json, reference_index
 ):
     json_key_path = path_spec["json-key-path"]
 
@@ -1029,12 +1081,8 @@ def handle_ordered_comparisons(
             generated_value = find_one(zone_data_path, generated_zone)
             aligned_generated_values[generated_zone_id] = generated_value
             # Extract values from aligned zones using the specified key path
-            aligned_reference_value = find_one(
-                json_key_path.replace(
-                    "zones[*]", f'zones[*][?(@.id="{reference_zone_id}")]'
-                ),
-                reference_json,
-                None,
+            aligned_reference_value = find_aligned_value(
+                json_key_path, "zones", reference_zone_id, reference_index
             )
 
             aligned_reference_values[generated_zone_id] = aligned_reference_value
@@ -1080,24 +1128,9 @@ def handle_ordered_comparisons(
             aligned_generated_values[generated_surface_id] = generated_value
 
             # Extract values from aligned surfaces using the specified key path
-            if "surfaces[*][?(@" in json_key_path:
-                aligned_reference_value = find_one(
-                    json_key_path.replace(
-                        "surfaces[*][?(",
-                        f'surfaces[*][?(@.id="{reference_surface_id}" and ',
-                    ),
-                    reference_json,
-                    None,
-                )
-            else:
-                aligned_reference_value = find_one(
-                    json_key_path.replace(
-                        "surfaces[*]",
-                        f'surfaces[*][?(@.id="{reference_surface_id}")]',
-                    ),
-                    reference_json,
-                    None,
-                )
+            aligned_reference_value = find_aligned_value(
+                json_key_path, "surfaces", reference_surface_id, reference_index
+            )
 
             aligned_reference_values[generated_surface_id] = aligned_reference_value
 
@@ -1143,24 +1176,9 @@ def handle_ordered_comparisons(
             aligned_generated_values[generated_terminal_id] = generated_value
 
             # Extract values from aligned terminals using the specified key path
-            if "terminals[*][?(@" in json_key_path:
-                aligned_reference_value = find_one(
-                    json_key_path.replace(
-                        "terminals[*][?(",
-                        f'terminals[*][?(@.id="{reference_terminal_id}" and ',
-                    ),
-                    reference_json,
-                    None,
-                )
-            else:
-                aligned_reference_value = find_one(
-                    json_key_path.replace(
-                        "terminals[*]",
-                        f'terminals[*][?(@.id="{reference_terminal_id}")]',
-                    ),
-                    reference_json,
-                    None,
-                )
+            aligned_reference_value = find_aligned_value(
+                json_key_path, "terminals", reference_terminal_id, reference_index
+            )
 
             aligned_reference_values[generated_terminal_id] = aligned_reference_value
 
@@ -1208,13 +1226,11 @@ def handle_ordered_comparisons(
             generated_value = find_one(hvac_data_path, generated_boiler)
             aligned_generated_values[generated_boiler_id] = generated_value
             # Extract values from aligned zones using the specified key path
-            aligned_reference_value = find_one(
-                json_key_path.replace(
-                    "heating_ventilating_air_conditioning_systems[*]",
-                    f'heating_ventilating_air_conditioning_systems[*][?(@.id="{reference_boiler_id}")]',
-                ),
-                reference_json,
-                None,
+            aligned_reference_value = find_aligned_value(
+                json_key_path,
+                "heating_ventilating_air_conditioning_systems",
+                reference_boiler_id,
+                reference_index,
             )
 
             aligned_reference_values[generated_boiler_id] = aligned_reference_value
@@ -1253,13 +1269,8 @@ def handle_ordered_comparisons(
             generated_value = find_one(boiler_data_path, generated_boiler)
             aligned_generated_values[generated_boiler_id] = generated_value
 
-            aligned_reference_value = find_one(
-                json_key_path.replace(
-                    "boilers[*]",
-                    f'boilers[*][?(@.id="{reference_boiler_id}")]',
-                ),
-                reference_json,
-                None,
+            aligned_reference_value = find_aligned_value(
+                json_key_path, "boilers", reference_boiler_id, reference_index
             )
 
             aligned_reference_values[generated_boiler_id] = aligned_reference_value
@@ -1298,13 +1309,8 @@ def handle_ordered_comparisons(
             generated_value = find_one(chiller_data_path, generated_chiller)
             aligned_generated_values[generated_chiller_id] = generated_value
 
-            aligned_reference_value = find_one(
-                json_key_path.replace(
-                    "chillers[*]",
-                    f'chillers[*][?(@.id="{reference_chiller_id}")]',
-                ),
-                reference_json,
-                None,
+            aligned_reference_value = find_aligned_value(
+                json_key_path, "chillers", reference_chiller_id, reference_index
             )
 
             aligned_reference_values[generated_chiller_id] = aligned_reference_value
@@ -1347,13 +1353,11 @@ def handle_ordered_comparisons(
             )
             aligned_generated_values[generated_heat_rejection_id] = generated_value
 
-            aligned_reference_value = find_one(
-                json_key_path.replace(
-                    "heat_rejections[*]",
-                    f'heat_rejections[*][?(@.id="{reference_heat_rejection_id}")]',
-                ),
-                reference_json,
-                None,
+            aligned_reference_value = find_aligned_value(
+                json_key_path,
+                "heat_rejections",
+                reference_heat_rejection_id,
+                reference_index,
             )
 
             aligned_reference_values[generated_heat_rejection_id] = (
@@ -1396,13 +1400,8 @@ def handle_ordered_comparisons(
             generated_value = find_one(fluid_loop_data_path, generated_fluid_loop)
             aligned_generated_values[generated_fluid_loop_id] = generated_value
 
-            aligned_reference_value = find_one(
-                json_key_path.replace(
-                    "fluid_loops[*]",
-                    f'fluid_loops[*][?(@.id="{reference_fluid_loop_id}")]',
-                ),
-                reference_json,
-                None,
+            aligned_reference_value = find_aligned_value(
+                json_key_path, "fluid_loops", reference_fluid_loop_id, reference_index
             )
 
             aligned_reference_values[generated_fluid_loop_id] = aligned_reference_value
@@ -1441,13 +1440,8 @@ def handle_ordered_comparisons(
             generated_value = find_one(pump_data_path, generated_pump)
             aligned_generated_values[generated_pump_id] = generated_value
 
-            aligned_reference_value = find_one(
-                json_key_path.replace(
-                    "pumps[*]",
-                    f'pumps[*][?(@.id="{reference_pump_id}")]',
-                ),
-                reference_json,
-                None,
+            aligned_reference_value = find_aligned_value(
+                json_key_path, "pumps", reference_pump_id, reference_index
             )
 
             aligned_reference_values[generated_pump_id] = aligned_reference_value
@@ -1521,6 +1515,10 @@ def run_file_comparison(spec_file, generated_json_file, reference_json_file):
     if not object_id_map:
         return warnings, errors
 
+    # Index the objects in both files once so aligned values can be found without searching the whole file
+    generated_index = build_id_index(generated_json)
+    reference_index = build_id_index(reference_json)
+
     # Once maps have been defined, iterate through the test specs
     for path_spec in json_test_key_paths:
         json_key_path = path_spec["json-key-path"]
@@ -1529,7 +1527,12 @@ def run_file_comparison(spec_file, generated_json_file, reference_json_file):
         # Handle any cases that require special logic
         if special_case:
             special_case_warnings, special_case_errors = handle_special_cases(
-                path_spec, object_id_map, generated_json, reference_json
+                path_spec,
+                object_id_map,
+                generated_json,
+                reference_json,
+                generated_index,
+                reference_index,
             )
             warnings.extend(special_case_warnings)
             errors.extend(special_case_errors)
@@ -1556,7 +1559,11 @@ def run_file_comparison(spec_file, generated_json_file, reference_json_file):
                     ordered_comparison_warnings,
                     ordered_comparison_errors,
                 ) = handle_ordered_comparisons(
-                    path_spec, object_id_map, reference_json, generated_json
+                    path_spec,
+                    object_id_map,
+                    reference_json,
+                    generated_json,
+                    reference_index,
                 )
                 warnings.extend(ordered_comparison_warnings)
                 errors.extend(ordered_comparison_errors)
@@ -1575,47 +1582,150 @@ def run_file_comparison(spec_file, generated_json_file, reference_json_file):
     return warnings, errors
 
 
-def run_comparison_for_all_tests(test_dir):
-    """Runs JSON comparison for all test cases in the test directory."""
+def get_test_cases(test_dir):
+    """Returns the test case directory names in the test directory in a deterministic order."""
+    # Only recognize directories starting with "E-" or "F-" as test cases
+    return sorted(
+        test
+        for test in os.listdir(test_dir)
+        if os.path.isdir(os.path.join(test_dir, test))
+        and (test.startswith("E-") or test.startswith("F-"))
+    )
+
 
+def run_test_case(test_dir, test):
+    """
+    Runs the JSON comparison for one test case.
+    Returns a dictionary with the test case name, warnings, errors, and wall time in seconds, or None if the test case
+    does not have a generated, reference, and spec file.
+    """
     reference_dir = os.path.join(test_dir, "Correct Answer RPDs")
     spec_dir = os.path.join(test_dir, "Test Specifications")
 
-    total_errors = 0
+    test_case_dir = os.path.join(test_dir, test)
+    generated_json_file = next(
+        (
+            os.path.join(test_case_dir, f)
+            for f in os.listdir(test_case_dir)
+            if f.endswith(".json")
+        ),
+        None,
+    )
+    spec_file = os.path.join(spec_dir, f"{test} spec.json")
+    reference_json_file = os.path.join(reference_dir, f"{test}.json")
+
+    if not (
+        generated_json_file
+        and os.path.isfile(spec_file)
+        and os.path.isfile(generated_json_file)
+        and os.path.isfile(reference_json_file)
+    ):
+        return None
 
-    for test in os.listdir(test_dir):
-        # Only recognize directories starting with "E-" or "F-" as test cases
-        if os.path.isdir(test_dir) and (test.startswith("E-") or test.startswith("F-")):
+    start_time = time.perf_counter()
+    try:
+        warnings, errors = run_file_comparison(
+            spec_file, generated_json_file, reference_json_file
+        )
+    except Exception as e:
+        # Report the failure with the test case so the remaining test cases still run
+        warnings, errors = [], [f"Comparison failed: {type(e).__name__}: {e}"]
+    return {
+        "test": test,
+        "warnings": warnings,
+        "errors": errors,
+        "wall_time": time.perf_counter() - start_time,
+    }
 
-            test_case_dir = os.path.join(test_dir, test)
-            generated_json_file = next(
-                (
-                    os.path.join(test_case_dir, f)
-                    for f in os.listdir(test_case_dir)
-                    if f.endswith(".json")
-                ),
-                None,
-            )
-            spec_file = os.path.join(spec_dir, f"{test} spec.json")
-            reference_json_file = os.path.join(reference_dir, f"{test}.json")
-
-            if (
-                generated_json_file
-                and os.path.isfile(spec_file)
-                and os.path.isfile(generated_json_file)
-                and os.path.isfile(reference_json_file)
-            ):
-                print(f"Running comparison for {test}...")
-                warnings, errors = run_file_comparison(
-                    spec_file, generated_json_file, reference_json_file
-                )
-                print_results(test, warnings, errors)
-                total_errors += len(errors)
 
+def run_comparison_for_all_tests(
+    test_dir, workers=1, summary_json_file=None, junit_xml_file=None
+):
+    """
+    Runs JSON comparison for all test cases in the test directory.
+    With more than 1 worker, test cases are compared in worker processes. Results are printed as soon as each test
+    case and every test case before it have finished, so the output is always in the same order.
+    """
+    start_time = time.perf_counter()
+    test_cases = get_test_cases(test_dir)
+    results = []
+
+    if workers > 1 and len(test_cases) > 1:
+        with ProcessPoolExecutor(max_workers=min(workers, len(test_cases))) as executor:
+            for result in executor.map(partial(run_test_case, test_dir), test_cases):
+                if result:
+                    print_test_case_result(result)
+                    results.append(result)
+    else:
+        for test in test_cases:
+            result = run_test_case(test_dir, test)
+            if result:
+                print_test_case_result(result)
+                results.append(result)
+
+    wall_time = time.perf_counter() - start_time
+    if summary_json_file:
+        write_summary_json(results, wall_time, summary_json_file)
+    if junit_xml_file:
+        write_junit_xml(results, wall_time, junit_xml_file)
+
+    total_errors = sum(len(result["errors"]) for result in results)
     if total_errors > 0:
         sys.exit(1)
 
 
+def print_test_case_result(result):
+    print(f"Running comparison for {result['test']}...")
+    print_results(result["test"], result["warnings"], result["errors"])
+    sys.stdout.flush()
+
+
+def write_summary_json(results, wall_time, summary_json_file):
+    """Writes the results of all test cases to a JSON file."""
+    summary = {
+        "test_cases": len(results),
+        "failed": sum(1 for result in results if result["errors"]),
+        "errors": sum(len(result["errors"]) for result in results),
+        "warnings": sum(len(result["warnings"]) for result in results),
+        "wall_time": round(wall_time, 3),
+        "results": [
+            {**result, "wall_time": round(result["wall_time"], 3)} for result in results
+        ],
+    }
+    with open(summary_json_file, "w") as file:
+        json.dump(summary, file, indent=4)
+
+
+def write_junit_xml(results, wall_time, junit_xml_file):
+    """Writes the results of all test cases to a JUnit XML file, with one test case per comparison."""
+    test_suite = ET.Element(
+        "testsuite",
+        name="full_rpd_tests",
+        tests=str(len(results)),
+        failures=str(sum(1 for result in results if result["errors"])),
+        errors="0",
+        time=f"{wall_time:.3f}",
+    )
+    for result in results:
+        test_case = ET.SubElement(
+            test_suite,
+            "testcase",
+            classname="full_rpd_tests",
+            name=result["test"],
+            time=f"{result['wall_time']:.3f}",
+        )
+        if result["errors"]:
+            failure = ET.SubElement(
+                test_case, "failure", message=f"{len(result['errors'])} errors"
+            )
+            failure.text = "\n".join(result["errors"])
+        if result["warnings"]:
+            ET.SubElement(test_case, "system-out").text = "\n".join(result["warnings"])
+    ET.ElementTree(test_suite).write(
+        junit_xml_file, encoding="utf-8", xml_declaration=True
+    )
+
+
 def print_results(test, warnings, errors):
     """Prints the comparison results."""
     if warnings:
@@ -1637,5 +1747,26 @@ def print_results(test, warnings, errors):
 
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Compare the generated test case RPDs to the correct answer RPDs."
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of test cases to compare at the same time.",
+    )
+    parser.add_argument(
+        "--summary-json",
+        help="Write the results and wall time of each test case to this JSON file.",
+    )
+    parser.add_argument(
+        "--junit-xml",
+        help="Write the results and wall time of each test case to this JUnit XML file.",
+    )
+    args = parser.parse_args()
+
     test_directory = os.path.dirname(os.path.abspath(__file__))
-    run_comparison_for_all_tests(test_directory)
+    run_comparison_for_all_tests(
+        test_directory, args.workers, args.summary_json, args.junit_xml
+    )
@@ -0,0 +1,67 @@
+from functools import partial
+
+
+class SingleValueDict(dict):
+    """NHRList entries that all retrieve a single value."""
+
+    def get(self, key, default=None):
+        return 1
+
+
+class StandInResultReader:
+    """
+    Pure-Python result reader with the same interface as ResultReaderSession, so output can be read without eQUEST.
+    Configure it with functools.partial, as CONSTANT_RESULT_READER does, to use it as a result reader factory.
+    """
+
+    # Every reader created, in the order they were created
+    instances = []
+
+    def __init__(
+        self,
+        d2_result_dll,
+        doe2_data_dir,
+        nhr_dict=None,
+        values=None,
+        default_value=-99999.0,
+        string_result=None,
+    ):
+        """
+        :param d2_result_dll: (str) path to the D2Result.dll, kept for comparison
+        :param doe2_data_dir: (str) path to the DOE-2 data directory, kept for comparison
+        :param nhr_dict: (dict) entry_id (int): number of values retrieved (int); None retrieves one value per entry
+        :param values: (dict) request (tuple): value (float), or list of values for entries retrieving several
+        :param default_value: (float) value returned for each value of a request not in values
+        :param string_result: (str) returned for every string request; None returns "entry_id:report_key:row_key"
+        """
+        self.d2_result_dll = d2_result_dll
+        self.doe2_data_dir = doe2_data_dir
+        self.nhr_dict = SingleValueDict() if nhr_dict is None else nhr_dict
+        self.values = {} if values is None else values
+        self.default_value = default_value
+        self.string_result = string_result
+        # (project_fname, requests) of every call to get_multiple_results
+        self.calls = []
+        StandInResultReader.instances.append(self)
+
+    def get_multiple_results(self, project_fname, request_array):
+        self.calls.append((project_fname, list(request_array)))
+        results = []
+        for request in request_array:
+            value = self.values.get(request, self.default_value)
+            if isinstance(value, list):
+                results.extend(value)
+            else:
+                results.extend([value] * self.nhr_dict.get(request[0], 1))
+        return results
+
+    def get_string_result(self, project_fname, entry_id, report_key="", row_key=""):
+        if self.string_result is not None:
+            return self.string_result
+        return f"{entry_id}:{report_key}:{row_key}"
+
+
+# Returns 1.0 for every request, so full models populate without eQUEST
+CONSTANT_RESULT_READER = partial(
+    StandInResultReader, default_value=1.0, string_result="Weather File.bin"
+)
@@ -0,0 +1,66 @@
+import unittest
+
+from rpd_generator import main
+from rpd_generator.artifacts.ruleset_model_description import RulesetModelDescription
+from rpd_generator.bdl_structure.bdl_commands.boiler import Boiler
+from rpd_generator.bdl_structure.bdl_commands.circulation_loop import CirculationLoop
+from rpd_generator.bdl_structure.bdl_commands.pump import Pump
+from rpd_generator.bdl_structure.command_graph import (
+    get_command_order,
+    get_populate_waves,
+)
+from rpd_generator.doe2_file_readers.model_input_reader import ModelInputReader
+
+
+class TestCommandGraph(unittest.TestCase):
+    def test_get_command_order(self):
+        bdl_command_dict = ModelInputReader().bdl_command_dict
+        command_order = get_command_order(bdl_command_dict)
+
+        self.assertNotIn(None, command_order)
+        self.assertEqual(len(command_order), len(bdl_command_dict) - 1)
+        for command in command_order:
+            for dependency in bdl_command_dict[command].command_dependencies:
+                self.assertLess(
+                    command_order.index(dependency), command_order.index(command)
+                )
+        self.assertLess(
+            command_order.index("STEAM-METER"), command_order.index("CHW-METER")
+        )
+        self.assertLess(command_order.index("WINDOW"), command_order.index("DOOR"))
+
+    def test_get_command_processing_order(self):
+        command_order = main.get_command_processing_order(
+            ModelInputReader().bdl_command_dict
+        )
+
+        self.assertCountEqual(command_order, main.PROCESSED_COMMANDS)
+        self.assertNotIn("CONDENSING-UNIT", command_order)
+        self.assertNotIn("DESIGN-DAY", command_order)
+        self.assertEqual(command_order.count("UTILITY-RATE"), 1)
+
+    def test_get_command_order_cycle(self):
+        class CommandA:
+            command_dependencies = ["B"]
+
+        class CommandB:
+            command_dependencies = ["A"]
+
+        with self.assertRaises(ValueError):
+            get_command_order({"A": CommandA, "B": CommandB, "C": Boiler})
+
+    def test_get_populate_waves(self):
+        rmd = RulesetModelDescription("Test RMD")
+        pumps = [Pump("Pump 1", rmd), Pump("Pump 2", rmd)]
+        loop = CirculationLoop("HW Loop", rmd)
+        boilers = [Boiler("Boiler 1", rmd), Boiler("Boiler 2", rmd)]
+
+        # Boilers populate in file order, each after the loop and the boiler before it
+        self.assertEqual(
+            get_populate_waves([*pumps, loop, *boilers]),
+            [pumps, [loop], boilers[:1], boilers[1:]],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
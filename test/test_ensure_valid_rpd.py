@@ -0,0 +1,153 @@
+import copy
+import json
+import re
+import unittest
+from pathlib import Path
+
+from rpd_generator.utilities.ensure_valid_rpd import make_ids_unique
+
+TEST_DIRECTORY = Path(__file__).parent / "full_rpd_test"
+
+
+def make_ids_unique_reference(
+    data, seen_ids=None, id_counters=None, visited=None, parent=None, key=None
+):
+    """Recursive implementation that make_ids_unique() replaced, kept to check that the output is unchanged"""
+    if seen_ids is None:
+        seen_ids = {}
+    if id_counters is None:
+        id_counters = {}
+    if visited is None:
+        visited = set()
+
+    if isinstance(data, dict):
+        obj_id = id(data)
+
+        if obj_id in visited:
+            if parent is not None and key is not None:
+                data_copy = copy.deepcopy(data)
+                parent[key] = data_copy
+                data = data_copy
+                obj_id = id(data)
+            else:
+                return
+
+        visited.add(obj_id)
+
+        if "id" in data:
+            current_id = data["id"]
+
+            if current_id in seen_ids:
+                match = re.search(r"--(\d+)$", current_id)
+                if match:
+                    number = int(match.group(1)) + 1
+                    unique_id = re.sub(r"--\d+$", f"--{number}", current_id)
+                else:
+                    seen_ids[current_id] += 1
+                    unique_id = f"{current_id}--{seen_ids[current_id]}"
+
+                while unique_id in seen_ids:
+                    match = re.search(r"--(\d+)$", unique_id)
+                    if match:
+                        number = int(match.group(1)) + 1
+                        unique_id = re.sub(r"--\d+$", f"--{number}", unique_id)
+
+                data["id"] = unique_id
+                seen_ids[unique_id] = 0
+            else:
+                seen_ids[current_id] = 0
+
+        keys_to_remove = []
+        for k, value in list(data.items()):
+            if isinstance(value, dict):
+                make_ids_unique_reference(
+                    value, seen_ids, id_counters, visited, parent=data, key=k
+                )
+                if not value:
+                    keys_to_remove.append(k)
+            elif isinstance(value, list):
+                make_ids_unique_reference(
+                    value, seen_ids, id_counters, visited, parent=data, key=k
+                )
+
+        for k in keys_to_remove:
+            del data[k]
+
+    elif isinstance(data, list):
+        items_to_remove = []
+        for index, item in enumerate(data):
+            if isinstance(item, dict):
+                make_ids_unique_reference(
+                    item, seen_ids, id_counters, visited, parent=data, key=index
+                )
+                if not item:
+                    items_to_remove.append(item)
+            elif isinstance(item, list):
+                make_ids_unique_reference(
+                    item, seen_ids, id_counters, visited, parent=data, key=index
+                )
+
+        for item in items_to_remove:
+            data.remove(item)
+
+
+class TestMakeIdsUnique(unittest.TestCase):
+    def assert_same_as_reference(self, create_data):
+        data = create_data()
+        reference_data = create_data()
+
+        make_ids_unique(data)
+        make_ids_unique_reference(reference_data)
+
+        self.assertEqual(json.dumps(reference_data), json.dumps(data))
+
+    def test_test_models(self):
+        rpd_files = sorted(TEST_DIRECTORY.glob("E-*/*.json")) + sorted(
+            TEST_DIRECTORY.glob("Correct Answer RPDs/*.json")
+        )
+        for rpd_file in rpd_files:
+            with open(rpd_file) as json_file:
+                rpd = json.load(json_file)
+
+            def create_rpd():
+                # Each model appears three times: twice as the same object and once as a copy
+                rpd_copy = copy.deepcopy(rpd)
+                rmd = rpd_copy["ruleset_model_descriptions"][0]
+                rpd_copy["ruleset_model_descriptions"] = [rmd, copy.deepcopy(rmd), rmd]
+                return rpd_copy
+
+            with self.subTest(rpd_file=rpd_file.name):
+                self.assert_same_as_reference(create_rpd)
+
+    def test_numbered_ids(self):
+        def create_data():
+            shared = {"id": "Shared", "children": [{"id": "A--1"}, {}]}
+            return {
+                "items": [
+                    {"id": "A"},
+                    {"id": "A"},
+                    {"id": "A--1"},
+                    {"id": "A--3"},
+                    {"id": "A--1"},
+                    {"id": "A"},
+                    {"id": "A"},
+                    {"id": "B--x"},
+                    {"id": "B--x"},
+                    {"id": "C---2"},
+                    {"id": "C---2"},
+                    shared,
+                    {"nested": shared, "empty": {"also_empty": {}}},
+                    [shared, {}],
+                ]
+            }
+
+        self.assert_same_as_reference(create_data)
+
+    def test_empty_items_are_removed(self):
+        data = {"id": "A", "empty": {}, "items": [{}, {"id": "A"}, {"empty": {}}, 1]}
+        make_ids_unique(data)
+        self.assertEqual({"id": "A", "items": [{"id": "A--1"}, 1]}, data)
+
+
+if __name__ == "__main__":
+    unittest.main()
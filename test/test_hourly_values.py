@@ -0,0 +1,113 @@
+import json
+import unittest
+
+from rpd_generator.utilities.hourly_values import (
+    HourlyValues,
+    get_coincident_values,
+    get_day_values,
+    get_hourly_value_statistics,
+    get_values_hash,
+    serialize_hourly_values,
+)
+
+
+class TestHourlyValues(unittest.TestCase):
+    def setUp(self):
+        self.weekday = get_day_values([0.0] * 8 + [1.0] * 10 + [0.5] * 6)
+        self.weekend = get_day_values([0.0] * 24)
+        self.day_values = [self.weekday] * 5 + [self.weekend] * 2
+        self.expected = [value for day in self.day_values for value in day.tolist()]
+
+    def test_behaves_like_a_list_of_hourly_values(self):
+        hourly_values = HourlyValues.from_day_values(self.day_values)
+
+        self.assertEqual(len(hourly_values), 168)
+        self.assertEqual(list(hourly_values), self.expected)
+        self.assertEqual(hourly_values, self.expected)
+        self.assertEqual(hourly_values[8], 1.0)
+        self.assertEqual(hourly_values[-1], 0.0)
+        self.assertEqual(hourly_values[20:26], self.expected[20:26])
+        with self.assertRaises(IndexError):
+            hourly_values[168]
+
+    def test_days_without_24_values_are_flattened(self):
+        day_values = [get_day_values([1.0, None])] + self.day_values
+        self.assertEqual(
+            HourlyValues.from_day_values(day_values), [1.0, None] + self.expected
+        )
+
+    def test_serialized_as_a_list(self):
+        hourly_values = HourlyValues.from_day_values(self.day_values)
+        self.assertEqual(
+            json.dumps(
+                {"hourly_values": hourly_values}, default=serialize_hourly_values
+            ),
+            json.dumps({"hourly_values": self.expected}),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
+
+
+class TestHourlyValueStatistics(unittest.TestCase):
+    def setUp(self):
+        self.weekday = get_day_values([0.0] * 8 + [1.0] * 10 + [0.5] * 6)
+        self.weekend = get_day_values([0.5] * 24)
+        self.hourly_values = HourlyValues.from_day_values(
+            [self.weekday] * 5 + [self.weekend] * 2
+        )
+
+    def test_statistics(self):
+        statistics = get_hourly_value_statistics(self.hourly_values)
+
+        self.assertEqual(
+            {key: value for key, value in statistics.items() if key != "hash"},
+            {
+                "is_continuous": False,
+                "has_zero": True,
+                "min": 0.0,
+                "max": 1.0,
+                "equivalent_full_load_hours": 5 * 13.0 + 2 * 12.0,
+            },
+        )
+        self.assertEqual(
+            statistics, get_hourly_value_statistics(list(self.hourly_values))
+        )
+
+    def test_values_hash(self):
+        # Rows with the same values hash the same whether or not the days share them
+        copied_rows = HourlyValues.from_day_values(
+            [get_day_values(list(self.weekday)) for _ in range(5)] + [self.weekend] * 2
+        )
+        self.assertEqual(
+            get_values_hash(self.hourly_values), get_values_hash(copied_rows)
+        )
+        self.assertEqual(
+            get_values_hash(self.hourly_values),
+            get_values_hash(list(self.hourly_values)),
+        )
+        reordered_days = HourlyValues.from_day_values(
+            [self.weekend] * 2 + [self.weekday] * 5
+        )
+        self.assertNotEqual(
+            get_values_hash(self.hourly_values), get_values_hash(reordered_days)
+        )
+
+    def test_continuous_schedule(self):
+        statistics = get_hourly_value_statistics([1.0] * 24 + [0.5] * 24)
+        self.assertTrue(statistics["is_continuous"])
+        self.assertFalse(statistics["has_zero"])
+
+    def test_coincident_values(self):
+        other_hourly_values = HourlyValues.from_day_values(
+            [get_day_values([1.0] * 24)] * 7
+        )
+        self.assertEqual(
+            get_coincident_values(self.hourly_values, other_hourly_values),
+            {(0.0, 1.0), (1.0, 1.0), (0.5, 1.0)},
+        )
+        self.assertEqual(
+            get_coincident_values(list(self.hourly_values), list(other_hourly_values)),
+            {(0.0, 1.0), (1.0, 1.0), (0.5, 1.0)},
+        )
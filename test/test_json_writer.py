@@ -0,0 +1,82 @@
+import gzip
+import json
+import os
+import tempfile
+import unittest
+from array import array
+from unittest import mock
+
+from rpd_generator.utilities import json_writer
+from rpd_generator.utilities.hourly_values import HourlyValues
+
+
+class TestJsonWriter(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        day_values = array("d", [1 / 3] * 24)
+        self.data = {
+            "id": "Schedule",
+            "hourly_values": HourlyValues([day_values, day_values]),
+            "values": [123456.789, 2, None, True, 0.000123456789],
+        }
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def read_json(self, file_name, **kwargs):
+        json_file_path = os.path.join(self.temp_dir.name, file_name)
+        json_writer.write_json(self.data, json_file_path, **kwargs)
+        open_file = gzip.open if file_name.endswith(".gz") else open
+        with open_file(json_file_path, "rt", encoding="utf-8") as json_file:
+            return json_file.read()
+
+    def test_default_is_pretty_printed(self):
+        self.assertEqual(
+            json.dumps(
+                {**self.data, "hourly_values": self.data["hourly_values"].tolist()},
+                indent=4,
+            ),
+            self.read_json("rpd.json"),
+        )
+
+    def test_compact_and_gzip(self):
+        expected_data = json.loads(self.read_json("rpd.json"))
+        for file_name in ["rpd.json", "rpd.json.gz"]:
+            for encoder in [json_writer.orjson, None]:
+                with self.subTest(file_name=file_name, encoder=encoder):
+                    with mock.patch.object(json_writer, "orjson", encoder):
+                        json_text = self.read_json(file_name, indent=None)
+                    self.assertNotIn("\n", json_text)
+                    self.assertEqual(expected_data, json.loads(json_text))
+
+    def test_orjson_matches_standard_library(self):
+        if json_writer.orjson is None:
+            self.skipTest("orjson is not installed")
+        self.data["keys"] = {1: "int", 2.5: "float", True: "bool", None: "none"}
+        self.data["text"] = "Zone \u00e9 \u2013 1"
+        orjson_text = self.read_json("rpd.json", indent=None)
+        with mock.patch.object(json_writer, "orjson", None):
+            json_text = self.read_json("rpd.json", indent=None)
+        self.assertEqual(json.loads(json_text), json.loads(orjson_text))
+
+        # Floats that are not numbers are the one difference
+        self.data = {"values": [float("nan"), float("inf")]}
+        self.assertEqual(
+            {"values": [None, None]},
+            json.loads(self.read_json("rpd.json", indent=None)),
+        )
+        with mock.patch.object(json_writer, "orjson", None):
+            self.assertEqual(
+                '{"values":[NaN,Infinity]}', self.read_json("rpd.json", indent=None)
+            )
+
+    def test_significant_digits(self):
+        data = json.loads(self.read_json("rpd.json", significant_digits=4))
+        self.assertEqual([0.3333] * 48, data["hourly_values"])
+        self.assertEqual([123500.0, 2, None, True, 0.0001235], data["values"])
+        # The data written is rounded, not the data passed in
+        self.assertEqual(1 / 3, self.data["hourly_values"][0])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,72 @@
+import unittest
+
+from jsonpath2 import match
+
+from rpd_generator.utilities import jsonpath_utils
+
+
+class TestJsonpathUtils(unittest.TestCase):
+    def setUp(self):
+        self.rpd = {
+            "id": "Test RPD",
+            "ruleset_model_descriptions": [
+                {
+                    "id": "Test RMD",
+                    "fluid_loops": [
+                        {"id": "HW Loop", "type": "HEATING", "child_loops": []},
+                        {
+                            "id": "CHW Loop",
+                            "type": "COOLING",
+                            "child_loops": [{"id": "CHW Secondary", "type": None}],
+                        },
+                    ],
+                    "type": {"code": "PROPOSED", "name": "Proposed"},
+                }
+            ],
+        }
+
+    def test_simple_paths_match_jsonpath2(self):
+        for jpath in [
+            "$",
+            "$.id",
+            "ruleset_model_descriptions[*].fluid_loops[*].id",
+            "$.ruleset_model_descriptions[0].fluid_loops[1].child_loops[*].type",
+            "$.ruleset_model_descriptions[0].fluid_loops[2].id",
+            "$.ruleset_model_descriptions[*].type[*]",
+            "$.ruleset_model_descriptions[*].id[0]",
+            "$.ruleset_model_descriptions.id",
+        ]:
+            with self.subTest(jpath=jpath):
+                self.assertIsNotNone(
+                    jsonpath_utils.compile_jsonpath(jsonpath_utils.ensure_root(jpath))[
+                        1
+                    ]
+                )
+                self.assertEqual(
+                    [
+                        m.current_value
+                        for m in match(jsonpath_utils.ensure_root(jpath), self.rpd)
+                    ],
+                    jsonpath_utils.find_all(jpath, self.rpd),
+                )
+
+    def test_other_paths_use_jsonpath2(self):
+        self.assertIsNone(jsonpath_utils.compile_jsonpath("$..fluid_loops[-1].id")[1])
+        self.assertEqual(
+            ["CHW Secondary"],
+            jsonpath_utils.find_all("$..child_loops[-1].id", self.rpd),
+        )
+        self.assertEqual(
+            ["CHW Loop"],
+            [
+                fluid_loop["id"]
+                for fluid_loop in jsonpath_utils.find_all_with_field_value(
+                    "$.ruleset_model_descriptions[*].fluid_loops[*]",
+                    "type",
+                    "COOLING",
+                    self.rpd,
+                )
+            ],
+        )
+        with self.assertRaises(ValueError):
+            jsonpath_utils.find_all("$.ruleset_model_descriptions[*].true", self.rpd)
@@ -0,0 +1,80 @@
+import unittest
+
+from rpd_generator.artifacts.ruleset_model_description import RulesetModelDescription
+from rpd_generator.bdl_structure.bdl_commands.circulation_loop import CirculationLoop
+from rpd_generator.bdl_structure.bdl_commands.system import System
+from rpd_generator.bdl_structure.bdl_commands.zone import Zone
+from rpd_generator.bdl_structure.bdl_enumerations.bdl_enums import BDLEnums
+from rpd_generator.schema.schema_enums import SchemaEnums
+
+BDL_Commands = BDLEnums.bdl_enums["Commands"]
+BDL_SystemKeywords = BDLEnums.bdl_enums["SystemKeywords"]
+BDL_ZoneKeywords = BDLEnums.bdl_enums["ZoneKeywords"]
+BDL_CirculationLoopKeywords = BDLEnums.bdl_enums["CirculationLoopKeywords"]
+BDL_CirculationLoopTypes = BDLEnums.bdl_enums["CirculationLoopTypes"]
+BDL_FlowControlOptions = BDLEnums.bdl_enums["FlowControlOptions"]
+FluidLoopFlowControlOptions = SchemaEnums.schema_enums["FluidLoopFlowControlOptions"]
+
+
+class TestLoopReferences(unittest.TestCase):
+    def setUp(self):
+        self.rmd = RulesetModelDescription("Test RMD")
+        self.loop = CirculationLoop("HW Loop", self.rmd)
+        self.loop.keyword_value_pairs = {
+            BDL_CirculationLoopKeywords.TYPE: BDL_CirculationLoopTypes.HW
+        }
+        self.system = System("System 1", self.rmd)
+        self.system.keyword_value_pairs = {
+            BDL_SystemKeywords.HW_LOOP: "HW Loop",
+            BDL_SystemKeywords.CHW_LOOP: "CHW Loop",
+        }
+        self.zones = []
+        for i in range(3):
+            zone = Zone(f"Zone {i}", self.system, self.rmd)
+            zone.keyword_value_pairs = {
+                BDL_ZoneKeywords.HW_LOOP: "HW Loop",
+                BDL_ZoneKeywords.HW_VALVE_TYPE: BDL_FlowControlOptions.CONSTANT_FLOW,
+            }
+            self.zones.append(zone)
+        for obj in [self.loop, self.system, *self.zones]:
+            self.rmd.bdl_obj_instances[obj.u_name] = obj
+
+    def test_get_loop_references(self):
+        self.assertEqual(
+            self.rmd.get_loop_references(
+                "HW Loop", BDL_Commands.ZONE, BDL_ZoneKeywords.HW_LOOP
+            ),
+            ["Zone 0", "Zone 1", "Zone 2"],
+        )
+        self.assertEqual(
+            self.rmd.get_loop_references(
+                "CHW Loop", BDL_Commands.SYSTEM, BDL_SystemKeywords.CHW_LOOP
+            ),
+            ["System 1"],
+        )
+        self.assertEqual(
+            self.rmd.get_loop_references(
+                "CHW Loop", BDL_Commands.ZONE, BDL_ZoneKeywords.CHW_LOOP
+            ),
+            [],
+        )
+        self.assertEqual(
+            self.rmd.get_loop_references(
+                "Other Loop", BDL_Commands.ZONE, BDL_ZoneKeywords.HW_LOOP
+            ),
+            [],
+        )
+
+    def test_determine_loop_flow_control(self):
+        self.assertEqual(
+            self.loop.determine_loop_flow_control(),
+            FluidLoopFlowControlOptions.FIXED_FLOW,
+        )
+
+        self.zones[2].keyword_value_pairs[
+            BDL_ZoneKeywords.HW_VALVE_TYPE
+        ] = BDL_FlowControlOptions.VARIABLE_FLOW
+        self.assertEqual(
+            self.loop.determine_loop_flow_control(),
+            FluidLoopFlowControlOptions.VARIABLE_FLOW,
+        )
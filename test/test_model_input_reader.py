@@ -0,0 +1,136 @@
+import os
+import tempfile
+import unittest
+
+from rpd_generator.doe2_file_readers.model_input_reader import ModelInputReader
+from rpd_generator.doe2_file_readers.spooled_command_buffer import SpooledCommandBuffer
+
+
+def command_line(unique_name, command):
+    return f'     *   1 * "{unique_name}" = {command}\n'
+
+
+def data_for_line(unique_name):
+    return f"-NOTE- - -         DATA FOR     {unique_name}\n"
+
+
+def definition_line(keyword, value):
+    return f"-INPUT - -{' ' * 46}{keyword:<17}= {value:>28}\n"
+
+
+class TestModelInputReader(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.bdl_path = os.path.join(self.temp_dir.name, "Test.BDL")
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def read_lines(self, lines):
+        with open(self.bdl_path, "w") as bdl_file:
+            bdl_file.writelines(lines)
+        return ModelInputReader().read_input_bdl_file(self.bdl_path)
+
+    def test_data_for_blocks_are_matched_by_name(self):
+        model_input_data = self.read_lines(
+            [
+                command_line("Floor 1", "FLOOR"),
+                command_line("Space 1", "SPACE"),
+                command_line("Space 2", "SPACE"),
+                "\n",
+                data_for_line("Space 2"),
+                definition_line("AREA", "200.0000"),
+                data_for_line("Floor 1"),
+                definition_line("Z", "10.0000"),
+                data_for_line("Space 1"),
+                definition_line("AREA", "100.0000"),
+                definition_line("AREA", "150.0000"),
+                data_for_line("Unknown"),
+                definition_line("AREA", "300.0000"),
+            ]
+        )
+
+        name_index = model_input_data["name_index"]
+        self.assertEqual(
+            model_input_data["file_commands"]["SPACE"],
+            [name_index["Space 1"], name_index["Space 2"]],
+        )
+        self.assertEqual(name_index["Floor 1"]["Z"], "10.0000")
+        self.assertEqual(name_index["Space 1"]["AREA"], ["100.0000", "150.0000"])
+        self.assertEqual(name_index["Space 2"]["AREA"], "200.0000")
+        self.assertEqual(name_index["Space 2"]["parent"], "Floor 1")
+        self.assertNotIn("Unknown", name_index)
+
+    def test_repeated_command_is_added_once(self):
+        model_input_data = self.read_lines(
+            [
+                command_line("Floor 1", "FLOOR"),
+                command_line("Floor 1", "FLOOR"),
+                data_for_line("Floor 1"),
+                definition_line("Z", "10.0000"),
+            ]
+        )
+
+        self.assertEqual(
+            model_input_data["file_commands"]["FLOOR"],
+            [{"unique_name": "Floor 1", "Z": "10.0000"}],
+        )
+
+    def test_streamed_commands_match_file_commands(self):
+        lines = [
+            command_line("Floor 1", "FLOOR"),
+            command_line("Space 1", "SPACE"),
+            command_line("Space 2", "SPACE"),
+            data_for_line("Space 2"),
+            definition_line("AREA", "200.0000"),
+            data_for_line("Space 1"),
+            definition_line("AREA", "100.0000"),
+        ]
+        file_commands = self.read_lines(lines)["file_commands"]
+
+        streamed_commands = list(
+            ModelInputReader().iter_input_bdl_commands(self.bdl_path)
+        )
+        self.assertEqual(
+            [command_dict["unique_name"] for _, command_dict, _ in streamed_commands],
+            ["Space 2", "Space 1", "Floor 1"],
+        )
+
+        with SpooledCommandBuffer(streamed_commands, max_size=0) as buffer:
+            for command, command_dicts in file_commands.items():
+                self.assertEqual(buffer.get(command), command_dicts)
+            self.assertEqual(buffer.get("ZONE", []), [])
+
+    def test_spooled_commands_keep_file_order(self):
+        # Each command dictionary is spooled and freed once its block is read, so later dictionaries can reuse its id
+        space_names = [f"Space {i}" for i in range(1, 6)]
+        lines = [command_line("Floor 1", "FLOOR")]
+        for space_name in space_names:
+            lines.append(command_line(space_name, "SPACE"))
+            lines.append(data_for_line(space_name))
+            lines.append(definition_line("AREA", "100.0000"))
+        lines.extend(
+            [
+                command_line("Space B", "SPACE"),
+                command_line("Space C", "SPACE"),
+                data_for_line("Space C"),
+                definition_line("AREA", "300.0000"),
+                data_for_line("Space B"),
+                definition_line("AREA", "200.0000"),
+            ]
+        )
+        file_commands = self.read_lines(lines)["file_commands"]
+
+        with SpooledCommandBuffer(
+            ModelInputReader().iter_input_bdl_commands(self.bdl_path), max_size=0
+        ) as buffer:
+            self.assertEqual(
+                [command_dict["unique_name"] for command_dict in buffer.get("SPACE")],
+                [*space_names, "Space B", "Space C"],
+            )
+            for command, command_dicts in file_commands.items():
+                self.assertEqual(buffer.get(command), command_dicts)
+
+
+if __name__ == "__main__":
+    unittest.main()
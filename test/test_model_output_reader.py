@@ -0,0 +1,128 @@
+import threading
+from functools import partial
+import unittest
+
+from rpd_generator.artifacts.ruleset_model_description import RulesetModelDescription
+from rpd_generator.bdl_structure.base_node import (
+    Base,
+    shutdown_output_fetch_executor,
+)
+from rpd_generator.config import Config
+from rpd_generator.doe2_file_readers import model_output_reader
+from rpd_generator.doe2_file_readers.output_request_planner import get_file_type
+from .result_reader_helpers import StandInResultReader
+
+
+# NHRList entries and values of the stand-in result reader
+NHR_DICT = {2201005: 1, 2201006: 1, 2315003: 1, 1001001: 1}
+VALUES = {
+    (2201005, "System 1", ""): 0.25,
+    (2201006, "System 1", ""): 48.0,
+    (2315003, "Boiler 1", ""): -99999,
+    (1001001, "", ""): 3.0,
+}
+
+
+class TestResultReaderBackend(unittest.TestCase):
+    def setUp(self):
+        StandInResultReader.instances = []
+        model_output_reader.set_result_reader_factory(
+            partial(StandInResultReader, nhr_dict=NHR_DICT, values=VALUES)
+        )
+
+        self.rmd = RulesetModelDescription("Test RMD")
+        self.rmd.doe2_data_path = "DOE-2 Data"
+        self.rmd.file_path = "Test Project"
+
+    def tearDown(self):
+        model_output_reader.set_result_reader_factory(None)
+
+    def test_session_is_reused(self):
+        reader = model_output_reader.get_result_reader("D2Result.dll", "Data")
+        self.assertIs(
+            reader, model_output_reader.get_result_reader("D2Result.dll", "Data")
+        )
+        self.assertIsNot(
+            reader, model_output_reader.get_result_reader("D2Result.dll", "Other")
+        )
+        self.assertEqual(len(StandInResultReader.instances), 2)
+
+    def test_get_output_data_with_stand_in_backend(self):
+        requests = {
+            "Outside Air Ratio": (2201005, "System 1", ""),
+            "Cooling Capacity": (2201006, "System 1", ""),
+            "Boiler Capacity": (2315003, "Boiler 1", ""),
+            "Loads Value": (1001001, "", ""),
+        }
+
+        output_data = Base.get_output_data(self.rmd, requests)
+
+        self.assertDictEqual(
+            output_data,
+            {"Outside Air Ratio": 0.25, "Cooling Capacity": 48.0, "Loads Value": 3.0},
+        )
+        reader = StandInResultReader.instances[0]
+        self.assertEqual(len(reader.calls), 2)
+        for _, batch in reader.calls:
+            self.assertEqual(len({get_file_type(request[0]) for request in batch}), 1)
+
+        # Results are kept in the model's results store, so asking again makes no calls
+        Base.get_output_data(self.rmd, requests)
+        self.assertEqual(len(reader.calls), 2)
+
+    def test_get_output_data_with_output_fetch_threads(self):
+        requests = {
+            "Outside Air Ratio": (2201005, "System 1", ""),
+            "Cooling Capacity": (2201006, "System 1", ""),
+            "Loads Value": (1001001, "", ""),
+        }
+        Config.OUTPUT_FETCH_THREADS = 2
+        try:
+            Base.fetch_output_results(self.rmd, requests.values(), wait=False)
+            output_data = Base.get_output_data(self.rmd, requests)
+        finally:
+            Config.OUTPUT_FETCH_THREADS = 1
+            shutdown_output_fetch_executor()
+
+        self.assertDictEqual(
+            output_data,
+            {"Outside Air Ratio": 0.25, "Cooling Capacity": 48.0, "Loads Value": 3.0},
+        )
+        self.assertDictEqual(self.rmd.pending_output_results, {})
+        self.assertEqual(self.rmd.output_fetch_times["calls"], 2)
+        self.assertEqual(len(StandInResultReader.instances[0].calls), 2)
+
+    def test_get_single_string_output_with_stand_in_backend(self):
+        self.assertEqual(
+            Base.get_single_string_output(self.rmd, 1101006, "Key"), "1101006:Key:"
+        )
+
+
+class TestResultReaderSession(unittest.TestCase):
+    def test_missing_dll(self):
+        with self.assertRaises(FileNotFoundError):
+            model_output_reader.ResultReaderSession("missing/D2Result.dll", "Data")
+
+    def test_values_not_written_by_the_dll_are_zero(self):
+        # Session with a stand-in for D2R_GetMultipleResult that writes the first value of each call
+        session = object.__new__(model_output_reader.ResultReaderSession)
+        session.doe2_dir = b"DOE23\\"
+        session.nhr_dict = {2201005: 1, 2201006: 1}
+        session.thread_buffers = threading.local()
+        written_values = iter([0.25, 48.0])
+
+        def multiple_result_dll(*args):
+            pf_data = args[3]
+            pf_data[0] = next(written_values)
+            if pf_data[0] == 0.25:
+                pf_data[1] = 0.5
+
+        session.multiple_result_dll = multiple_result_dll
+        requests = [(2201005, "System 1", ""), (2201006, "System 1", "")]
+
+        self.assertEqual(session.get_multiple_results("Project", requests), [0.25, 0.5])
+        self.assertEqual(session.get_multiple_results("Project", requests), [48.0, 0.0])
+
+
+if __name__ == "__main__":
+    unittest.main()
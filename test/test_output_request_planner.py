@@ -0,0 +1,81 @@
+import unittest
+
+from rpd_generator.doe2_file_readers.output_request_planner import (
+    OutputRequestPlanner,
+    get_file_type,
+)
+
+
+class TestOutputRequestPlanner(unittest.TestCase):
+    def setUp(self):
+        self.nhr_dict = {
+            1001001: 1,
+            2201005: 1,
+            2201006: 1,
+            2201045: 1,
+            2315003: 1,
+            2305001: 12,
+        }
+
+    def test_get_file_type(self):
+        self.assertEqual(get_file_type(1001001), 0)
+        self.assertEqual(get_file_type(2201005), 1)
+        self.assertEqual(get_file_type(3001001), 2)
+
+    def test_requests_from_many_objects_are_packed_into_full_batches(self):
+        planner = OutputRequestPlanner(self.nhr_dict)
+        for i in range(10):
+            planner.add_requests(
+                {
+                    "Outside Air Ratio": (2201005, f"System {i}", ""),
+                    "Cooling Capacity": (2201006, f"System {i}", ""),
+                }
+            )
+
+        batches = planner.plan()
+
+        self.assertEqual([len(batch) for batch in batches], [12, 8])
+
+    def test_batches_are_grouped_by_file_type(self):
+        planner = OutputRequestPlanner(self.nhr_dict)
+        planner.add_requests(
+            [
+                (2201005, "System 1", ""),
+                (1001001, "Space 1", ""),
+                (2315003, "Boiler 1", ""),
+            ]
+        )
+
+        batches = planner.plan()
+
+        self.assertEqual(
+            batches,
+            [
+                [(1001001, "Space 1", "")],
+                [(2201005, "System 1", ""), (2315003, "Boiler 1", "")],
+            ],
+        )
+
+    def test_duplicate_and_multiple_value_requests(self):
+        planner = OutputRequestPlanner(self.nhr_dict)
+        planner.add_requests({"A": (2201045, "System 1", "Zone 1")})
+        planner.add_requests({"B": (2201045, "System 1", "Zone 1")})
+        planner.add_requests({"Monthly": (2305001, "", "")})
+        planner.add_requests({"Unknown": (2999999, "", "")})
+
+        with self.assertLogs(
+            "rpd_generator.doe2_file_readers.output_request_planner", "WARNING"
+        ) as logs:
+            batches = planner.plan()
+
+        self.assertEqual(batches, [[(2201045, "System 1", "Zone 1")]])
+        self.assertEqual(
+            planner.unplanned_requests, [(2305001, "", ""), (2999999, "", "")]
+        )
+        self.assertEqual(len(logs.output), 2)
+        self.assertIn("retrieves 12 values", logs.output[0])
+        self.assertIn("not in NHRList.txt", logs.output[1])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,107 @@
+import json
+import multiprocessing
+import os
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+
+from rpd_generator import main
+from rpd_generator.bdl_structure import base_node
+from rpd_generator.config import Config
+from rpd_generator.doe2_file_readers import model_output_reader, result_recording
+from .result_reader_helpers import CONSTANT_RESULT_READER
+
+TEST_DIRECTORY = Path(__file__).parent / "full_rpd_test"
+TEST_MODELS = [
+    str(TEST_DIRECTORY / "E-1" / "229 Test Case E-1 (PSZHP).BDL"),
+    str(TEST_DIRECTORY / "E-2" / "229 Test Case E-2 (CHW VAV).BDL"),
+]
+
+
+class TestParallelRPDGeneration(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        model_output_reader.set_result_reader_factory(CONSTANT_RESULT_READER)
+
+    def tearDown(self):
+        model_output_reader.set_result_reader_factory(None)
+        self.temp_dir.cleanup()
+
+    def write_rpd(self, workers, models=TEST_MODELS):
+        json_file_path = os.path.join(self.temp_dir.name, f"{workers} workers.json")
+        main.write_rpd_json_from_bdl(models, json_file_path, workers=workers)
+        with open(json_file_path, "r") as json_file:
+            return json_file.read()
+
+    def copy_test_models(self) -> list:
+        """Copy the test models to the temporary directory, so recordings are not written next to the originals."""
+        models = []
+        for model in TEST_MODELS:
+            model_directory = Path(self.temp_dir.name) / Path(model).parent.name
+            model_directory.mkdir()
+            models.append(shutil.copy(model, model_directory))
+        return models
+
+    def test_workers_produce_the_same_rpd(self):
+        serial_rpd = self.write_rpd(workers=1)
+        parallel_rpd = self.write_rpd(workers=2)
+
+        self.assertEqual(serial_rpd, parallel_rpd)
+        self.assertEqual(
+            [
+                rmd["id"]
+                for rmd in json.loads(parallel_rpd)["ruleset_model_descriptions"]
+            ],
+            ["229 Test Case E-1 (PSZHP)", "229 Test Case E-2 (CHW VAV)"],
+        )
+
+    def test_workers_record_results(self):
+        models = self.copy_test_models()
+        serial_rpd = self.write_rpd(workers=1, models=models)
+
+        # Spawned workers, as on Windows, receive the recording factory pickled
+        start_method = multiprocessing.get_start_method()
+        multiprocessing.set_start_method("spawn", force=True)
+        result_recording.start_recording(CONSTANT_RESULT_READER, self.temp_dir.name)
+        try:
+            recorded_rpd = self.write_rpd(workers=2, models=models)
+        finally:
+            multiprocessing.set_start_method(start_method, force=True)
+            recording_paths = result_recording.save_recordings()
+
+        self.assertEqual(serial_rpd, recorded_rpd)
+        self.assertEqual(
+            recording_paths,
+            [str(Path(model).with_suffix(".d2rrec")) for model in models],
+        )
+
+        # The recordings made in the workers replay the same RPD
+        result_recording.start_replay(recording_paths, self.temp_dir.name)
+        self.assertEqual(serial_rpd, self.write_rpd(workers=1, models=models))
+
+    def test_populate_threads_produce_the_same_rpd(self):
+        serial_rpd = self.write_rpd(workers=1)
+        Config.POPULATE_THREADS = 4
+        try:
+            threaded_rpd = self.write_rpd(workers=1)
+        finally:
+            Config.POPULATE_THREADS = 1
+
+        self.assertEqual(serial_rpd, threaded_rpd)
+
+    def test_output_fetch_threads_produce_the_same_rpd(self):
+        serial_rpd = self.write_rpd(workers=1)
+        Config.OUTPUT_FETCH_THREADS = 4
+        try:
+            threaded_rpd = self.write_rpd(workers=1)
+        finally:
+            Config.OUTPUT_FETCH_THREADS = 1
+
+        self.assertEqual(serial_rpd, threaded_rpd)
+        # The fetch thread pool is shut down once each model is populated
+        self.assertEqual(base_node._output_fetch_executor, (0, None))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,108 @@
+import os
+import tempfile
+import unittest
+
+from rpd_generator.artifacts.ruleset_model_description import RulesetModelDescription
+from rpd_generator.bdl_structure.base_node import Base
+from rpd_generator.config import Config
+from rpd_generator.doe2_file_readers import model_output_reader
+from rpd_generator.doe2_file_readers.result_cache import (
+    ResultCache,
+    close_result_caches,
+    get_output_fingerprint,
+)
+
+
+class CountingResultReader:
+    """Pure-Python result reader that counts the calls made to it."""
+
+    calls = 0
+
+    def __init__(self, d2_result_dll, doe2_data_dir):
+        self.nhr_dict = {2201005: 1, 2201006: 1, 2305001: 12}
+
+    def get_multiple_results(self, project_fname, request_array):
+        CountingResultReader.calls += 1
+        return [float(request[0] % 100) for request in request_array]
+
+    def get_string_result(self, project_fname, entry_id, report_key="", row_key=""):
+        CountingResultReader.calls += 1
+        return "Weather File.bin"
+
+
+class TestResultCache(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.project_fname = os.path.join(self.temp_dir.name, "Test Project")
+        for extension in [".erp", ".lrp", ".srp", ".nhk"]:
+            with open(self.project_fname + extension, "wb") as output_file:
+                output_file.write(extension.encode("utf-8") * 100)
+
+        CountingResultReader.calls = 0
+        model_output_reader.set_result_reader_factory(CountingResultReader)
+        Config.USE_RESULT_CACHE = True
+
+    def tearDown(self):
+        Config.USE_RESULT_CACHE = False
+        model_output_reader.set_result_reader_factory(None)
+        close_result_caches()
+        self.temp_dir.cleanup()
+
+    def create_rmd(self):
+        rmd = RulesetModelDescription("Test RMD")
+        rmd.doe2_data_path = "DOE-2 Data"
+        rmd.file_path = self.project_fname
+        return rmd
+
+    def test_fingerprint_changes_with_output_files(self):
+        fingerprint = get_output_fingerprint(self.project_fname)
+        self.assertEqual(fingerprint, get_output_fingerprint(self.project_fname))
+
+        with open(self.project_fname + ".srp", "ab") as output_file:
+            output_file.write(b"new results")
+        self.assertNotEqual(fingerprint, get_output_fingerprint(self.project_fname))
+
+    def test_results_persist_between_sessions(self):
+        cache_path = self.project_fname + ".d2rcache"
+        result_cache = ResultCache(cache_path, "fingerprint 1")
+        result_cache.add_results({(2201005, "System 1", ""): 5.0})
+        result_cache.add_string_result((1101006, "", ""), "Weather File.bin")
+        result_cache.close()
+
+        result_cache = ResultCache(cache_path, "fingerprint 1")
+        self.assertEqual(
+            result_cache.get_results([(2201005, "System 1", ""), (2201006, "", "")]),
+            {(2201005, "System 1", ""): 5.0},
+        )
+        self.assertEqual(
+            result_cache.get_string_result((1101006, "", "")), "Weather File.bin"
+        )
+        result_cache.close()
+
+        result_cache = ResultCache(cache_path, "fingerprint 2")
+        self.assertEqual(result_cache.get_results([(2201005, "System 1", "")]), {})
+        result_cache.close()
+
+    def test_repeat_run_makes_no_dll_calls(self):
+        requests = {
+            "Outside Air Ratio": (2201005, "System 1", ""),
+            "Cooling Capacity": (2201006, "System 1", ""),
+            "Monthly Values": (2305001, "", ""),
+        }
+        first_output = Base.get_output_data(self.create_rmd(), requests)
+        first_string = Base.get_single_string_output(self.create_rmd(), 1101006)
+        self.assertEqual(CountingResultReader.calls, 2)
+
+        second_output = Base.get_output_data(self.create_rmd(), requests)
+        second_string = Base.get_single_string_output(self.create_rmd(), 1101006)
+
+        self.assertEqual(CountingResultReader.calls, 2)
+        self.assertDictEqual(first_output, second_output)
+        self.assertDictEqual(
+            second_output, {"Outside Air Ratio": 5.0, "Cooling Capacity": 6.0}
+        )
+        self.assertEqual(first_string, second_string)
+
+
+if __name__ == "__main__":
+    unittest.main()
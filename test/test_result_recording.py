@@ -0,0 +1,130 @@
+import os
+import tempfile
+import unittest
+from functools import partial
+
+from rpd_generator.artifacts.ruleset_model_description import RulesetModelDescription
+from rpd_generator.bdl_structure.base_node import Base
+from rpd_generator.doe2_file_readers import model_output_reader
+from rpd_generator.doe2_file_readers import result_recording
+from .result_reader_helpers import StandInResultReader
+
+
+# NHRList entries and values of the stand-in result reader
+NHR_DICT = {2201005: 1, 2201006: 1, 2315003: 1, 2305001: 12}
+VALUES = {
+    (2201005, "System 1", ""): 5.0,
+    (2201006, "System 1", ""): 6.0,
+}
+
+
+class TestResultRecording(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.project_fname = os.path.join(self.temp_dir.name, "Test Project")
+        self.requests = {
+            "Outside Air Ratio": (2201005, "System 1", ""),
+            "Cooling Capacity": (2201006, "System 1", ""),
+        }
+
+    def tearDown(self):
+        model_output_reader.set_result_reader_factory(None)
+        self.temp_dir.cleanup()
+
+    def create_rmd(self, project_fname):
+        rmd = RulesetModelDescription("Test RMD")
+        rmd.doe2_data_path = "DOE-2 Data"
+        rmd.file_path = project_fname
+        return rmd
+
+    def record(self, project_fnames=None):
+        result_recording.start_recording(
+            partial(
+                StandInResultReader,
+                nhr_dict=NHR_DICT,
+                values=VALUES,
+                string_result="Weather File.bin",
+            ),
+            self.temp_dir.name,
+        )
+        for project_fname in project_fnames or [self.project_fname]:
+            rmd = self.create_rmd(project_fname)
+            output_data = Base.get_output_data(rmd, self.requests)
+            string_output = Base.get_single_string_output(rmd, 1101006)
+        return output_data, string_output, result_recording.save_recordings()
+
+    def test_replay_matches_recorded_run(self):
+        recorded_output, recorded_string, recording_paths = self.record()
+        self.assertEqual(recording_paths, [self.project_fname + ".d2rrec"])
+
+        # Replay works without the recorded backend and from a different directory
+        result_recording.start_replay(recording_paths, "elsewhere")
+        rmd = self.create_rmd(os.path.join("elsewhere", "Test Project"))
+
+        self.assertDictEqual(Base.get_output_data(rmd, self.requests), recorded_output)
+        self.assertEqual(Base.get_single_string_output(rmd, 1101006), recorded_string)
+
+    def test_unrecorded_requests_have_no_value(self):
+        _, _, recording_paths = self.record()
+        result_recording.start_replay(recording_paths, self.temp_dir.name)
+        rmd = self.create_rmd(self.project_fname)
+
+        reader = Base.get_result_reader(rmd)
+        self.assertEqual(
+            reader.get_multiple_results(
+                self.project_fname, [(2201005, "System 2", "")]
+            ),
+            [-99999.0],
+        )
+        with self.assertRaisesRegex(FileNotFoundError, "Other Project"):
+            reader.get_multiple_results(
+                os.path.join(self.temp_dir.name, "Other Project"),
+                [(2201005, "System 1", "")],
+            )
+
+    def test_projects_with_the_same_name_have_their_own_recordings(self):
+        project_fnames = [
+            os.path.join(self.temp_dir.name, directory, "Test Project")
+            for directory in ["A", "B"]
+        ]
+        for project_fname in project_fnames:
+            os.mkdir(os.path.dirname(project_fname))
+        _, _, recording_paths = self.record(project_fnames)
+
+        self.assertEqual(
+            [
+                result_recording.ResultRecording.load(path).project_name
+                for path in recording_paths
+            ],
+            ["A/Test Project", "B/Test Project"],
+        )
+        result_recording.start_replay(recording_paths, "elsewhere")
+        reader = Base.get_result_reader(self.create_rmd("elsewhere"))
+        self.assertIs(
+            reader.get_recording(os.path.join("elsewhere", "B", "Test Project")),
+            reader.recordings["B/Test Project"],
+        )
+        with self.assertRaises(FileNotFoundError):
+            reader.get_recording(os.path.join("elsewhere", "C", "Test Project"))
+
+        # Recordings of the same project cannot be replayed together
+        with self.assertRaises(ValueError):
+            result_recording.start_replay(recording_paths * 2)
+
+    def test_multiple_value_results_round_trip(self):
+        recording = result_recording.ResultRecording("Test Project")
+        recording.add_results(
+            NHR_DICT,
+            [(2305001, "", ""), (2201005, "System 1", "")],
+            [1.0] * 12 + [5.0],
+        )
+        recording_path = self.project_fname + ".d2rrec"
+        recording.save(recording_path)
+
+        loaded_recording = result_recording.ResultRecording.load(recording_path)
+        self.assertEqual(loaded_recording.nhr_dict, {2201005: 1, 2305001: 12})
+        self.assertEqual(loaded_recording.results, recording.results)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,4 +1,8 @@
+import json
+import os
+import tempfile
 import unittest
+import xml.etree.ElementTree as ET
 from .full_rpd_test import run_full_rpd_tests as rpd_tests
 
 
@@ -623,3 +627,88 @@ class TestRunFullRPDTests(unittest.TestCase):
             },
             object_id_map,
         )
+
+    def test_find_aligned_value_matches_filtered_query(self):
+        reference_index = rpd_tests.build_id_index(self.reference_json)
+        surface_path = "$.ruleset_model_descriptions[0].buildings[0].building_segments[0].zones[*].surfaces[*]"
+
+        for json_key_path in [
+            f"{surface_path}.azimuth",
+            f'{surface_path}[?(@.adjacent_to = "EXTERIOR")].area',
+            f'{surface_path}[?(@.adjacent_to = "INTERIOR")].area',
+        ]:
+            for surface_id in [
+                "Zone 1 Exterior Wall 1",
+                "Zone 5 Interior Wall 1",
+                "Missing Surface",
+            ]:
+                with self.subTest(json_key_path=json_key_path, surface_id=surface_id):
+                    if "[?(@" in json_key_path:
+                        filtered_path = json_key_path.replace(
+                            "surfaces[*][?(", f'surfaces[*][?(@.id="{surface_id}" and '
+                        )
+                    else:
+                        filtered_path = json_key_path.replace(
+                            "surfaces[*]", f'surfaces[*][?(@.id="{surface_id}")]'
+                        )
+                    self.assertEqual(
+                        rpd_tests.find_one(filtered_path, self.reference_json),
+                        rpd_tests.find_aligned_value(
+                            json_key_path, "surfaces", surface_id, reference_index
+                        ),
+                    )
+
+        zone_1, parent_zone = rpd_tests.find_indexed_objects(
+            reference_index,
+            "$.ruleset_model_descriptions[0].buildings[0].building_segments[0].zones[*]",
+            "Zone 1",
+        )[0]
+        self.assertEqual("Zone 1", zone_1["id"])
+        self.assertEqual("Default Building Segment", parent_zone["id"])
+
+    def test_write_summaries(self):
+        results = [
+            {
+                "test": "E-1",
+                "warnings": ["Missing key u_factor"],
+                "errors": [],
+                "wall_time": 0.5,
+            },
+            {
+                "test": "E-2",
+                "warnings": [],
+                "errors": ["Value mismatch at 'Zone 1'", "Value mismatch at 'Zone 2'"],
+                "wall_time": 0.25,
+            },
+        ]
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            summary_json_file = os.path.join(temp_dir, "summary.json")
+            junit_xml_file = os.path.join(temp_dir, "summary.xml")
+            rpd_tests.write_summary_json(results, 0.75, summary_json_file)
+            rpd_tests.write_junit_xml(results, 0.75, junit_xml_file)
+
+            with open(summary_json_file) as file:
+                summary = json.load(file)
+            test_suite = ET.parse(junit_xml_file).getroot()
+
+        self.assertEqual(
+            (2, 1, 2, 1),
+            tuple(
+                summary[key] for key in ["test_cases", "failed", "errors", "warnings"]
+            ),
+        )
+        self.assertEqual(
+            ["E-1", "E-2"], [result["test"] for result in summary["results"]]
+        )
+        self.assertEqual("1", test_suite.get("failures"))
+        test_cases = test_suite.findall("testcase")
+        self.assertEqual(
+            ["E-1", "E-2"], [test_case.get("name") for test_case in test_cases]
+        )
+        self.assertIsNone(test_cases[0].find("failure"))
+        self.assertEqual("0.250", test_cases[1].get("time"))
+        self.assertEqual(
+            "Value mismatch at 'Zone 1'\nValue mismatch at 'Zone 2'",
+            test_cases[1].find("failure").text,
+        )
@@ -0,0 +1,134 @@
+import threading
+import time
+import unittest
+
+from rpd_generator.artifacts.ruleset_model_description import RulesetModelDescription
+from rpd_generator.bdl_structure.bdl_commands.schedule import (
+    LAST_DAY,
+    DaySchedulePD,
+    Schedule,
+    WeekSchedulePD,
+    intern_schedule_values,
+)
+from rpd_generator.bdl_structure.bdl_enumerations.bdl_enums import BDLEnums
+from rpd_generator.utilities import schedule_funcs
+
+BDL_ScheduleTypes = BDLEnums.bdl_enums["ScheduleTypes"]
+BDL_DayScheduleKeywords = BDLEnums.bdl_enums["DayScheduleKeywords"]
+BDL_WeekScheduleKeywords = BDLEnums.bdl_enums["WeekScheduleKeywords"]
+BDL_ScheduleKeywords = BDLEnums.bdl_enums["ScheduleKeywords"]
+
+
+def get_week_schedule_indices(schedule_change_indices, num_days):
+    # Week schedule index of each day, selected one day at a time as the schedules were expanded originally
+    wk_sch_index = 0
+    wk_sch_indices = []
+    for day_index in range(num_days):
+        if day_index in schedule_change_indices and day_index != LAST_DAY:
+            wk_sch_index += 1
+        wk_sch_indices.append(wk_sch_index)
+    return wk_sch_indices
+
+
+class TestScheduleCalendar(unittest.TestCase):
+    def setUp(self):
+        self.annual_calendar = Schedule.annual_calendar
+        self.calendar = schedule_funcs.generate_year_calendar(2021, "FRIDAY")
+        Schedule.set_annual_calendar(self.calendar)
+        self.schedule = Schedule("Test Schedule", RulesetModelDescription("Test RMD"))
+
+    def tearDown(self):
+        Schedule.set_annual_calendar(self.annual_calendar)
+
+    def test_compile_calendar(self):
+        day_type_indices, date_ordinals = schedule_funcs.compile_calendar(self.calendar)
+
+        self.assertEqual(len(day_type_indices), 365)
+        self.assertEqual(
+            list(day_type_indices),
+            [day_type - 1 for day_type in self.calendar.values()],
+        )
+        self.assertEqual(date_ordinals["1/1"], 0)
+        self.assertEqual(date_ordinals["3/1"], 59)
+        self.assertEqual(date_ordinals["12/31"], LAST_DAY)
+
+    def test_week_schedule_ranges_match_daily_selection(self):
+        for schedule_change_indices in [
+            {LAST_DAY + 1},
+            {LAST_DAY},
+            {90, LAST_DAY + 1},
+            {32, 181, 304, LAST_DAY + 1},
+            {1, 2, LAST_DAY + 1},
+        ]:
+            with self.subTest(schedule_change_indices=schedule_change_indices):
+                ranges = self.schedule.get_week_schedule_ranges(schedule_change_indices)
+
+                wk_sch_indices = []
+                for wk_sch_index, start, end in ranges:
+                    self.assertEqual(len(wk_sch_indices), start)
+                    wk_sch_indices.extend([wk_sch_index] * (end - start))
+                self.assertEqual(
+                    wk_sch_indices,
+                    get_week_schedule_indices(schedule_change_indices, 365),
+                )
+
+    def test_equivalent_schedules_share_hourly_values(self):
+        rmd = self.schedule.rmd
+        schedules = []
+        for i in range(2):
+            day_schedule = DaySchedulePD(f"Day {i}", rmd)
+            day_schedule.keyword_value_pairs = {
+                BDL_DayScheduleKeywords.TYPE: BDL_ScheduleTypes.FRACTION,
+                BDL_DayScheduleKeywords.VALUES: ["0"] * 8 + ["1"] * 16,
+            }
+            week_schedule = WeekSchedulePD(f"Week {i}", rmd)
+            week_schedule.keyword_value_pairs = {
+                BDL_WeekScheduleKeywords.TYPE: BDL_ScheduleTypes.FRACTION,
+                BDL_WeekScheduleKeywords.DAY_SCHEDULES: [f"Day {i}"] * 12,
+            }
+            schedule = Schedule(f"Schedule {i}", rmd)
+            schedule.keyword_value_pairs = {
+                BDL_ScheduleKeywords.TYPE: BDL_ScheduleTypes.FRACTION,
+                BDL_ScheduleKeywords.MONTH: "12",
+                BDL_ScheduleKeywords.DAY: "31",
+                BDL_ScheduleKeywords.WEEK_SCHEDULES: f"Week {i}",
+            }
+            for obj in [day_schedule, week_schedule, schedule]:
+                rmd.bdl_obj_instances[obj.u_name] = obj
+                obj.populate_data_elements()
+            schedules.append(schedule)
+
+        self.assertIs(schedules[0].hourly_values, schedules[1].hourly_values)
+        self.assertEqual(
+            list(schedules[1].hourly_values), ([0.0] * 8 + [1.0] * 16) * 365
+        )
+
+    def test_intern_schedule_values_from_several_threads(self):
+        rmd = RulesetModelDescription("Test RMD")
+        expanded = []
+        results = []
+
+        def expand():
+            expanded.append(None)
+            time.sleep(0.01)
+            return [1.0] * 24
+
+        threads = [
+            threading.Thread(
+                target=lambda: results.append(
+                    intern_schedule_values(rmd, ("DAY-SCHEDULE-PD", 1.0), expand)
+                )
+            )
+            for _ in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(expanded), 1)
+        self.assertTrue(all(result is results[0] for result in results))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,85 @@
+import json
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from rpd_generator.config import Config
+from rpd_generator.schema import schema_enums
+from rpd_generator.schema.schema_enums import SchemaEnums
+
+
+class TestSchemaEnums(unittest.TestCase):
+    def test_prebuilt_cache_matches_schema_files(self):
+        ruleset = Config.ACTIVE_RULESET
+        with open(schema_enums.get_schema_enums_cache_path(ruleset)) as json_file:
+            cache = json.load(json_file)
+
+        self.assertEqual(
+            schema_enums.get_schema_hashes(ruleset), cache["schema_hashes"]
+        )
+        self.assertEqual(
+            schema_enums.scan_schema_enum_lists(ruleset), cache["schema_enums"]
+        )
+
+    def test_enums_are_loaded_on_first_use(self):
+        with mock.patch.object(
+            schema_enums, "load_schema_enum_lists", return_value={"Test": ["A", "B"]}
+        ) as load_schema_enum_lists:
+            SchemaEnums.update_schema_enum(Config.ACTIVE_RULESET)
+            load_schema_enum_lists.assert_not_called()
+
+            self.assertEqual("B", SchemaEnums.schema_enums["Test"].B)
+            self.assertEqual(["Test"], list(SchemaEnums.schema_enums))
+            load_schema_enum_lists.assert_called_once()
+
+        SchemaEnums.update_schema_enum(Config.ACTIVE_RULESET)
+
+    def test_cache_is_rebuilt_when_schema_files_change(self):
+        ruleset = Config.ACTIVE_RULESET
+        with tempfile.TemporaryDirectory() as temp_dir:
+            prebuilt_cache_path = os.path.join(temp_dir, "prebuilt_schema_enums.json")
+            with open(prebuilt_cache_path, "w") as json_file:
+                json.dump(
+                    {"schema_hashes": {}, "schema_enums": {"Test": ["A"]}}, json_file
+                )
+            user_cache_path = Path(temp_dir) / "rpd_generator" / "schema_enums.json"
+
+            with mock.patch.object(
+                schema_enums,
+                "get_schema_enums_cache_path",
+                return_value=prebuilt_cache_path,
+            ), mock.patch.object(
+                schema_enums,
+                "get_user_schema_enums_cache_path",
+                return_value=user_cache_path,
+            ):
+                enum_lists = schema_enums.load_schema_enum_lists(ruleset)
+                with open(user_cache_path) as json_file:
+                    cache = json.load(json_file)
+
+                # The rebuilt enumerations are read from the user's cache from now on
+                with mock.patch.object(
+                    schema_enums, "scan_schema_enum_lists"
+                ) as scan_schema_enum_lists:
+                    self.assertEqual(
+                        enum_lists, schema_enums.load_schema_enum_lists(ruleset)
+                    )
+                    scan_schema_enum_lists.assert_not_called()
+
+            # The prebuilt cache in the package is never rewritten at runtime
+            with open(prebuilt_cache_path) as json_file:
+                self.assertEqual({"Test": ["A"]}, json.load(json_file)["schema_enums"])
+            self.assertEqual(["schema_enums.json"], os.listdir(user_cache_path.parent))
+
+        self.assertIn("EnergySourceOptions", enum_lists)
+        self.assertNotIn("Test", enum_lists)
+        self.assertEqual(
+            schema_enums.get_schema_hashes(ruleset), cache["schema_hashes"]
+        )
+        self.assertEqual(enum_lists, cache["schema_enums"])
+
+
+if __name__ == "__main__":
+    unittest.main()
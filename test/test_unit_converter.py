@@ -0,0 +1,84 @@
+import unittest
+
+from rpd_generator.bdl_structure.base_node import BaseNode
+from rpd_generator.utilities import unit_converter
+
+
+class TestUnitConverter(unittest.TestCase):
+    def test_conversion_factors_match_unit_registry(self):
+        ureg = unit_converter.get_unit_registry()
+        for from_units, to_units in [
+            ("btu_h", "W"),
+            ("cfm", "m^3/s"),
+            ("ft^2 * delta_F / btu_h", "K*m^2/W"),
+            ("in_WC", "Pa"),
+        ]:
+            for value in [0.0, 1.0, 3.7, -1250.5]:
+                self.assertEqual(
+                    (value * ureg(from_units)).to(to_units).magnitude,
+                    unit_converter.convert_value(value, from_units, to_units),
+                )
+
+    def test_offset_units(self):
+        scale, offset = unit_converter.get_conversion_factors("F", "C")
+        self.assertAlmostEqual(5 / 9, scale, places=15)
+        self.assertAlmostEqual(-160 / 9, offset, places=12)
+        self.assertAlmostEqual(
+            21.111111111111111, unit_converter.convert_value(70.0, "F", "C")
+        )
+        self.assertAlmostEqual(-40.0, unit_converter.convert_value(-40.0, "F", "C"))
+
+    def test_convert_to_schema_units(self):
+        loop = {
+            "id": "Loop",
+            "child_loops": [
+                {
+                    "id": "Child Loop",
+                    "cooling_or_condensing_design_and_control": {
+                        "design_supply_temperature": 44.0
+                    },
+                }
+            ],
+        }
+        zone = {
+            "id": "Zone",
+            "volume": 1000.0,
+            "design_thermostat_cooling_setpoint": 75,
+        }
+        rpd = {
+            "ruleset_model_descriptions": [
+                {
+                    "fluid_loops": [loop],
+                    "buildings": [
+                        {
+                            "building_segments": [
+                                # The same zone object is only converted once
+                                {"zones": [zone, zone]}
+                            ]
+                        }
+                    ],
+                }
+            ]
+        }
+
+        unit_converter.convert_to_schema_units(rpd)
+
+        self.assertAlmostEqual(
+            6.666666666666667,
+            loop["child_loops"][0]["cooling_or_condensing_design_and_control"][
+                "design_supply_temperature"
+            ],
+        )
+        self.assertAlmostEqual(28.316846592, zone["volume"])
+        self.assertAlmostEqual(
+            23.888888888888889, zone["design_thermostat_cooling_setpoint"]
+        )
+
+    def test_try_convert_units(self):
+        self.assertEqual(2.5, BaseNode.try_convert_units(2500000, "Btu/hr", "MMBtu/hr"))
+        self.assertIsNone(BaseNode.try_convert_units(1.0, "ft", "W"))
+        self.assertIsNone(BaseNode.try_convert_units("1.0", "ft", "m"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,81 @@
+import copy
+import json
+import os
+import unittest
+
+from rpd_generator.config import Config
+from rpd_generator.schema import validate
+from rpd_generator.schema.ruleset import Ruleset
+
+
+class TestValidate(unittest.TestCase):
+    def setUp(self):
+        rpd_file = os.path.join(
+            os.path.dirname(os.path.abspath(__file__)),
+            "full_rpd_test",
+            "Correct Answer RPDs",
+            "E-1.json",
+        )
+        with open(rpd_file) as json_file:
+            self.rpd = json.load(json_file)
+        self.rmd = self.rpd["ruleset_model_descriptions"][0]
+        self.zones = self.rmd["buildings"][0]["building_segments"][0]["zones"]
+
+    def test_schema_validator_is_created_once_per_ruleset(self):
+        validator = validate.get_schema_validator()
+        self.assertIs(validator, validate.get_schema_validator())
+
+        other_ruleset = Ruleset(
+            "Test Ruleset",
+            "Enumerations2019T24.schema.json",
+            Config.ACTIVE_RULESET.output_schema_filename,
+        )
+        self.assertIsNot(validator, validate.get_schema_validator(other_ruleset))
+        self.assertIsNot(validator, validate.get_schema_validator())
+
+    def test_schema_validation_errors(self):
+        self.assertEqual(
+            {"passed": True, "error": None}, validate.schema_validate_rmd(self.rpd)
+        )
+
+        self.rmd["buildings"][0]["id"] = 3
+        self.zones[0]["volume"] = "x"
+        self.assertEqual(
+            {"passed": False, "error": "schema invalid: 3 is not of type 'string'"},
+            validate.schema_validate_rmd(self.rpd),
+        )
+        self.assertEqual(
+            {
+                "passed": False,
+                "error": "schema invalid: $.ruleset_model_descriptions[0].buildings[0].id: 3 is not of type 'string'; "
+                "$.ruleset_model_descriptions[0].buildings[0].building_segments[0].zones[0].volume: 'x' is not of "
+                "type 'number'",
+            },
+            validate.schema_validate_rmd(self.rpd, max_errors=None),
+        )
+
+    def test_mismatched_references_and_non_unique_ids(self):
+        terminal = self.zones[0]["terminals"][0]
+        terminal["served_by_heating_ventilating_air_conditioning_system"] = "Missing"
+        self.zones[1]["surfaces"][0]["adjacent_zone"] = "Missing Zone"
+        self.zones.append(copy.deepcopy(self.zones[0]))
+        self.rmd["pumps"] = [{"id": "Pump", "loop_or_piping": "Missing Loop"}]
+
+        id_sets, references, list_ids = validate.collect_ids_and_references(self.rpd)
+
+        self.assertEqual(
+            ["Missing", "Missing"],
+            validate.get_mismatched_references(id_sets, references, "hvac"),
+        )
+        self.assertEqual(
+            ["Missing Zone"],
+            validate.get_mismatched_references(id_sets, references, "zone"),
+        )
+        self.assertEqual(
+            ["Missing Loop"], validate.check_fluid_loop_or_piping_association(self.rpd)
+        )
+        non_unique_id_error = validate.get_non_unique_id_error(list_ids)
+        self.assertIn(
+            "ruleset_model_descriptions[0].buildings[*].building_segments[*].zones",
+            non_unique_id_error.split(": ", 1)[1].split("; "),
+        )
@@ -0,0 +1,205 @@
+import copy
+import json
+import random
+import unittest
+from pathlib import Path
+
+from rpd_generator.schema import validate
+from rpd_generator.utilities.jsonpath_utils import find_all, find_all_by_jsonpaths
+
+TEST_DIRECTORY = Path(__file__).parent / "full_rpd_test"
+
+# Check functions with the name of the check each one runs in validate.REFERENCE_CHECKS
+CHECK_FUNCTIONS = {
+    "hvac": validate.check_hvac_association,
+    "zone": validate.check_zone_association,
+    "fluid_loop": validate.check_fluid_loop_association,
+    "schedule": validate.check_schedule_association,
+    "fluid_loop_or_piping": validate.check_fluid_loop_or_piping_association,
+    "service_water_heating": validate.check_service_water_heating_association,
+}
+
+
+def check_association_reference(rpd: dict, check: str) -> list:
+    """Implementation that each check_*_association() function had before the single walk, kept to check that the
+    mismatched references are unchanged"""
+    mismatch_list = []
+    id_jsonpaths, reference_jsonpaths = validate.REFERENCE_CHECKS[check]
+    id_list = find_all_by_jsonpaths(id_jsonpaths, rpd)
+    referenced_id_list = find_all_by_jsonpaths(reference_jsonpaths, rpd)
+    for referenced_id in referenced_id_list:
+        if referenced_id not in id_list:
+            mismatch_list.append(referenced_id)
+    return mismatch_list
+
+
+def check_unique_ids_reference(rmd: dict) -> str:
+    """Implementation that check_unique_ids_in_ruleset_model_descriptions() had before the single walk"""
+    ruleset_model_descriptions = rmd.get("ruleset_model_descriptions", [])
+
+    bad_paths = []
+    for rmd_index, rmd in enumerate(ruleset_model_descriptions):
+        paths = json_paths_to_lists_reference(rmd)
+
+        for list_path in paths:
+            ids = find_all(list_path + "[*].id", rmd)
+            if len(ids) != len(set(ids)):
+                bad_path = f"ruleset_model_descriptions[{rmd_index}]{list_path[1:]}"
+                bad_paths.append(bad_path)
+
+    error_msg = f"Non-unique ids for paths: {'; '.join(bad_paths)}" if bad_paths else ""
+
+    return error_msg
+
+
+def json_paths_to_lists_reference(val: dict | list, path="$") -> set:
+    paths = set()
+    if isinstance(val, dict):
+        for key, value in val.items():
+            paths = paths.union(json_paths_to_lists_reference(value, f"{path}.{key}"))
+    elif isinstance(val, list):
+        paths = {path}
+        for item in val:
+            paths = paths.union(json_paths_to_lists_reference(item, f"{path}[*]"))
+    return paths
+
+
+def get_bad_paths(error_msg: str) -> set:
+    # The previous implementation listed the paths in the order of an unordered set
+    return set(error_msg.removeprefix("Non-unique ids for paths: ").split("; "))
+
+
+class TestValidateReferences(unittest.TestCase):
+    def setUp(self):
+        with open(TEST_DIRECTORY / "Correct Answer RPDs" / "E-2.json") as json_file:
+            self.rpd = json.load(json_file)
+        self.rmd = self.rpd["ruleset_model_descriptions"][0]
+        self.zones = self.rmd["buildings"][0]["building_segments"][0]["zones"]
+
+    def assert_same_as_reference(self, rpd):
+        for check, check_function in CHECK_FUNCTIONS.items():
+            with self.subTest(check=check):
+                self.assertEqual(
+                    check_association_reference(rpd, check), check_function(rpd)
+                )
+        self.assertEqual(
+            get_bad_paths(check_unique_ids_reference(rpd)),
+            get_bad_paths(validate.check_unique_ids_in_ruleset_model_descriptions(rpd)),
+        )
+
+    def test_correct_answer_rpd(self):
+        self.assert_same_as_reference(self.rpd)
+
+    def test_dangling_references_are_reported_in_order(self):
+        # References of the same check at several paths and several places in the document
+        self.zones[1]["surfaces"][0]["adjacent_zone"] = "Missing Zone 2"
+        self.zones[0]["surfaces"][0]["adjacent_zone"] = "Missing Zone 1"
+        self.zones[0]["transfer_airflow_source_zone"] = "Missing Zone 3"
+        self.zones[0]["thermostat_cooling_setpoint_schedule"] = "Missing Schedule"
+        self.zones[0]["terminals"][0]["heating_from_loop"] = "Missing Loop"
+        self.rmd["pumps"][0]["loop_or_piping"] = "Missing Piping"
+        self.zones[0]["terminals"][0][
+            "served_by_heating_ventilating_air_conditioning_system"
+        ] = "Missing System"
+
+        self.assert_same_as_reference(self.rpd)
+        self.assertEqual(
+            ["Missing Zone 1", "Missing Zone 2", "Missing Zone 3"],
+            validate.check_zone_association(self.rpd),
+        )
+
+    def test_non_unique_ids_in_nested_lists(self):
+        spaces = [zone["spaces"][0] for zone in self.zones[:2]]
+        # Spaces of different zones are in the same list path
+        spaces[1]["id"] = spaces[0]["id"]
+        self.zones[2]["surfaces"].append(copy.deepcopy(self.zones[2]["surfaces"][0]))
+        self.rmd["schedules"][1]["id"] = self.rmd["schedules"][0]["id"]
+
+        self.assert_same_as_reference(self.rpd)
+        self.assertEqual(
+            {
+                "ruleset_model_descriptions[0].buildings[*].building_segments[*].zones[*].spaces",
+                "ruleset_model_descriptions[0].buildings[*].building_segments[*].zones[*].surfaces",
+                "ruleset_model_descriptions[0].buildings[*].building_segments[*].zones[*].surfaces[*].construction"
+                ".primary_layers",
+                "ruleset_model_descriptions[0].schedules",
+            },
+            get_bad_paths(
+                validate.check_unique_ids_in_ruleset_model_descriptions(self.rpd)
+            ),
+        )
+
+    def test_non_str_ids_and_references(self):
+        self.zones[0]["id"] = 1
+        self.zones[1]["id"] = 2.0
+        self.zones[2]["id"] = None
+        surfaces = self.zones[0]["surfaces"]
+        # Numbers that are equal match whatever their type, as they did before
+        surfaces[0]["adjacent_zone"] = 1.0
+        surfaces[1]["adjacent_zone"] = 2
+        surfaces[2]["adjacent_zone"] = None
+        self.zones[1]["surfaces"][0]["adjacent_zone"] = "1"
+        # Unhashable references never match
+        self.zones[1]["surfaces"][1]["adjacent_zone"] = ["Missing Zone"]
+        self.zones[1]["transfer_airflow_source_zone"] = {"id": "Missing Zone"}
+
+        self.assert_same_as_reference(self.rpd)
+        mismatched_references = validate.check_zone_association(self.rpd)
+        self.assertEqual(
+            ["1", ["Missing Zone"], {"id": "Missing Zone"}],
+            [
+                reference
+                for reference in mismatched_references
+                if not isinstance(reference, str) or reference == "1"
+            ],
+        )
+
+    def test_unhashable_ids(self):
+        self.zones[0]["id"] = ["Zone"]
+
+        # Unhashable ids raise the same error as before in the unique id check, and never match a reference
+        with self.assertRaises(TypeError):
+            check_unique_ids_reference(self.rpd)
+        with self.assertRaises(TypeError):
+            validate.check_unique_ids_in_ruleset_model_descriptions(self.rpd)
+        self.zones[0]["surfaces"][0]["adjacent_zone"] = "Zone"
+        self.assertEqual(
+            check_association_reference(self.rpd, "zone"),
+            validate.check_zone_association(self.rpd),
+        )
+
+    def test_randomly_corrupted_rpds(self):
+        # (object, key) of every id and reference in the RPD
+        fields = []
+        reference_keys = {
+            jsonpath.rsplit(".", 1)[-1]
+            for _, reference_jsonpaths in validate.REFERENCE_CHECKS.values()
+            for jsonpath in reference_jsonpaths
+        }
+        nodes = [self.rpd]
+        while nodes:
+            node = nodes.pop()
+            items = node.items() if isinstance(node, dict) else enumerate(node)
+            for key, value in items:
+                if isinstance(value, (dict, list)):
+                    nodes.append(value)
+                elif isinstance(node, dict) and (key == "id" or key in reference_keys):
+                    fields.append((node, key))
+        replacement_values = [node[key] for node, key in fields] + ["Missing", None]
+
+        randomizer = random.Random(229)
+        for i in range(20):
+            corrupted_fields = randomizer.sample(range(len(fields)), 5)
+            original_values = [fields[j][0][fields[j][1]] for j in corrupted_fields]
+            for j in corrupted_fields:
+                node, key = fields[j]
+                node[key] = randomizer.choice(replacement_values)
+            with self.subTest(copy=i):
+                self.assert_same_as_reference(self.rpd)
+            for j, value in zip(corrupted_fields, original_values):
+                node, key = fields[j]
+                node[key] = value
+
+
+if __name__ == "__main__":
+    unittest.main()